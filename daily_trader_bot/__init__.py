@@ -2,10 +2,29 @@
 Daily Trader Bot - AI-Assisted Trading Bot for Following Daily Trends
 """
 
+import importlib
+
 __version__ = "0.1.0"
 
-from .brokers.base import BaseBroker
-from .data_sources.base import BaseDataSource
-from .ai_providers.base import BaseAIProvider
+# The base classes are imported on first access, so lightweight utilities
+# (e.g. DataStore, Config) can be used without loading pandas
+_LAZY_EXPORTS = {
+    "BaseBroker": ".brokers.base",
+    "BaseDataSource": ".data_sources.base",
+    "BaseAIProvider": ".ai_providers.base",
+}
 
 __all__ = ["BaseBroker", "BaseDataSource", "BaseAIProvider"]
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,6 +1,13 @@
 """AI provider implementations for market analysis and predictions."""
 
 from .base import BaseAIProvider
-from .openai_provider import OpenAIProvider
 
 __all__ = ["BaseAIProvider", "OpenAIProvider"]
+
+
+def __getattr__(name):
+    # Import OpenAIProvider on first use so offline runs skip loading it
+    if name == "OpenAIProvider":
+        from .openai_provider import OpenAIProvider
+        return OpenAIProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
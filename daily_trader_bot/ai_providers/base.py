@@ -6,7 +6,10 @@ enabling the bot to use different AI services for market analysis.
 """
 
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from functools import partial
 from typing import Dict, List, Optional
+import asyncio
 import pandas as pd
 
 
@@ -81,6 +84,44 @@ class BaseAIProvider(ABC):
         """
         pass
 
+    async def aanalyze_market_data(
+        self,
+        historical_data: pd.DataFrame,
+        additional_context: Optional[str] = None
+    ) -> Dict:
+        """
+        Async variant of analyze_market_data.
+        
+        The default implementation runs the synchronous method in the event
+        loop's executor. Providers with a native async client should override it.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(self.analyze_market_data, historical_data, additional_context)
+        )
+
+    async def agenerate_trading_signal(
+        self,
+        symbol: str,
+        historical_data: pd.DataFrame,
+        technical_indicators: Dict,
+        news_sentiment: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Async variant of generate_trading_signal.
+        
+        The default implementation runs the synchronous method in the event
+        loop's executor. Providers with a native async client should override it.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.generate_trading_signal,
+                symbol, historical_data, technical_indicators, news_sentiment
+            )
+        )
+
     @abstractmethod
     def explain_prediction(
         self,
@@ -116,3 +157,17 @@ class BaseAIProvider(ABC):
             String containing market trend summary
         """
         pass
+
+    @asynccontextmanager
+    async def async_session(self):
+        """
+        Scope for a batch of async calls on the running event loop.
+        
+        Providers with a native async client open it here, so its
+        connections never outlive the loop. The default does nothing.
+        """
+        yield
+
+    def close(self) -> None:
+        """Release network resources held by the provider (no-op by default)."""
+        pass
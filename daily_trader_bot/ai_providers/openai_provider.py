@@ -5,10 +5,173 @@ This module provides AI capabilities using OpenAI's API for sentiment analysis
 and market insights.
 """
 
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence
+import numpy as np
 import pandas as pd
 from ..ai_providers.base import BaseAIProvider
+import asyncio
+import hashlib
+import importlib.util
 import json
+import logging
+import random
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# (provider, AsyncOpenAI client) of the async session open in the current
+# context; see OpenAIProvider.async_session
+_async_session: ContextVar = ContextVar("openai_async_session", default=None)
+
+# System prompts are kept byte-identical across calls (and always sent first)
+# so that OpenAI's automatic prompt caching can reuse the prefix; all
+# per-call data goes into the user message.
+SENTIMENT_SYSTEM = (
+    "You are a financial sentiment analyzer. Analyze the sentiment of the given text "
+    "and return a JSON object with 'score' (between -1 and 1), 'label' "
+    "(positive/negative/neutral), and 'confidence' (between 0 and 1)."
+)
+ANALYSIS_SYSTEM = (
+    "You are a financial analyst. Analyze the market data and provide insights about "
+    "trends, patterns, and potential trading opportunities."
+)
+SIGNAL_SYSTEM = (
+    "You are a trading signal generator. Based on the provided data, generate a trading "
+    "signal. Return a JSON object with 'action' (buy/sell/hold), 'confidence' (0-1), "
+    "and 'reasoning'."
+)
+EXPLANATION_SYSTEM = (
+    "You are a financial analyst. Explain the price prediction in clear, understandable "
+    "terms for a trader."
+)
+SUMMARY_SYSTEM = (
+    "You are a market analyst. Provide a concise summary of market trends for the given "
+    "symbols."
+)
+# Shared system messages: the same dict (and string) objects go into every
+# request, only the user message is built per call.
+_SYS_SENTIMENT = {"role": "system", "content": SENTIMENT_SYSTEM}
+_SYS_ANALYSIS = {"role": "system", "content": ANALYSIS_SYSTEM}
+_SYS_SIGNAL = {"role": "system", "content": SIGNAL_SYSTEM}
+_SYS_EXPLANATION = {"role": "system", "content": EXPLANATION_SYSTEM}
+_SYS_SUMMARY = {"role": "system", "content": SUMMARY_SYSTEM}
+
+# User-message template for analyze_market_data
+_MARKET_SUMMARY_TEMPLATE = (
+    "Latest Close: ${latest_close:.2f}\n"
+    "Daily Change: {change_pct:.2f}%\n"
+    "Average Volume: {avg_volume:,.0f}\n"
+    "Latest Volume: {latest_volume:,.0f}\n"
+    "52-Week High: ${high:.2f}\n"
+    "52-Week Low: ${low:.2f}"
+)
+
+# Structured-output schemas: the API constrains decoding to these, so
+# responses always parse and no prose fallback is needed.
+SENTIMENT_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "sentiment",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "score": {"type": "number"},
+                "label": {"type": "string", "enum": ["positive", "negative", "neutral"]},
+                "confidence": {"type": "number"},
+            },
+            "required": ["score", "label", "confidence"],
+            "additionalProperties": False,
+        },
+    },
+}
+SIGNAL_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "trading_signal",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "action": {"type": "string", "enum": ["buy", "sell", "hold"]},
+                "confidence": {"type": "number"},
+                "reasoning": {"type": "string"},
+            },
+            "required": ["action", "confidence", "reasoning"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Models that predate structured outputs only support plain JSON mode
+_LEGACY_JSON_MODELS = ("gpt-3.5", "gpt-4-")
+
+NEUTRAL_SENTIMENT = {"score": 0.0, "label": "neutral", "confidence": 0.5}
+
+
+def _dumps(obj) -> str:
+    """Serialize obj to compact JSON for prompts (fewer tokens than indented)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _loads(text: str):
+    """Parse a JSON model response; raises json.JSONDecodeError on bad input."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+class _EmbeddingIndex:
+    """
+    Fixed-capacity store of (embedding, result) pairs for similarity lookups.
+    
+    Vectors are normalized on insert so a lookup is a single matrix-vector
+    product. Once full, the oldest entry is overwritten.
+    """
+
+    def __init__(self, max_entries: int, threshold: float):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._matrix = None
+        self._results = []
+        self._next = 0
+
+    def lookup(self, vector: np.ndarray) -> Optional[Dict]:
+        """Return the cached result most similar to vector, if above threshold."""
+        if not self._results:
+            return None
+        scores = self._matrix[:len(self._results)] @ vector
+        best = int(np.argmax(scores))
+        if scores[best] > self.threshold:
+            return self._results[best]
+        return None
+
+    def add(self, vector: np.ndarray, result: Dict) -> None:
+        """Store a result under its (normalized) embedding."""
+        if self._matrix is None:
+            self._matrix = np.empty((min(self.max_entries, 256), vector.shape[0]), dtype=np.float32)
+        elif self._next >= self._matrix.shape[0] and self._matrix.shape[0] < self.max_entries:
+            grown = np.empty((min(self.max_entries, self._matrix.shape[0] * 2), self._matrix.shape[1]), dtype=np.float32)
+            grown[:self._matrix.shape[0]] = self._matrix
+            self._matrix = grown
+        
+        idx = self._next % self.max_entries
+        self._matrix[idx] = vector
+        if idx < len(self._results):
+            self._results[idx] = result
+        else:
+            self._results.append(result)
+        self._next = idx + 1
 
 
 class OpenAIProvider(BaseAIProvider):
@@ -29,7 +192,9 @@ class OpenAIProvider(BaseAIProvider):
         super().__init__(config)
         
         try:
+            import httpx
             import openai
+            self.httpx = httpx
             self.openai = openai
         except ImportError:
             raise ImportError(
@@ -40,65 +205,402 @@ class OpenAIProvider(BaseAIProvider):
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
         
-        self.model = config.get("model", "gpt-3.5-turbo")
-        self.client = self.openai.OpenAI(api_key=self.api_key)
+        # Two model tiers: short structured answers (sentiment, signals) use
+        # sentiment_model; free-form analysis, explanations and summaries use
+        # analysis_model, which can be pointed at a larger model. Both default
+        # to the single 'model' setting.
+        self.model = config.get("model", "gpt-4o-mini")
+        self.sentiment_model = config.get("sentiment_model", self.model)
+        self.analysis_model = config.get("analysis_model", self.model)
+        self.max_concurrency = config.get("max_concurrency", 8)
+        
+        # One long-lived, keep-alive connection pool per client so parallel
+        # requests reuse TLS sessions; HTTP/2 multiplexing needs the h2 package
+        # (installed by httpx[http2]), plain HTTP/1.1 keep-alive is used without it.
+        pool_size = config.get("max_connections", 32)
+        limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size
+        )
+        http2 = importlib.util.find_spec("h2") is not None
+        timeout = config.get("timeout", 30.0)
+        # Retries are handled here (see _with_retry), not by the SDK
+        self.client = self.openai.OpenAI(
+            api_key=self.api_key,
+            max_retries=0,
+            http_client=httpx.Client(http2=http2, limits=limits, timeout=timeout)
+        )
+        # An async connection pool is bound to the event loop that opened its
+        # connections, so async clients are created per session (see
+        # async_session) rather than once here
+        self._async_http_options = {"http2": http2, "limits": limits, "timeout": timeout}
+        
+        # Transient failures (timeouts, connection errors, rate limits, 5xx)
+        # are retried with jittered exponential backoff. Async requests can
+        # additionally be hedged: if no answer arrives within hedge_after_s,
+        # a duplicate request is sent and whichever finishes first wins.
+        self.max_retries = config.get("max_retries", 2)
+        self.retry_initial_wait = config.get("retry_initial_wait", 0.5)
+        self.retry_max_wait = config.get("retry_max_wait", 4.0)
+        self.hedge_after_s = config.get("hedge_after_s")
+        self._retryable = (
+            self.openai.APIConnectionError,
+            self.openai.RateLimitError,
+            self.openai.InternalServerError,
+        )
+        
+        # Sentiment cache: exact text matches always, near-duplicates (by
+        # embedding similarity) only when enabled, since each miss then costs
+        # an extra embeddings request.
+        self._sentiment_cache = OrderedDict()
+        self._sentiment_cache_size = config.get("sentiment_cache_size", 4096)
+        self.embedding_model = config.get("embedding_model", "text-embedding-3-small")
+        self._semantic_index = None
+        if config.get("sentiment_semantic_cache", False):
+            self._semantic_index = _EmbeddingIndex(
+                max_entries=config.get("sentiment_semantic_cache_size", 10_000),
+                threshold=config.get("sentiment_similarity_threshold", 0.92)
+            )
 
-    def _call_api(self, messages: List[Dict], temperature: float = 0.7) -> str:
+    def close(self) -> None:
+        """Close the HTTP connection pool of the synchronous client."""
+        self.client.close()
+
+    def _new_async_client(self):
+        """Create an AsyncOpenAI client with its own connection pool."""
+        return self.openai.AsyncOpenAI(
+            api_key=self.api_key,
+            max_retries=0,
+            http_client=self.httpx.AsyncClient(**self._async_http_options)
+        )
+
+    @asynccontextmanager
+    async def async_session(self):
+        """
+        Share one AsyncOpenAI client between the async calls made inside the block.
+        
+        The client is created on the running event loop and closed when the
+        block exits. Tasks started inside the block use it too; async calls
+        made outside any session open a client of their own.
+        """
+        current = _async_session.get()
+        if current is not None and current[0] is self:
+            yield
+            return
+        async with self._new_async_client() as client:
+            token = _async_session.set((self, client))
+            try:
+                yield
+            finally:
+                _async_session.reset(token)
+
+    @staticmethod
+    def _log_usage(response) -> None:
+        """Log prompt token usage, including tokens served from the prompt cache."""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", 0) if details is not None else 0
+        logger.debug(
+            f"OpenAI usage: prompt_tokens={usage.prompt_tokens}, "
+            f"cached_tokens={cached or 0}, completion_tokens={usage.completion_tokens}"
+        )
+
+    def _backoff(self, attempt: int) -> float:
+        """Delay before retry number attempt (0-based), with jitter."""
+        delay = min(self.retry_max_wait, self.retry_initial_wait * 2 ** attempt)
+        return delay + random.uniform(0, self.retry_initial_wait)
+
+    def _with_retry(self, create, **kwargs):
+        """Call create(**kwargs), retrying transient API errors."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return create(**kwargs)
+            except self._retryable as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.debug(f"OpenAI request failed ({e}); retrying in {delay:.2f}s")
+                time.sleep(delay)
+
+    async def _awith_retry(self, create, **kwargs):
+        """Async counterpart of _with_retry."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await create(**kwargs)
+            except self._retryable as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.debug(f"OpenAI request failed ({e}); retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    async def _ahedged(self, create, **kwargs):
+        """Run a retried async request, hedging it after hedge_after_s seconds."""
+        if self.hedge_after_s is None:
+            return await self._awith_retry(create, **kwargs)
+        
+        first = asyncio.ensure_future(self._awith_retry(create, **kwargs))
+        done, _ = await asyncio.wait({first}, timeout=self.hedge_after_s)
+        if done:
+            return first.result()
+        
+        second = asyncio.ensure_future(self._awith_retry(create, **kwargs))
+        done, pending = await asyncio.wait({first, second}, return_when=asyncio.FIRST_COMPLETED)
+        winner = done.pop()
+        if winner.exception() is not None and pending:
+            # The other request may still succeed
+            return await pending.pop()
+        for task in pending:
+            task.cancel()
+        return winner.result()
+
+    @staticmethod
+    def _request_options(model: str, response_format: Optional[Dict]) -> Dict:
+        """Build optional request arguments, adapting response_format to the model."""
+        if response_format is None:
+            return {}
+        if model == "gpt-4" or model.startswith(_LEGACY_JSON_MODELS):
+            return {"response_format": {"type": "json_object"}}
+        return {"response_format": response_format}
+
+    def _call_api(
+        self,
+        messages: Sequence[Dict],
+        temperature: float = 0.7,
+        response_format: Optional[Dict] = None,
+        model: Optional[str] = None
+    ) -> str:
         """
         Internal method to call OpenAI API.
         
         Args:
             messages: List of message dictionaries
             temperature: Temperature for response generation
+            response_format: Optional structured output format
+            model: Model to use (defaults to the provider's model)
             
         Returns:
             String response from the API
         """
+        model = model or self.model
+        try:
+            response = self._with_retry(
+                self.client.chat.completions.create,
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                **self._request_options(model, response_format)
+            )
+            self._log_usage(response)
+            return response.choices[0].message.content
+        except Exception as e:
+            logger.warning(f"OpenAI request failed: {e}")
+            return f"Error calling OpenAI API: {str(e)}"
+
+    def _stream(
+        self,
+        messages: Sequence[Dict],
+        temperature: float = 0.7,
+        model: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream a chat completion, yielding text chunks as they arrive.
+        
+        Args:
+            messages: List of message dictionaries
+            temperature: Temperature for response generation
+            model: Model to use (defaults to the provider's model)
+            
+        Yields:
+            Pieces of the response text (an error message if the call fails)
+        """
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            stream = self._with_retry(
+                self.client.chat.completions.create,
+                model=model or self.model,
                 messages=messages,
-                temperature=temperature
+                temperature=temperature,
+                stream=True,
+                stream_options={"include_usage": True}
             )
+            for chunk in stream:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+                else:
+                    # The final chunk carries only the usage statistics
+                    self._log_usage(chunk)
+        except Exception as e:
+            logger.warning(f"OpenAI request failed: {e}")
+            yield f"Error calling OpenAI API: {str(e)}"
+
+    async def _call_api_async(
+        self,
+        messages: Sequence[Dict],
+        temperature: float = 0.7,
+        response_format: Optional[Dict] = None,
+        model: Optional[str] = None
+    ) -> str:
+        """
+        Async counterpart of _call_api using the session's AsyncOpenAI client.
+        
+        Args:
+            messages: List of message dictionaries
+            temperature: Temperature for response generation
+            response_format: Optional structured output format
+            model: Model to use (defaults to the provider's model)
+            
+        Returns:
+            String response from the API
+        """
+        model = model or self.model
+        try:
+            async with self.async_session():
+                response = await self._ahedged(
+                    _async_session.get()[1].chat.completions.create,
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    **self._request_options(model, response_format)
+                )
+            self._log_usage(response)
             return response.choices[0].message.content
         except Exception as e:
+            logger.warning(f"OpenAI request failed: {e}")
             return f"Error calling OpenAI API: {str(e)}"
 
+    async def abatch(self, list_of_messages: List[Sequence[Dict]], temperature: float = 0.7) -> List[str]:
+        """
+        Send several chat completions concurrently.
+        
+        At most ``max_concurrency`` requests are in flight at once.
+        
+        Args:
+            list_of_messages: One message list per request
+            temperature: Temperature for response generation
+            
+        Returns:
+            List of string responses, in the same order as the requests
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def call(messages: Sequence[Dict]) -> str:
+            async with semaphore:
+                return await self._call_api_async(messages, temperature)
+
+        async with self.async_session():
+            return await asyncio.gather(*[call(m) for m in list_of_messages])
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Return the normalized embedding of text, or None if unavailable."""
+        try:
+            response = self._with_retry(
+                self.client.embeddings.create, model=self.embedding_model, input=text
+            )
+        except Exception as e:
+            logger.debug(f"Embedding request failed: {e}")
+            return None
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else None
+
+    def _remember_sentiment(self, key: bytes, result: Dict) -> None:
+        """Insert into the exact-match sentiment cache, evicting the oldest entry."""
+        self._sentiment_cache[key] = result
+        self._sentiment_cache.move_to_end(key)
+        if len(self._sentiment_cache) > self._sentiment_cache_size:
+            self._sentiment_cache.popitem(last=False)
+
     def analyze_sentiment(self, text: str) -> Dict:
         """
         Analyze sentiment of text.
         
+        Results are cached by exact text and, when ``sentiment_semantic_cache``
+        is enabled, by embedding similarity to previously analyzed texts.
+        
         Args:
             text: Text to analyze
             
         Returns:
             Dictionary with sentiment analysis results
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a financial sentiment analyzer. Analyze the sentiment of the given text and return a JSON object with 'score' (between -1 and 1), 'label' (positive/negative/neutral), and 'confidence' (between 0 and 1)."
-            },
-            {
-                "role": "user",
-                "content": f"Analyze the sentiment of this text: {text}"
-            }
-        ]
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        cached = self._sentiment_cache.get(key)
+        if cached is not None:
+            self._sentiment_cache.move_to_end(key)
+            return dict(cached)
         
-        response = self._call_api(messages, temperature=0.3)
+        embedding = None
+        if self._semantic_index is not None:
+            embedding = self._embed(text)
+            if embedding is not None:
+                cached = self._semantic_index.lookup(embedding)
+                if cached is not None:
+                    self._remember_sentiment(key, cached)
+                    return dict(cached)
+        
+        messages = (
+            _SYS_SENTIMENT,
+            {"role": "user", "content": f"Analyze the sentiment of this text: {text}"},
+        )
+        
+        response = self._call_api(
+            messages, temperature=0.3, response_format=SENTIMENT_FORMAT, model=self.sentiment_model
+        )
         
         try:
-            # Try to parse JSON response
-            result = json.loads(response)
-            return result
+            result = _loads(response)
         except (json.JSONDecodeError, ValueError):
-            # Fallback if not valid JSON
-            if "positive" in response.lower():
-                return {"score": 0.5, "label": "positive", "confidence": 0.6}
-            elif "negative" in response.lower():
-                return {"score": -0.5, "label": "negative", "confidence": 0.6}
-            else:
-                return {"score": 0.0, "label": "neutral", "confidence": 0.5}
+            # Only API errors end up here; don't cache them
+            return dict(NEUTRAL_SENTIMENT)
+        
+        self._remember_sentiment(key, result)
+        if embedding is not None:
+            self._semantic_index.add(embedding, result)
+        return dict(result)
+
+    def _market_data_messages(
+        self,
+        historical_data: pd.DataFrame,
+        additional_context: Optional[str] = None
+    ) -> tuple:
+        """Build the prompt and summary statistics for analyze_market_data."""
+        # Prepare summary statistics on the raw arrays (avoids pandas dispatch
+        # for each scalar reduction)
+        close = historical_data['Close'].to_numpy()
+        volume = historical_data['Volume'].to_numpy()
+        
+        latest_close = close[-1]
+        prev_close = close[-2] if len(close) > 1 else latest_close
+        change_pct = ((latest_close - prev_close) / prev_close) * 100
+        
+        avg_volume = volume.mean()
+        latest_volume = volume[-1]
+        
+        summary = _MARKET_SUMMARY_TEMPLATE.format_map({
+            "latest_close": latest_close,
+            "change_pct": change_pct,
+            "avg_volume": avg_volume,
+            "latest_volume": latest_volume,
+            "high": close.max(),
+            "low": close.min()
+        })
+        if additional_context:
+            summary = "\n\n".join((summary, f"Additional Context: {additional_context}"))
+        
+        messages = (
+            _SYS_ANALYSIS,
+            {"role": "user", "content": f"Analyze this market data and provide insights:\n{summary}"},
+        )
+        
+        summary_stats = {
+            "latest_close": float(latest_close),
+            "change_pct": float(change_pct),
+            "avg_volume": float(avg_volume),
+            "latest_volume": int(latest_volume)
+        }
+        return messages, summary_stats
 
     def analyze_market_data(
         self,
@@ -115,49 +617,61 @@ class OpenAIProvider(BaseAIProvider):
         Returns:
             Dictionary with analysis results
         """
-        # Prepare summary statistics
-        latest_close = historical_data['Close'].iloc[-1]
-        prev_close = historical_data['Close'].iloc[-2] if len(historical_data) > 1 else latest_close
-        change_pct = ((latest_close - prev_close) / prev_close) * 100
-        
-        avg_volume = historical_data['Volume'].mean()
-        latest_volume = historical_data['Volume'].iloc[-1]
-        
-        summary = f"""
-        Latest Close: ${latest_close:.2f}
-        Daily Change: {change_pct:.2f}%
-        Average Volume: {avg_volume:,.0f}
-        Latest Volume: {latest_volume:,.0f}
-        52-Week High: ${historical_data['Close'].max():.2f}
-        52-Week Low: ${historical_data['Close'].min():.2f}
-        """
-        
-        if additional_context:
-            summary += f"\n\nAdditional Context: {additional_context}"
+        messages, summary_stats = self._market_data_messages(historical_data, additional_context)
+        analysis = self._call_api(messages, temperature=0.7, model=self.analysis_model)
         
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a financial analyst. Analyze the market data and provide insights about trends, patterns, and potential trading opportunities."
-            },
-            {
-                "role": "user",
-                "content": f"Analyze this market data and provide insights:\n{summary}"
-            }
-        ]
-        
-        analysis = self._call_api(messages, temperature=0.7)
+        return {
+            "analysis": analysis,
+            "summary_stats": summary_stats
+        }
+
+    async def aanalyze_market_data(
+        self,
+        historical_data: pd.DataFrame,
+        additional_context: Optional[str] = None
+    ) -> Dict:
+        """Async variant of analyze_market_data."""
+        messages, summary_stats = self._market_data_messages(historical_data, additional_context)
+        analysis = await self._call_api_async(messages, temperature=0.7, model=self.analysis_model)
         
         return {
             "analysis": analysis,
-            "summary_stats": {
-                "latest_close": latest_close,
-                "change_pct": change_pct,
-                "avg_volume": avg_volume,
-                "latest_volume": latest_volume
-            }
+            "summary_stats": summary_stats
         }
 
+    def _trading_signal_messages(
+        self,
+        symbol: str,
+        historical_data: pd.DataFrame,
+        technical_indicators: Dict,
+        news_sentiment: Optional[Dict] = None
+    ) -> tuple:
+        """Build the prompt for generate_trading_signal."""
+        context = f"Symbol: {symbol}\n"
+        context += f"Current Price: ${historical_data['Close'].iloc[-1]:.2f}\n"
+        context += f"Technical Indicators: {_dumps(technical_indicators)}\n"
+        
+        if news_sentiment:
+            context += f"News Sentiment: {_dumps(news_sentiment)}\n"
+        
+        return (
+            _SYS_SIGNAL,
+            {"role": "user", "content": f"Generate a trading signal for:\n{context}"},
+        )
+
+    @staticmethod
+    def _parse_trading_signal(response: str) -> Dict:
+        """Parse the model's trading signal response."""
+        try:
+            result = _loads(response)
+            return result
+        except (json.JSONDecodeError, ValueError):
+            return {
+                "action": "hold",
+                "confidence": 0.3,
+                "reasoning": "Unable to generate clear signal from data"
+            }
+
     def generate_trading_signal(
         self,
         symbol: str,
@@ -177,35 +691,29 @@ class OpenAIProvider(BaseAIProvider):
         Returns:
             Dictionary with trading signal
         """
-        context = f"Symbol: {symbol}\n"
-        context += f"Current Price: ${historical_data['Close'].iloc[-1]:.2f}\n"
-        context += f"Technical Indicators: {json.dumps(technical_indicators, indent=2)}\n"
-        
-        if news_sentiment:
-            context += f"News Sentiment: {json.dumps(news_sentiment, indent=2)}\n"
-        
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a trading signal generator. Based on the provided data, generate a trading signal. Return a JSON object with 'action' (buy/sell/hold), 'confidence' (0-1), and 'reasoning'."
-            },
-            {
-                "role": "user",
-                "content": f"Generate a trading signal for:\n{context}"
-            }
-        ]
-        
-        response = self._call_api(messages, temperature=0.5)
-        
-        try:
-            result = json.loads(response)
-            return result
-        except (json.JSONDecodeError, ValueError):
-            return {
-                "action": "hold",
-                "confidence": 0.3,
-                "reasoning": "Unable to generate clear signal from data"
-            }
+        messages = self._trading_signal_messages(
+            symbol, historical_data, technical_indicators, news_sentiment
+        )
+        response = self._call_api(
+            messages, temperature=0.5, response_format=SIGNAL_FORMAT, model=self.sentiment_model
+        )
+        return self._parse_trading_signal(response)
+
+    async def agenerate_trading_signal(
+        self,
+        symbol: str,
+        historical_data: pd.DataFrame,
+        technical_indicators: Dict,
+        news_sentiment: Optional[Dict] = None
+    ) -> Dict:
+        """Async variant of generate_trading_signal."""
+        messages = self._trading_signal_messages(
+            symbol, historical_data, technical_indicators, news_sentiment
+        )
+        response = await self._call_api_async(
+            messages, temperature=0.5, response_format=SIGNAL_FORMAT, model=self.sentiment_model
+        )
+        return self._parse_trading_signal(response)
 
     def explain_prediction(
         self,
@@ -235,21 +743,15 @@ class OpenAIProvider(BaseAIProvider):
         Expected Change: {change_pct:.2f}%
         
         Key Features:
-        {json.dumps(features, indent=2)}
+        {_dumps(features)}
         """
         
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a financial analyst. Explain the price prediction in clear, understandable terms for a trader."
-            },
-            {
-                "role": "user",
-                "content": f"Explain this price prediction:\n{context}"
-            }
-        ]
+        messages = (
+            _SYS_EXPLANATION,
+            {"role": "user", "content": f"Explain this price prediction:\n{context}"},
+        )
         
-        return self._call_api(messages, temperature=0.7)
+        return "".join(self._stream(messages, temperature=0.7, model=self.analysis_model))
 
     def summarize_market_trends(self, symbols: List[str], timeframe: str = "1d") -> str:
         """
@@ -262,15 +764,12 @@ class OpenAIProvider(BaseAIProvider):
         Returns:
             String summary of market trends
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a market analyst. Provide a concise summary of market trends for the given symbols."
-            },
+        messages = (
+            _SYS_SUMMARY,
             {
                 "role": "user",
                 "content": f"Summarize market trends for these symbols over {timeframe}: {', '.join(symbols)}"
-            }
-        ]
+            },
+        )
         
-        return self._call_api(messages, temperature=0.7)
+        return "".join(self._stream(messages, temperature=0.7, model=self.analysis_model))
@@ -5,16 +5,73 @@ This module provides the main TradingBot class that orchestrates all components.
 """
 
 from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+import asyncio
+import json
 import logging
+import time
+
+import numpy as np
 
 from .brokers.paper_trading import PaperTradingBroker
 from .data_sources.yahoo_finance import YahooFinanceDataSource
-from .ai_providers.openai_provider import OpenAIProvider
 from .models.price_predictor import PricePredictor
 from .strategies.daily_trend_strategy import DailyTrendStrategy
 from .utils.config import Config
 from .utils.logger import setup_logger
+from .data_sources.base import BaseDataSource
+
+
+# Component registries keyed by the 'type' value in the configuration
+_BROKERS = {
+    'paper_trading': PaperTradingBroker,
+}
+_DATA_SOURCES = {
+    'yahoo_finance': YahooFinanceDataSource,
+}
+
+# Signal actions that translate directly into an order side
+_ORDER_SIDES = frozenset(('buy', 'sell'))
+
+
+# Components shared between bots when 'runtime.share_components' is enabled.
+# Sharing speeds up harnesses that build many bots (backtests, parameter
+# sweeps) but is off by default so live bots stay fully isolated.
+@lru_cache(maxsize=1)
+def _shared_logger() -> logging.Logger:
+    """Configure the package logger once for all sharing bots."""
+    return setup_logger()
+
+
+@lru_cache(maxsize=16)
+def _shared_data_source(data_source_type: str, config_json: str) -> BaseDataSource:
+    """Construct a data source once per distinct configuration."""
+    return _DATA_SOURCES[data_source_type](json.loads(config_json))
+
+
+@lru_cache(maxsize=16)
+def _shared_ai_provider(config_json: str):
+    """Construct an OpenAI provider once per distinct configuration."""
+    from .ai_providers.openai_provider import OpenAIProvider
+    return OpenAIProvider(json.loads(config_json))
+
+
+def _run_coroutine(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    When the caller is itself running inside an event loop, the coroutine
+    runs on a fresh loop in a worker thread instead, since that loop cannot
+    be blocked on.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
 
 
 class TradingBot:
@@ -33,7 +90,8 @@ class TradingBot:
             config: Configuration object (uses defaults if not provided)
         """
         self.config = config or Config()
-        self.logger = setup_logger()
+        self._share_components = self.config.get('runtime.share_components', False)
+        self.logger = _shared_logger() if self._share_components else setup_logger()
         
         # Initialize components
         self.broker = None
@@ -42,6 +100,10 @@ class TradingBot:
         self.price_predictor = None
         self.strategy = None
         
+        # Signals generated in the current minute, by symbol
+        self._signal_cache = {}
+        self._signal_cache_minute = None
+        
         self._initialize_components()
 
     def _initialize_components(self) -> None:
@@ -52,27 +114,35 @@ class TradingBot:
         broker_config = self.config.get_broker_config()
         broker_type = broker_config.get('type', 'paper_trading')
         
-        if broker_type == 'paper_trading':
-            self.broker = PaperTradingBroker(broker_config)
-            self.logger.info("Initialized Paper Trading broker")
-        else:
+        if broker_type not in _BROKERS:
             raise ValueError(f"Unsupported broker type: {broker_type}")
+        self.broker = _BROKERS[broker_type](broker_config)
+        self.logger.info(f"Initialized {self.broker.__class__.__name__}")
         
         # Initialize data source
         data_source_config = self.config.get_data_source_config()
         data_source_type = data_source_config.get('type', 'yahoo_finance')
         
-        if data_source_type == 'yahoo_finance':
-            self.data_source = YahooFinanceDataSource(data_source_config)
-            self.logger.info("Initialized Yahoo Finance data source")
-        else:
+        if data_source_type not in _DATA_SOURCES:
             raise ValueError(f"Unsupported data source type: {data_source_type}")
+        if self._share_components:
+            self.data_source = _shared_data_source(
+                data_source_type, json.dumps(data_source_config, sort_keys=True)
+            )
+        else:
+            self.data_source = _DATA_SOURCES[data_source_type](data_source_config)
+        self.logger.info(f"Initialized {self.data_source.__class__.__name__}")
         
-        # Initialize AI provider (optional)
+        # Initialize AI provider (optional); imported lazily so offline runs
+        # don't pay for loading the OpenAI SDK
         ai_config = self.config.get_ai_provider_config()
         if ai_config.get('api_key'):
             try:
-                self.ai_provider = OpenAIProvider(ai_config)
+                if self._share_components:
+                    self.ai_provider = _shared_ai_provider(json.dumps(ai_config, sort_keys=True))
+                else:
+                    from .ai_providers.openai_provider import OpenAIProvider
+                    self.ai_provider = OpenAIProvider(ai_config)
                 self.logger.info("Initialized OpenAI provider")
             except Exception as e:
                 self.logger.warning(f"Could not initialize AI provider: {e}")
@@ -99,6 +169,8 @@ class TradingBot:
         Returns:
             True if connection successful
         """
+        self._signal_cache.clear()
+        self.strategy.clear_cache()
         success = self.broker.connect()
         if success:
             self.logger.info("Connected to broker")
@@ -116,6 +188,9 @@ class TradingBot:
         success = self.broker.disconnect()
         if success:
             self.logger.info("Disconnected from broker")
+        # A shared provider stays open for the other bots using it
+        if self.ai_provider and not self._share_components:
+            self.ai_provider.close()
         return success
 
     def train_model(self, symbol: str, lookback_days: int = 365) -> Dict:
@@ -141,6 +216,9 @@ class TradingBot:
         )
         
         results = self.price_predictor.train(historical_data)
+        # Analyses and signals made with the previous model are out of date
+        self.strategy.clear_cache()
+        self._signal_cache.clear()
         
         self.logger.info(f"Model training complete: R² = {results['val_r2']:.4f}, RMSE = {results['val_rmse']:.2f}")
         
@@ -156,16 +234,38 @@ class TradingBot:
         Returns:
             Dictionary with analysis and trading signal
         """
+        cached = self._cached_signal(symbol)
+        if cached is not None:
+            return cached
+        
         self.logger.info(f"Analyzing {symbol}...")
         
         signal = self.strategy.generate_trading_signal(symbol)
+        self._log_signal(signal)
+        self._cache_signal(symbol, signal)
         
+        return signal
+
+    def _cached_signal(self, symbol: str) -> Optional[Dict]:
+        """Return the signal generated for symbol earlier in the current minute."""
+        if self._signal_cache_minute != int(time.time() // 60):
+            return None
+        return self._signal_cache.get(symbol)
+
+    def _cache_signal(self, symbol: str, signal: Dict) -> None:
+        """Remember a signal for the rest of the current minute."""
+        minute = int(time.time() // 60)
+        if minute != self._signal_cache_minute:
+            self._signal_cache.clear()
+            self._signal_cache_minute = minute
+        self._signal_cache[symbol] = signal
+
+    def _log_signal(self, signal: Dict) -> None:
+        """Log the outcome of a symbol analysis."""
         self.logger.info(
-            f"{symbol}: {signal['action'].upper()} "
+            f"{signal['symbol']}: {signal['action'].upper()} "
             f"(confidence: {signal['confidence']:.2f})"
         )
-        
-        return signal
 
     def execute_signal(
         self,
@@ -189,6 +289,8 @@ class TradingBot:
         if action == 'hold':
             self.logger.info(f"Holding {symbol} - no action taken")
             return None
+        if action not in _ORDER_SIDES:
+            return None
         
         # Determine quantity
         if quantity is None:
@@ -196,24 +298,13 @@ class TradingBot:
         
         # Place order
         try:
-            if action == 'buy':
-                order = self.broker.place_order(
-                    symbol=symbol,
-                    quantity=quantity,
-                    order_type='market',
-                    side='buy',
-                    price=current_price
-                )
-            elif action == 'sell':
-                order = self.broker.place_order(
-                    symbol=symbol,
-                    quantity=quantity,
-                    order_type='market',
-                    side='sell',
-                    price=current_price
-                )
-            else:
-                return None
+            order = self.broker.place_order(
+                symbol=symbol,
+                quantity=quantity,
+                order_type='market',
+                side=action,
+                price=current_price
+            )
 
             if not order or order.get('status') == 'rejected':
                 self.logger.warning(
@@ -238,16 +329,38 @@ class TradingBot:
         Returns:
             List of trading signals
         """
-        signals = []
-        
-        for symbol in symbols:
-            try:
-                signal = self.analyze_symbol(symbol)
-                signals.append(signal)
-            except Exception as e:
-                self.logger.error(f"Error analyzing {symbol}: {e}")
+        # Each distinct symbol is analyzed at most once per minute
+        by_symbol = {}
+        pending = []
+        for symbol in dict.fromkeys(symbols):
+            cached = self._cached_signal(symbol)
+            if cached is not None:
+                by_symbol[symbol] = cached
+            else:
+                pending.append(symbol)
         
-        return signals
+        if pending:
+            self.logger.info(f"Analyzing {', '.join(pending)}...")
+            
+            # Symbols are fetched in parallel threads and their AI requests
+            # are issued concurrently
+            results = _run_coroutine(
+                self.strategy.abatch_signals(
+                    pending,
+                    max_concurrency=self.config.get('ai_provider.max_concurrency', 8),
+                    parallelism=self.config.get('trading.parallelism', 8)
+                )
+            )
+            
+            for symbol, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error analyzing {symbol}: {result}")
+                    continue
+                self._log_signal(result)
+                self._cache_signal(symbol, result)
+                by_symbol[symbol] = result
+        
+        return [by_symbol[symbol] for symbol in symbols if symbol in by_symbol]
 
     def run_trading_session(
         self,
@@ -286,10 +399,11 @@ class TradingBot:
                     if order:
                         session_results['orders'].append(order)
         
-        # Get portfolio status
+        # Get portfolio status; copied like in get_portfolio_status, since
+        # brokers may hand out shared position dicts
         session_results['portfolio'] = {
             'balance': self.broker.get_account_balance(),
-            'positions': self.broker.get_positions()
+            'positions': [dict(position) for position in self.broker.get_positions()]
         }
         
         self.logger.info(
@@ -307,20 +421,38 @@ class TradingBot:
             Dictionary with portfolio information
         """
         balance = self.broker.get_account_balance()
-        positions = self.broker.get_positions()
+        # Copy the position dicts; brokers may hand out shared ones
+        positions = [dict(position) for position in self.broker.get_positions()]
         
-        # Calculate portfolio value
-        total_position_value = 0
+        # Fetch all prices in one request, then value the positions together
+        try:
+            prices = self.data_source.get_current_prices([p['symbol'] for p in positions])
+        except Exception as e:
+            self.logger.error(f"Error getting prices: {e}")
+            prices = {}
         for position in positions:
-            try:
-                current_price = self.data_source.get_current_price(position['symbol'])
-                position['current_price'] = current_price
-                position['current_value'] = current_price * position['quantity']
-                position['profit_loss'] = position['current_value'] - position['total_cost']
-                position['profit_loss_pct'] = (position['profit_loss'] / position['total_cost']) * 100
-                total_position_value += position['current_value']
-            except Exception as e:
-                self.logger.error(f"Error getting price for {position['symbol']}: {e}")
+            if position['symbol'] not in prices:
+                self.logger.error(f"Error getting price for {position['symbol']}: no price available")
+        priced = [p for p in positions if p['symbol'] in prices]
+        
+        total_position_value = 0
+        if priced:
+            quantity = np.fromiter((p['quantity'] for p in priced), dtype=np.float64, count=len(priced))
+            cost = np.fromiter((p['total_cost'] for p in priced), dtype=np.float64, count=len(priced))
+            price = np.fromiter((prices[p['symbol']] for p in priced), dtype=np.float64, count=len(priced))
+            value = quantity * price
+            profit_loss = value - cost
+            # Positions with no cost basis (e.g. gifted shares) report 0%
+            profit_loss_pct = np.divide(
+                profit_loss * 100, cost, out=np.zeros_like(cost), where=cost != 0
+            )
+            
+            for i, position in enumerate(priced):
+                position['current_price'] = float(price[i])
+                position['current_value'] = float(value[i])
+                position['profit_loss'] = float(profit_loss[i])
+                position['profit_loss_pct'] = float(profit_loss_pct[i])
+            total_position_value = float(value.sum())
         
         total_value = balance + total_position_value
         
@@ -5,12 +5,39 @@ This broker simulates trading without real money, useful for testing strategies
 and learning how the bot works.
 """
 
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 from datetime import datetime
+import bisect
+import numpy as np
 from ..brokers.base import BaseBroker
 import uuid
 
 
+class Position:
+    """Open position held by the paper broker."""
+
+    __slots__ = ("quantity", "avg_price", "total_cost")
+
+    def __init__(self, quantity: float, avg_price: float, total_cost: float):
+        self.quantity = quantity
+        self.avg_price = avg_price
+        self.total_cost = total_cost
+
+    @classmethod
+    def from_dict(cls, details: Dict) -> "Position":
+        """Build a position from its persisted dictionary form."""
+        return cls(details["quantity"], details["avg_price"], details["total_cost"])
+
+    def to_dict(self) -> Dict:
+        """Return the dictionary form used for persistence and reporting."""
+        return {
+            "quantity": self.quantity,
+            "avg_price": self.avg_price,
+            "total_cost": self.total_cost,
+        }
+
+
 class PaperTradingBroker(BaseBroker):
     """
     Paper trading broker for simulation and testing.
@@ -29,9 +56,15 @@ class PaperTradingBroker(BaseBroker):
         super().__init__(config)
         self.initial_balance = config.get("initial_balance", 100000.0)
         self.balance = self.initial_balance
-        self.positions = {}  # symbol -> {quantity, avg_price, total_cost}
+        self._positions: Dict[str, Position] = {}  # see the positions property
+        # Derived from positions and rebuilt on demand after fills
+        self._positions_view: Optional[List[Dict]] = None
+        self._positions_mapping: Optional[Mapping[str, Mapping]] = None
+        self._valuation_arrays = None  # (symbols, avg_prices, quantities)
         self.orders = {}  # order_id -> order_details
         self.order_history = []
+        self._order_ts: List[datetime] = []  # timestamps parallel to order_history
+        self._history_state: List[Dict] = []  # serialized prefix of order_history
 
     def connect(self) -> bool:
         """Establish connection (no-op for paper trading)."""
@@ -47,16 +80,58 @@ class PaperTradingBroker(BaseBroker):
         """Get current account balance."""
         return self.balance
 
+    @property
+    def positions(self) -> Mapping[str, Mapping]:
+        """
+        Open positions by symbol, each as a mapping with quantity, avg_price
+        and total_cost.
+        
+        The mappings are read-only views; assign a new dictionary of
+        positions to replace them.
+        """
+        if self._positions_mapping is None:
+            self._positions_mapping = MappingProxyType({
+                symbol: MappingProxyType(position.to_dict())
+                for symbol, position in self._positions.items()
+            })
+        return self._positions_mapping
+
+    @positions.setter
+    def positions(self, positions: Dict[str, Dict]) -> None:
+        """Replace all positions with the given dictionaries, keyed by symbol."""
+        self._positions = {
+            symbol: Position.from_dict(details)
+            for symbol, details in positions.items()
+        }
+        self._invalidate_positions()
+
     def get_positions(self) -> List[Dict]:
-        """Get current open positions."""
+        """
+        Get current open positions.
+        
+        The list is cached until the next fill and shared between callers,
+        so it must not be modified.
+        """
+        if self._positions_view is None:
+            self._positions_view = self._build_positions_view()
+        return self._positions_view
+
+    def _invalidate_positions(self) -> None:
+        """Drop data derived from positions after they change."""
+        self._positions_view = None
+        self._positions_mapping = None
+        self._valuation_arrays = None
+
+    def _build_positions_view(self) -> List[Dict]:
+        """Build the position dictionaries returned by get_positions."""
         return [
             {
                 "symbol": symbol,
-                "quantity": details["quantity"],
-                "avg_price": details["avg_price"],
-                "total_cost": details["total_cost"],
+                "quantity": position.quantity,
+                "avg_price": position.avg_price,
+                "total_cost": position.total_cost,
             }
-            for symbol, details in self.positions.items()
+            for symbol, position in self._positions.items()
         ]
 
     def place_order(
@@ -80,10 +155,46 @@ class PaperTradingBroker(BaseBroker):
         Returns:
             Dictionary with order details
         """
+        order = self._execute_order(symbol, quantity, order_type, side, price)
+        if order.get("status") == "filled":
+            self._invalidate_positions()
+        return order
+    
+    def place_orders_batch(self, orders: List[Dict]) -> List[Dict]:
+        """
+        Place several orders in sequence.
+        
+        Orders are applied one after another, so each sees the balance and
+        positions left by the previous ones (a sell can close shares bought
+        earlier in the batch). Derived position data is rebuilt once at the
+        end rather than after every fill.
+        
+        Args:
+            orders: place_order arguments for each order (symbol, quantity,
+                order_type, side and optionally price)
+            
+        Returns:
+            Order details for each order, in the same order
+        """
+        try:
+            return [self._execute_order(**order) for order in orders]
+        finally:
+            self._invalidate_positions()
+    
+    def _execute_order(
+        self,
+        symbol: str,
+        quantity: float,
+        order_type: str,
+        side: str,
+        price: Optional[float] = None
+    ) -> Dict:
+        """Place an order without invalidating derived position data."""
         if not self.connected:
             raise RuntimeError("Broker not connected")
 
         order_id = str(uuid.uuid4())
+        timestamp = datetime.now()
         
         # For market orders, execute immediately (simplified simulation)
         if order_type == "market":
@@ -102,24 +213,15 @@ class PaperTradingBroker(BaseBroker):
                 
                 self.balance -= total_cost
                 
-                if symbol in self.positions:
-                    # Update existing position
-                    old_qty = self.positions[symbol]["quantity"]
-                    old_cost = self.positions[symbol]["total_cost"]
-                    new_qty = old_qty + quantity
-                    new_cost = old_cost + total_cost
-                    self.positions[symbol] = {
-                        "quantity": new_qty,
-                        "avg_price": new_cost / new_qty,
-                        "total_cost": new_cost
-                    }
+                position = self._positions.get(symbol)
+                if position is not None:
+                    # Update existing position in place
+                    position.quantity += quantity
+                    position.total_cost += total_cost
+                    position.avg_price = position.total_cost / position.quantity
                 else:
                     # New position
-                    self.positions[symbol] = {
-                        "quantity": quantity,
-                        "avg_price": price,
-                        "total_cost": total_cost
-                    }
+                    self._positions[symbol] = Position(quantity, price, total_cost)
                 
                 order = {
                     "order_id": order_id,
@@ -129,11 +231,12 @@ class PaperTradingBroker(BaseBroker):
                     "side": side,
                     "price": price,
                     "status": "filled",
-                    "timestamp": datetime.now()
+                    "timestamp": timestamp
                 }
                 
             elif side == "sell":
-                if symbol not in self.positions or self.positions[symbol]["quantity"] < quantity:
+                position = self._positions.get(symbol)
+                if position is None or position.quantity < quantity:
                     return {
                         "order_id": order_id,
                         "status": "rejected",
@@ -141,13 +244,11 @@ class PaperTradingBroker(BaseBroker):
                     }
                 
                 self.balance += total_cost
-                self.positions[symbol]["quantity"] -= quantity
-                self.positions[symbol]["total_cost"] -= (
-                    self.positions[symbol]["avg_price"] * quantity
-                )
+                position.quantity -= quantity
+                position.total_cost -= position.avg_price * quantity
                 
-                if self.positions[symbol]["quantity"] == 0:
-                    del self.positions[symbol]
+                if position.quantity == 0:
+                    del self._positions[symbol]
                 
                 order = {
                     "order_id": order_id,
@@ -157,13 +258,14 @@ class PaperTradingBroker(BaseBroker):
                     "side": side,
                     "price": price,
                     "status": "filled",
-                    "timestamp": datetime.now()
+                    "timestamp": timestamp
                 }
             else:
                 raise ValueError(f"Invalid side: {side}")
             
             self.orders[order_id] = order
             self.order_history.append(order)
+            self._order_ts.append(order["timestamp"])
             return order
         
         # For limit orders, just record them (simplified)
@@ -175,7 +277,7 @@ class PaperTradingBroker(BaseBroker):
             "side": side,
             "price": price,
             "status": "pending",
-            "timestamp": datetime.now()
+            "timestamp": timestamp
         }
         self.orders[order_id] = order
         return order
@@ -196,10 +298,10 @@ class PaperTradingBroker(BaseBroker):
 
     def get_order_history(self, start_date: datetime, end_date: datetime) -> List[Dict]:
         """Get order history for a date range."""
-        return [
-            order for order in self.order_history
-            if start_date <= order["timestamp"] <= end_date
-        ]
+        # Orders are appended in timestamp order, so the range is a slice
+        lo = bisect.bisect_left(self._order_ts, start_date)
+        hi = bisect.bisect_right(self._order_ts, end_date)
+        return self.order_history[lo:hi]
 
     def get_portfolio_value(self, current_prices: Dict[str, float]) -> float:
         """
@@ -211,11 +313,23 @@ class PaperTradingBroker(BaseBroker):
         Returns:
             Total portfolio value (cash + positions)
         """
-        position_value = sum(
-            details["quantity"] * current_prices.get(symbol, details["avg_price"])
-            for symbol, details in self.positions.items()
+        if self._valuation_arrays is None:
+            self._valuation_arrays = (
+                list(self._positions),
+                [position.avg_price for position in self._positions.values()],
+                np.fromiter(
+                    (position.quantity for position in self._positions.values()),
+                    dtype=np.float64, count=len(self._positions)
+                ),
+            )
+        symbols, avg_prices, quantities = self._valuation_arrays
+        
+        # Only the price lookups run in Python; the sum is a single dot product
+        prices = np.fromiter(
+            (current_prices.get(symbol, avg_price) for symbol, avg_price in zip(symbols, avg_prices)),
+            dtype=np.float64, count=len(symbols)
         )
-        return self.balance + position_value
+        return self.balance + float(quantities @ prices)
     
     def get_state(self) -> Dict:
         """
@@ -224,23 +338,27 @@ class PaperTradingBroker(BaseBroker):
         Returns:
             Dictionary with broker state
         """
+        # Filled orders never change, so only orders added since the last
+        # call need serializing
+        history_state = self._history_state
+        for o in self.order_history[len(history_state):]:
+            timestamp = o['timestamp']
+            history_state.append({
+                'order_id': o['order_id'],
+                'symbol': o['symbol'],
+                'quantity': o['quantity'],
+                'order_type': o['order_type'],
+                'side': o['side'],
+                'price': o['price'],
+                'status': o['status'],
+                'timestamp': timestamp.isoformat() if timestamp.__class__ is datetime else timestamp
+            })
+        
         return {
             'balance': self.balance,
             'initial_balance': self.initial_balance,
-            'positions': dict(self.positions),
-            'order_history': [
-                {
-                    'order_id': o['order_id'],
-                    'symbol': o['symbol'],
-                    'quantity': o['quantity'],
-                    'order_type': o['order_type'],
-                    'side': o['side'],
-                    'price': o['price'],
-                    'status': o['status'],
-                    'timestamp': o['timestamp'].isoformat() if isinstance(o['timestamp'], datetime) else o['timestamp']
-                }
-                for o in self.order_history
-            ]
+            'positions': {symbol: position.to_dict() for symbol, position in self._positions.items()},
+            'order_history': list(history_state)
         }
     
     def load_state(self, state: Dict) -> None:
@@ -256,9 +374,11 @@ class PaperTradingBroker(BaseBroker):
         
         # Load order history
         self.order_history = []
+        self._history_state = []
         for order_data in state.get('order_history', []):
             order = dict(order_data)
             # Convert timestamp string back to datetime if needed
             if isinstance(order['timestamp'], str):
                 order['timestamp'] = datetime.fromisoformat(order['timestamp'])
             self.order_history.append(order)
+        self._order_ts = [order['timestamp'] for order in self.order_history]
@@ -50,6 +50,37 @@ class BaseDataSource(ABC):
         """
         pass
 
+    def get_historical_data_batch(
+        self,
+        symbols: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d"
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch historical price data for several symbols at once.
+        
+        The default implementation calls get_historical_data per symbol;
+        sources with a multi-symbol endpoint should override it.
+        
+        Args:
+            symbols: List of stock symbols
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            interval: Data interval ('1d', '1h', '5m', etc.)
+            
+        Returns:
+            Dictionary mapping symbol to its DataFrame (same columns as
+            get_historical_data). Symbols without data are omitted.
+        """
+        data = {}
+        for symbol in symbols:
+            try:
+                data[symbol] = self.get_historical_data(symbol, start_date, end_date, interval)
+            except Exception:
+                continue
+        return data
+
     @abstractmethod
     def get_current_price(self, symbol: str) -> float:
         """
@@ -63,6 +94,28 @@ class BaseDataSource(ABC):
         """
         pass
 
+    def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get current prices for several symbols at once.
+        
+        The default implementation calls get_current_price per symbol;
+        sources with a multi-symbol endpoint should override it.
+        
+        Args:
+            symbols: List of stock symbols
+            
+        Returns:
+            Dictionary mapping symbol to current price. Symbols whose price
+            could not be fetched are omitted.
+        """
+        prices = {}
+        for symbol in symbols:
+            try:
+                prices[symbol] = self.get_current_price(symbol)
+            except Exception:
+                continue
+        return prices
+
     @abstractmethod
     def get_quote(self, symbol: str) -> Dict:
         """
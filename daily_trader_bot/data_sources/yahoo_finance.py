@@ -6,8 +6,69 @@ This module provides market data fetching capabilities using Yahoo Finance API.
 
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
+import os
+import threading
+import time
 import pandas as pd
 from ..data_sources.base import BaseDataSource
+from ..utils._json import dumps, loads
+
+_DAILY_INTERVALS = frozenset(('1d', '5d', '1wk', '1mo', '3mo'))
+
+# Price columns returned with the date by every history method
+_OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Persistent cache lifetimes, in seconds
+_COMPANY_INFO_TTL = 24 * 3600
+_SEARCH_TTL = 7 * 24 * 3600
+
+
+class _JsonFileCache:
+    """
+    Small persistent key-value cache with per-entry expiry.
+    
+    Entries live in a single JSON file that is read on first use and
+    rewritten atomically on every update. Failing to write the file is not
+    an error; the cache then only lasts for the process.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self._entries = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict:
+        if self._entries is None:
+            try:
+                with open(self.path, 'rb') as f:
+                    self._entries = loads(f.read())
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: str):
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._load().get(key)
+        if entry is None or entry['expires_at'] < time.time():
+            return None
+        return entry['value']
+
+    def set(self, key: str, value, expire: float) -> None:
+        """Store a JSON-serializable value for expire seconds."""
+        with self._lock:
+            now = time.time()
+            entries = {k: v for k, v in self._load().items() if v['expires_at'] >= now}
+            entries[key] = {'expires_at': now + expire, 'value': value}
+            self._entries = entries
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                tmp_path = self.path + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(dumps(entries))
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass
 
 
 class YahooFinanceDataSource(BaseDataSource):
@@ -17,12 +78,15 @@ class YahooFinanceDataSource(BaseDataSource):
     Fetches market data from Yahoo Finance using yfinance library.
     """
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, session=None):
         """
         Initialize Yahoo Finance data source.
         
         Args:
             config: Configuration dictionary
+            session: Optional HTTP session passed to every yfinance request.
+                By default yfinance uses its own process-wide session, which
+                already keeps connections alive between requests.
         """
         super().__init__(config)
         try:
@@ -32,6 +96,93 @@ class YahooFinanceDataSource(BaseDataSource):
             raise ImportError(
                 "yfinance library is required. Install it with: pip install yfinance"
             )
+        
+        self.session = session
+        
+        # Downloaded data is reused for cache_ttl seconds
+        self.cache_ttl = config.get('cache_ttl', 60.0)
+        self._history_cache = {}  # (symbol, interval, start, end) -> (expires_at, df)
+        self._bar_cache = {}  # symbol -> (expires_at, latest daily bar)
+        # Company metadata does not change intraday
+        self.info_cache_ttl = config.get('info_cache_ttl', 3600.0)
+        self._info_cache = {}  # symbol -> (expires_at, Ticker.info)
+        # Company info and search results are kept on disk across restarts
+        self._disk_cache = _JsonFileCache(
+            config.get('disk_cache_file', '~/.daily_trader_bot/yf_info.json')
+        )
+
+    def _ticker(self, symbol: str):
+        """Create a yfinance Ticker that uses this data source's session."""
+        return self.yf.Ticker(symbol, session=self.session)
+
+    @staticmethod
+    def _history_key(symbol: str, start_date: datetime, end_date: datetime, interval: str) -> tuple:
+        """Cache key for a history request; daily and longer bars are keyed by date."""
+        if interval in _DAILY_INTERVALS:
+            start_date, end_date = start_date.date(), end_date.date()
+        return (symbol, interval, start_date, end_date)
+
+    def _cached(self, cache: Dict, key):
+        """Return an unexpired cache entry, or None."""
+        entry = cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    @staticmethod
+    def _standardize(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Move the date index into a column, capitalize column names and keep
+        only the date and OHLCV columns.
+        
+        Ticker.history adds corporate action columns (Dividends, Stock
+        splits) that yf.download does not, so both are trimmed to the same
+        layout.
+        """
+        df = df.reset_index()
+        df.columns = [col.lower().capitalize() for col in df.columns]
+        return df[[df.columns[0]] + _OHLCV_COLUMNS]
+
+    def _info(self, symbol: str, ticker=None) -> Dict:
+        """Get (cached) Ticker.info metadata for a symbol."""
+        info = self._cached(self._info_cache, symbol)
+        if info is None:
+            info = (ticker or self._ticker(symbol)).info
+            self._info_cache[symbol] = (time.monotonic() + self.info_cache_ttl, info)
+        return info
+
+    @staticmethod
+    def _fast_quote(ticker) -> Optional[Dict]:
+        """Read the latest session's prices from Ticker.fast_info, or None if incomplete."""
+        try:
+            fast_info = ticker.fast_info
+            quote = {
+                "current_price": fast_info.last_price,
+                "open": fast_info.open,
+                "high": fast_info.day_high,
+                "low": fast_info.day_low,
+                "volume": fast_info.last_volume,
+            }
+        except Exception:
+            return None
+        
+        if any(value is None or pd.isna(value) for value in quote.values()):
+            return None
+        
+        quote = {key: float(value) for key, value in quote.items()}
+        quote["volume"] = int(quote["volume"])
+        return quote
+
+    def _latest_bar(self, symbol: str) -> Optional[pd.Series]:
+        """Get the latest daily bar for a symbol, or None if there is no data."""
+        bar = self._cached(self._bar_cache, symbol)
+        if bar is None:
+            data = self._ticker(symbol).history(period="1d")
+            if data.empty:
+                return None
+            bar = data.iloc[-1]
+            self._bar_cache[symbol] = (time.monotonic() + self.cache_ttl, bar)
+        return bar
 
     def get_historical_data(
         self,
@@ -52,21 +203,81 @@ class YahooFinanceDataSource(BaseDataSource):
         Returns:
             DataFrame with columns: Date, Open, High, Low, Close, Volume
         """
-        ticker = self.yf.Ticker(symbol)
-        df = ticker.history(
+        key = self._history_key(symbol, start_date, end_date, interval)
+        df = self._cached(self._history_cache, key)
+        if df is None:
+            ticker = self._ticker(symbol)
+            df = ticker.history(
+                start=start_date,
+                end=end_date,
+                interval=interval
+            )
+            
+            if df.empty:
+                raise ValueError(f"No data available for {symbol}")
+            
+            df = self._standardize(df)
+            self._history_cache[key] = (time.monotonic() + self.cache_ttl, df)
+        
+        return df.copy(deep=False)
+
+    def get_historical_data_batch(
+        self,
+        symbols: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d"
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch historical price data for several symbols with a single download.
+        
+        Args:
+            symbols: List of stock symbols
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            interval: Data interval ('1d', '1h', '5m', etc.)
+            
+        Returns:
+            Dictionary mapping symbol to its DataFrame (same columns as
+            get_historical_data). Symbols without data are omitted.
+        """
+        result = {}
+        missing = []
+        for symbol in dict.fromkeys(symbols):
+            df = self._cached(self._history_cache, self._history_key(symbol, start_date, end_date, interval))
+            if df is None:
+                missing.append(symbol)
+            else:
+                result[symbol] = df.copy(deep=False)
+        
+        if not missing:
+            return result
+        
+        data = self.yf.download(
+            tickers=' '.join(missing),
             start=start_date,
             end=end_date,
-            interval=interval
+            interval=interval,
+            group_by='ticker',
+            threads=True,
+            progress=False,
+            session=self.session,
         )
         
-        if df.empty:
-            raise ValueError(f"No data available for {symbol}")
-        
-        # Standardize column names
-        df = df.reset_index()
-        df.columns = [col.lower().capitalize() for col in df.columns]
+        expires_at = time.monotonic() + self.cache_ttl
+        for symbol in missing:
+            try:
+                df = data[symbol] if isinstance(data.columns, pd.MultiIndex) else data
+            except KeyError:
+                continue
+            df = df.dropna(how='all')
+            if df.empty:
+                continue
+            df = self._standardize(df)
+            self._history_cache[self._history_key(symbol, start_date, end_date, interval)] = (expires_at, df)
+            result[symbol] = df.copy(deep=False)
         
-        return df
+        return result
 
     def get_current_price(self, symbol: str) -> float:
         """
@@ -78,13 +289,58 @@ class YahooFinanceDataSource(BaseDataSource):
         Returns:
             float: Current price
         """
-        ticker = self.yf.Ticker(symbol)
-        data = ticker.history(period="1d")
+        bar = self._latest_bar(symbol)
         
-        if data.empty:
+        if bar is None:
             raise ValueError(f"No data available for {symbol}")
         
-        return float(data['Close'].iloc[-1])
+        return float(bar['Close'])
+
+    def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get current prices for several symbols with a single download.
+        
+        Args:
+            symbols: List of stock symbols
+            
+        Returns:
+            Dictionary mapping symbol to current price. Symbols without
+            data are omitted.
+        """
+        prices = {}
+        missing = []
+        for symbol in dict.fromkeys(symbols):
+            bar = self._cached(self._bar_cache, symbol)
+            if bar is None:
+                missing.append(symbol)
+            else:
+                prices[symbol] = float(bar['Close'])
+        
+        if not missing:
+            return prices
+        
+        data = self.yf.download(
+            tickers=' '.join(missing),
+            period="1d",
+            group_by='ticker',
+            threads=True,
+            progress=False,
+            session=self.session,
+        )
+        
+        expires_at = time.monotonic() + self.cache_ttl
+        for symbol in missing:
+            try:
+                bars = data[symbol] if isinstance(data.columns, pd.MultiIndex) else data
+            except KeyError:
+                continue
+            bars = bars.dropna(subset=['Close'])
+            if not bars.empty:
+                bar = bars.iloc[-1]
+                self._bar_cache[symbol] = (expires_at, bar)
+                prices[symbol] = float(bar['Close'])
+        
+        return prices
 
     def get_quote(self, symbol: str) -> Dict:
         """
@@ -96,19 +352,26 @@ class YahooFinanceDataSource(BaseDataSource):
         Returns:
             Dictionary containing quote information
         """
-        ticker = self.yf.Ticker(symbol)
-        info = ticker.info
+        ticker = self._ticker(symbol)
+        info = self._info(symbol, ticker)
         
-        # Get latest price data
-        hist = ticker.history(period="1d")
+        # Get latest price data, preferring a cached bar, then fast_info,
+        # then a history request
+        bar = self._cached(self._bar_cache, symbol)
+        quote = self._fast_quote(ticker) if bar is None else None
+        if quote is None:
+            bar = self._latest_bar(symbol)
+            quote = {
+                "current_price": float(bar['Close']) if bar is not None else None,
+                "open": float(bar['Open']) if bar is not None else None,
+                "high": float(bar['High']) if bar is not None else None,
+                "low": float(bar['Low']) if bar is not None else None,
+                "volume": int(bar['Volume']) if bar is not None else None,
+            }
         
         return {
             "symbol": symbol,
-            "current_price": float(hist['Close'].iloc[-1]) if not hist.empty else None,
-            "open": float(hist['Open'].iloc[-1]) if not hist.empty else None,
-            "high": float(hist['High'].iloc[-1]) if not hist.empty else None,
-            "low": float(hist['Low'].iloc[-1]) if not hist.empty else None,
-            "volume": int(hist['Volume'].iloc[-1]) if not hist.empty else None,
+            **quote,
             "previous_close": info.get("previousClose"),
             "market_cap": info.get("marketCap"),
             "pe_ratio": info.get("trailingPE"),
@@ -127,18 +390,25 @@ class YahooFinanceDataSource(BaseDataSource):
         Returns:
             List of dictionaries containing symbol information
         """
+        key = f"search:{query.upper()}"
+        cached = self._disk_cache.get(key)
+        if cached is not None:
+            return [dict(result) for result in cached]
+        
         # This is a basic implementation
         # In a production system, you'd use a proper search API
         try:
-            ticker = self.yf.Ticker(query.upper())
-            info = ticker.info
-            return [{
+            info = self._info(query.upper())
+            results = [{
                 "symbol": query.upper(),
                 "name": info.get("longName", "Unknown"),
                 "exchange": info.get("exchange", "Unknown"),
             }]
         except Exception:
             return []
+        
+        self._disk_cache.set(key, results, expire=_SEARCH_TTL)
+        return [dict(result) for result in results]
 
     def get_company_info(self, symbol: str) -> Dict:
         """
@@ -150,10 +420,14 @@ class YahooFinanceDataSource(BaseDataSource):
         Returns:
             Dictionary containing company information
         """
-        ticker = self.yf.Ticker(symbol)
-        info = ticker.info
+        key = f"info:{symbol}"
+        cached = self._disk_cache.get(key)
+        if cached is not None:
+            return dict(cached)
         
-        return {
+        info = self._info(symbol)
+        
+        result = {
             "symbol": symbol,
             "name": info.get("longName"),
             "sector": info.get("sector"),
@@ -164,6 +438,8 @@ class YahooFinanceDataSource(BaseDataSource):
             "market_cap": info.get("marketCap"),
             "country": info.get("country"),
         }
+        self._disk_cache.set(key, result, expire=_COMPANY_INFO_TTL)
+        return dict(result)
 
     def get_market_status(self) -> Dict:
         """
@@ -173,7 +449,7 @@ class YahooFinanceDataSource(BaseDataSource):
             Dictionary containing market status
         """
         # Use SPY as a proxy for market hours
-        spy = self.yf.Ticker("SPY")
+        spy = self._ticker("SPY")
         
         try:
             # Try to get today's data
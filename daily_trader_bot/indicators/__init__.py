@@ -0,0 +1,17 @@
+"""Technical indicator kernels shared by strategies and models."""
+
+from ._jit import (
+    NUMBA_AVAILABLE,
+    ema_last,
+    macd_last,
+    wilder_rsi,
+    wilder_rsi_last,
+)
+
+__all__ = [
+    "NUMBA_AVAILABLE",
+    "ema_last",
+    "macd_last",
+    "wilder_rsi",
+    "wilder_rsi_last",
+]
@@ -0,0 +1,142 @@
+"""
+Numba-compiled technical indicator kernels.
+
+All kernels operate on float64 NumPy arrays. ``_wilder_rsi`` returns the full
+series (NaN where the indicator is not yet defined) for the price model's
+features; the ``*_last`` variants return only the latest value. Every kernel
+declares its signature, so it is compiled (or loaded from numba's on-disk
+cache) when this module is imported rather than on its first call. Numba is
+optional: without it the same functions run as plain Python loops.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Explicit signatures make numba compile at import time; cache=True keeps the
+# compiled code on disk so later processes skip compilation.
+@njit("float64(float64[:], int64)", cache=True)
+def _ema_last(arr, n):
+    """Latest value of the exponential moving average with span n (pandas ``ewm(adjust=False)``)."""
+    if arr.shape[0] == 0:
+        return np.nan
+    alpha = 2.0 / (n + 1.0)
+    s = arr[0]
+    for i in range(1, arr.shape[0]):
+        s = alpha * arr[i] + (1.0 - alpha) * s
+    return s
+
+
+@njit("float64[:](float64[:], int64)", cache=True)
+def _wilder_rsi(close, n):
+    """
+    Relative Strength Index with Wilder smoothing of gains and losses.
+    
+    The averages are seeded with the mean of the first n price changes, so
+    the first value is at index n.
+    """
+    size = close.shape[0]
+    out = np.full(size, np.nan)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, size):
+        delta = close[i] - close[i - 1]
+        gain = max(delta, 0.0)
+        loss = max(-delta, 0.0)
+        if i <= n:
+            avg_gain += gain / n
+            avg_loss += loss / n
+            if i < n:
+                continue
+        else:
+            avg_gain = (avg_gain * (n - 1) + gain) / n
+            avg_loss = (avg_loss * (n - 1) + loss) / n
+        if avg_loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            out[i] = 100.0
+    return out
+
+
+@njit("float64(float64[:], int64)", cache=True)
+def _wilder_rsi_last(close, n):
+    """Latest value of ``_wilder_rsi`` without materializing the series."""
+    size = close.shape[0]
+    if size <= n:
+        return np.nan
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, size):
+        delta = close[i] - close[i - 1]
+        gain = max(delta, 0.0)
+        loss = max(-delta, 0.0)
+        if i <= n:
+            avg_gain += gain / n
+            avg_loss += loss / n
+        else:
+            avg_gain = (avg_gain * (n - 1) + gain) / n
+            avg_loss = (avg_loss * (n - 1) + loss) / n
+    if avg_loss > 0:
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    if avg_gain > 0:
+        return 100.0
+    return np.nan
+
+
+@njit("UniTuple(float64, 2)(float64[:], int64, int64, int64)", cache=True)
+def _macd_last(close, fast, slow, signal):
+    """Latest MACD and signal values in one pass, without intermediate series."""
+    if close.shape[0] == 0:
+        return np.nan, np.nan
+    alpha_fast = 2.0 / (fast + 1.0)
+    alpha_slow = 2.0 / (slow + 1.0)
+    alpha_signal = 2.0 / (signal + 1.0)
+    ema_fast = close[0]
+    ema_slow = close[0]
+    line = 0.0
+    sig = 0.0
+    for i in range(1, close.shape[0]):
+        ema_fast = alpha_fast * close[i] + (1.0 - alpha_fast) * ema_fast
+        ema_slow = alpha_slow * close[i] + (1.0 - alpha_slow) * ema_slow
+        line = ema_fast - ema_slow
+        sig = alpha_signal * line + (1.0 - alpha_signal) * sig
+    return line, sig
+
+
+def _as_float_array(values) -> np.ndarray:
+    """Coerce input to a writable float64 array matching the kernel signatures."""
+    # pandas hands out read-only views under copy-on-write; those would not
+    # match the compiled signatures, so copy them.
+    return np.require(values, dtype=np.float64, requirements=["C", "W"])
+
+
+def ema_last(values, n: int) -> float:
+    """Latest value of the exponential moving average with span n."""
+    return _ema_last(_as_float_array(values), int(n))
+
+
+def wilder_rsi(close, n: int = 14) -> np.ndarray:
+    """Relative Strength Index over n periods with Wilder smoothing."""
+    return _wilder_rsi(_as_float_array(close), int(n))
+
+
+def wilder_rsi_last(close, n: int = 14) -> float:
+    """Latest Wilder-smoothed RSI value (NaN until n bars are available)."""
+    return _wilder_rsi_last(_as_float_array(close), int(n))
+
+
+def macd_last(close, fast: int = 12, slow: int = 26, signal: int = 9):
+    """Latest MACD line and signal line values as a tuple of floats."""
+    return _macd_last(_as_float_array(close), int(fast), int(slow), int(signal))
+
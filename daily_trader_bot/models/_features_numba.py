@@ -0,0 +1,166 @@
+"""
+Numba kernel computing the PricePredictor feature matrix.
+
+All features are produced in one pass over contiguous float64 OHLCV arrays
+and written into a preallocated 2-D array whose columns follow
+FEATURE_COLUMNS. Values match PricePredictor's pandas implementation,
+including NaN for warm-up rows.
+"""
+
+import numpy as np
+
+from ..indicators._jit import NUMBA_AVAILABLE, njit, _wilder_rsi
+
+FEATURE_COLUMNS = (
+    'returns', 'log_returns',
+    'sma_5', 'ema_5', 'price_to_sma_5',
+    'sma_10', 'ema_10', 'price_to_sma_10',
+    'sma_20', 'ema_20', 'price_to_sma_20',
+    'sma_50', 'ema_50', 'price_to_sma_50',
+    'momentum_5', 'momentum_10', 'roc_5',
+    'volatility_10', 'volatility_20',
+    'rsi',
+    'macd', 'macd_signal', 'macd_diff',
+    'bb_middle', 'bb_upper', 'bb_lower', 'bb_width', 'bb_position',
+    'volume_sma_20', 'volume_ratio',
+    'high_low_ratio', 'close_open_ratio',
+)
+N_FEATURES = len(FEATURE_COLUMNS)
+
+
+@njit("void(float64[:], int64, float64[:])", cache=True)
+def _sma(arr, window, out):
+    """Simple moving average with a running sum."""
+    total = 0.0
+    for i in range(arr.shape[0]):
+        total += arr[i]
+        if i >= window:
+            total -= arr[i - window]
+        out[i] = total / window if i >= window - 1 else np.nan
+
+
+@njit("void(float64[:], float64, float64[:])", cache=True)
+def _ewm(arr, alpha, out):
+    """Exponentially weighted mean (pandas ``ewm(adjust=False)``)."""
+    if arr.shape[0] == 0:
+        return
+    state = arr[0]
+    out[0] = state
+    for i in range(1, arr.shape[0]):
+        state = alpha * arr[i] + (1.0 - alpha) * state
+        out[i] = state
+
+
+@njit("float64[:, :](float64[:], float64[:])", cache=True)
+def _ewm_bank(arr, alphas):
+    """Several exponentially weighted means of ``arr`` computed in one pass (one row per alpha)."""
+    n = arr.shape[0]
+    k = alphas.shape[0]
+    out = np.empty((k, n))
+    if n == 0:
+        return out
+    state = np.full(k, arr[0])
+    out[:, 0] = state
+    for i in range(1, n):
+        x = arr[i]
+        for j in range(k):
+            state[j] = alphas[j] * x + (1.0 - alphas[j]) * state[j]
+            out[j, i] = state[j]
+    return out
+
+
+@njit("void(float64[:], int64, float64[:])", cache=True)
+def _rolling_std(arr, window, out):
+    """Rolling sample standard deviation using Welford's sliding-window update."""
+    mean = 0.0
+    m2 = 0.0
+    for i in range(arr.shape[0]):
+        x = arr[i]
+        if i < window:
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+        else:
+            y = arr[i - window]
+            old_mean = mean
+            mean += (x - y) / window
+            m2 += (x - y) * (x - mean + y - old_mean)
+        out[i] = np.sqrt(max(m2, 0.0) / (window - 1)) if i >= window - 1 else np.nan
+
+
+@njit(
+    "float64[:, :](float64[:], float64[:], float64[:], float64[:], float64[:])",
+    cache=True
+)
+def engineer_features(open_, high, low, close, volume):
+    """Compute the feature matrix (rows x FEATURE_COLUMNS) from OHLCV arrays."""
+    n = close.shape[0]
+    # Column-major, so each feature column is written contiguously
+    out = np.full((N_FEATURES, n), np.nan).T
+    tmp = np.empty(n)
+
+    # Returns
+    for i in range(1, n):
+        out[i, 0] = (close[i] - close[i - 1]) / close[i - 1]
+        out[i, 1] = np.log(close[i] / close[i - 1])
+
+    # All EMAs of the close (spans 5, 10, 20, 50 and MACD's 12, 26) in one pass
+    spans = np.array([5.0, 10.0, 20.0, 50.0, 12.0, 26.0])
+    emas = _ewm_bank(close, 2.0 / (spans + 1.0))
+
+    # Moving averages and price relative to the SMA
+    col = 2
+    for k, period in enumerate((5, 10, 20, 50)):
+        _sma(close, period, out[:, col])
+        out[:, col + 1] = emas[k]
+        for i in range(period - 1, n):
+            out[i, col + 2] = close[i] / out[i, col]
+        col += 3
+
+    # Momentum
+    for i in range(5, n):
+        out[i, 14] = close[i] - close[i - 5]
+        out[i, 16] = (close[i] - close[i - 5]) / close[i - 5] * 100
+    for i in range(10, n):
+        out[i, 15] = close[i] - close[i - 10]
+
+    # Volatility of returns (the first return is undefined, so skip it)
+    if n > 1:
+        _rolling_std(out[1:, 0], 10, out[1:, 17])
+        _rolling_std(out[1:, 0], 20, out[1:, 18])
+
+    # RSI (Wilder smoothing)
+    out[:, 19] = _wilder_rsi(close, 14)
+
+    # MACD (the signal line is an EMA of the MACD, so it needs a second pass)
+    for i in range(n):
+        out[i, 20] = emas[4, i] - emas[5, i]
+    _ewm(out[:, 20], 0.2, out[:, 21])
+    for i in range(n):
+        out[i, 22] = out[i, 20] - out[i, 21]
+
+    # Bollinger Bands around the 20-period SMA
+    _rolling_std(close, 20, tmp)
+    for i in range(19, n):
+        middle = out[i, 8]
+        upper = middle + 2.0 * tmp[i]
+        lower = middle - 2.0 * tmp[i]
+        out[i, 23] = middle
+        out[i, 24] = upper
+        out[i, 25] = lower
+        out[i, 26] = (upper - lower) / middle
+        if upper != lower:
+            out[i, 27] = (close[i] - lower) / (upper - lower)
+
+    # Volume
+    _sma(volume, 20, out[:, 28])
+    for i in range(19, n):
+        if out[i, 28] != 0:
+            out[i, 29] = volume[i] / out[i, 28]
+
+    # Price ranges
+    for i in range(n):
+        out[i, 30] = high[i] / low[i]
+        out[i, 31] = close[i] / open_[i]
+
+    return out
@@ -1,26 +1,105 @@
 """
 Machine learning price prediction model.
 
-This module provides price prediction capabilities using Random Forest
-with technical indicators as features.
+This module provides price prediction capabilities using histogram-based
+gradient boosting with technical indicators as features.
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from datetime import datetime
 import joblib
 import os
 
+from ._features_numba import FEATURE_COLUMNS, NUMBA_AVAILABLE, engineer_features
+
+# scikit-learn classes used by train(), imported on first use
+_sklearn: Optional[Dict] = None
+
+
+def _ensure_sklearn() -> Dict:
+    """Import the scikit-learn pieces needed for training (once per process)."""
+    global _sklearn
+    if _sklearn is None:
+        try:
+            from sklearn.ensemble import HistGradientBoostingRegressor
+            from sklearn.inspection import permutation_importance
+        except ImportError:
+            raise ImportError("scikit-learn is required for price prediction. Install dependencies with: pip install -r requirements.txt")
+        _sklearn = {
+            'HistGradientBoostingRegressor': HistGradientBoostingRegressor,
+            'permutation_importance': permutation_importance,
+        }
+    return _sklearn
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean over a zero-copy (windows x window) view of the values.
+    
+    Unlike a running sum, a NaN only affects the windows that contain it
+    (as with pandas ``rolling().mean()``).
+    
+    Args:
+        values: 1-D float array
+        window: Window length
+        
+    Returns:
+        Array of the same length, NaN for the first window - 1 entries
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) < window:
+        return out
+    
+    out[window - 1:] = sliding_window_view(values, window).mean(axis=1)
+    return out
+
+
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling sample standard deviation (ddof=1) from cumulative sums.
+    
+    Values are centered on their mean first so the sum-of-squares
+    difference does not lose precision for large price levels.
+    
+    Args:
+        values: 1-D float array without NaNs
+        window: Window length
+        
+    Returns:
+        Array of the same length, NaN for the first window - 1 entries
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) < window:
+        return out
+    
+    centered = values - values.mean()
+    csum = np.concatenate(([0.0], np.cumsum(centered)))
+    csum2 = np.concatenate(([0.0], np.cumsum(centered * centered)))
+    window_sum = csum[window:] - csum[:-window]
+    window_sum2 = csum2[window:] - csum2[:-window]
+    var = (window_sum2 - window_sum * window_sum / window) / (window - 1)
+    out[window - 1:] = np.sqrt(np.maximum(var, 0.0))
+    return out
+
 
 class PricePredictor:
     """
     Price prediction model using machine learning.
     
-    Uses Random Forest regressor with technical indicators as features
-    to predict future stock prices.
+    Uses a histogram-based gradient boosting regressor with technical
+    indicators as features to predict future stock prices.
     """
 
+    # Longest rolling window used by the features (SMA 50)
+    MAX_WINDOW = 50
+    # Rows predict() needs for the last feature row: MAX_WINDOW for the
+    # rolling features, plus enough warm-up for the slowest EMA (span 50)
+    # to forget its seed value, since (49/51) ** 350 < 1e-6
+    PREDICT_LOOKBACK = MAX_WINDOW + 350
+
     def __init__(self, config: Dict):
         """
         Initialize price predictor.
@@ -32,9 +111,19 @@ class PricePredictor:
         self.model = None
         self.feature_names = []
         self.is_trained = False
-        self.scaler = None
-        
-        # Model parameters
+        self.scaler = None  # only set by models saved before gradient boosting
+        self.feature_importances = {}
+        # Held-out rows for computing feature_importances on first request
+        self._importance_data = None
+        # Incremented whenever the model is trained or loaded, so callers can
+        # tell when results computed with an earlier model are stale
+        self.version = 0
+        # Positions of feature_names in the engineered frame, for the column
+        # layout they were computed against
+        self._feature_idx = None
+        self._feature_idx_columns = None
+        
+        # Model parameters (n_estimators is the number of boosting iterations)
         self.n_estimators = config.get('n_estimators', 100)
         self.max_depth = config.get('max_depth', 10)
         self.random_state = config.get('random_state', 42)
@@ -43,64 +132,119 @@ class PricePredictor:
         """
         Create technical indicator features from price data.
         
+        Uses the compiled kernel when numba is installed and the pandas
+        implementation otherwise; both produce the same columns.
+        
         Args:
             data: DataFrame with OHLCV columns
             
         Returns:
             DataFrame with engineered features
         """
-        df = data.copy()
+        if not NUMBA_AVAILABLE:
+            return self._engineer_features_pandas(data)
         
-        # Price-based features
-        df['returns'] = df['Close'].pct_change()
-        df['log_returns'] = np.log(df['Close'] / df['Close'].shift(1))
+        # Column-major copy so each OHLCV column is a contiguous array
+        ohlcv = np.require(
+            data[['Open', 'High', 'Low', 'Close', 'Volume']].to_numpy(dtype=np.float64),
+            requirements=['F', 'W']
+        )
+        features = engineer_features(ohlcv[:, 0], ohlcv[:, 1], ohlcv[:, 2], ohlcv[:, 3], ohlcv[:, 4])
         
-        # Moving averages
+        return pd.concat(
+            [data, pd.DataFrame(features, columns=list(FEATURE_COLUMNS), index=data.index)],
+            axis=1
+        )
+
+    def _engineer_features_pandas(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Pandas implementation of _engineer_features (used without numba)."""
+        close = data['Close']
+        close_values = close.to_numpy(dtype=np.float64)
+        n = len(close_values)
+        # Features are collected as arrays and joined to the data in one step
+        cols = {}
+        
+        # Price-based features
+        prev_close = np.concatenate(([np.nan], close_values[:-1]))
+        returns = close_values / prev_close - 1
+        cols['returns'] = returns
+        cols['log_returns'] = np.log(close_values / prev_close)
+        
+        # Moving averages; SMAs come from one cumulative sum instead of a
+        # rolling pass per period
+        cumsum = np.concatenate(([0.0], np.cumsum(close_values)))
         for period in [5, 10, 20, 50]:
-            df[f'sma_{period}'] = df['Close'].rolling(window=period).mean()
-            df[f'ema_{period}'] = df['Close'].ewm(span=period, adjust=False).mean()
-            df[f'price_to_sma_{period}'] = df['Close'] / df[f'sma_{period}']
+            sma = np.full(n, np.nan)
+            if n >= period:
+                sma[period - 1:] = (cumsum[period:] - cumsum[:-period]) / period
+            cols[f'sma_{period}'] = sma
+            cols[f'ema_{period}'] = close.ewm(span=period, adjust=False).mean().to_numpy()
+            cols[f'price_to_sma_{period}'] = close_values / sma
         
         # Momentum indicators
-        df['momentum_5'] = df['Close'] - df['Close'].shift(5)
-        df['momentum_10'] = df['Close'] - df['Close'].shift(10)
-        df['roc_5'] = ((df['Close'] - df['Close'].shift(5)) / df['Close'].shift(5)) * 100
-        
-        # Volatility
-        df['volatility_10'] = df['returns'].rolling(window=10).std()
-        df['volatility_20'] = df['returns'].rolling(window=20).std()
-        
-        # RSI
-        delta = df['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        df['rsi'] = 100 - (100 / (1 + rs))
+        close_5 = close.shift(5).to_numpy()
+        cols['momentum_5'] = close_values - close_5
+        cols['momentum_10'] = close_values - close.shift(10).to_numpy()
+        cols['roc_5'] = ((close_values - close_5) / close_5) * 100
+        
+        # Volatility (the first return is undefined, so skip it)
+        for window in (10, 20):
+            volatility = np.full(n, np.nan)
+            volatility[1:] = _rolling_std(returns[1:], window)
+            cols[f'volatility_{window}'] = volatility
+        
+        # RSI with Wilder smoothing: an EWM with alpha 1/14 seeded by the
+        # simple average of the first 14 price changes
+        delta = np.diff(close_values)
+        rsi = np.full(n, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_gain = self._wilder_average(np.maximum(delta, 0.0), 14)
+            avg_loss = self._wilder_average(np.maximum(-delta, 0.0), 14)
+            rsi[1:] = 100 - (100 / (1 + avg_gain / avg_loss))
+        cols['rsi'] = rsi
         
         # MACD
-        exp1 = df['Close'].ewm(span=12, adjust=False).mean()
-        exp2 = df['Close'].ewm(span=26, adjust=False).mean()
-        df['macd'] = exp1 - exp2
-        df['macd_signal'] = df['macd'].ewm(span=9, adjust=False).mean()
-        df['macd_diff'] = df['macd'] - df['macd_signal']
-        
-        # Bollinger Bands
-        df['bb_middle'] = df['Close'].rolling(window=20).mean()
-        bb_std = df['Close'].rolling(window=20).std()
-        df['bb_upper'] = df['bb_middle'] + (bb_std * 2)
-        df['bb_lower'] = df['bb_middle'] - (bb_std * 2)
-        df['bb_width'] = (df['bb_upper'] - df['bb_lower']) / df['bb_middle']
-        df['bb_position'] = (df['Close'] - df['bb_lower']) / (df['bb_upper'] - df['bb_lower'])
+        exp1 = close.ewm(span=12, adjust=False).mean()
+        exp2 = close.ewm(span=26, adjust=False).mean()
+        macd = exp1 - exp2
+        macd_signal = macd.ewm(span=9, adjust=False).mean()
+        cols['macd'] = macd.to_numpy()
+        cols['macd_signal'] = macd_signal.to_numpy()
+        cols['macd_diff'] = cols['macd'] - cols['macd_signal']
+        
+        # Bollinger Bands (the middle band is the 20-period SMA)
+        bb_middle = cols['sma_20']
+        bb_std = _rolling_std(close_values, 20)
+        bb_upper = bb_middle + (bb_std * 2)
+        bb_lower = bb_middle - (bb_std * 2)
+        cols['bb_middle'] = bb_middle
+        cols['bb_upper'] = bb_upper
+        cols['bb_lower'] = bb_lower
+        cols['bb_width'] = (bb_upper - bb_lower) / bb_middle
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cols['bb_position'] = (close_values - bb_lower) / (bb_upper - bb_lower)
         
         # Volume features
-        df['volume_sma_20'] = df['Volume'].rolling(window=20).mean()
-        df['volume_ratio'] = df['Volume'] / df['volume_sma_20']
+        volume = data['Volume'].to_numpy(dtype=np.float64)
+        volume_sma_20 = _rolling_mean(volume, 20)
+        cols['volume_sma_20'] = volume_sma_20
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cols['volume_ratio'] = volume / volume_sma_20
         
         # Price range
-        df['high_low_ratio'] = df['High'] / df['Low']
-        df['close_open_ratio'] = df['Close'] / df['Open']
+        cols['high_low_ratio'] = data['High'].to_numpy(dtype=np.float64) / data['Low'].to_numpy(dtype=np.float64)
+        cols['close_open_ratio'] = close_values / data['Open'].to_numpy(dtype=np.float64)
         
-        return df
+        return pd.concat([data, pd.DataFrame(cols, index=data.index)], axis=1)
+
+    @staticmethod
+    def _wilder_average(values: np.ndarray, period: int) -> np.ndarray:
+        """Wilder-smoothed average, NaN for the first period - 1 entries."""
+        seeded = np.full(len(values), np.nan)
+        if len(values) >= period:
+            seeded[period - 1] = values[:period].mean()
+            seeded[period:] = values[period:]
+        return pd.Series(seeded).ewm(alpha=1 / period, adjust=False).mean().to_numpy()
 
     def train(self, data: pd.DataFrame) -> Dict:
         """
@@ -112,12 +256,7 @@ class PricePredictor:
         Returns:
             Dictionary with training results
         """
-        try:
-            from sklearn.ensemble import RandomForestRegressor
-            from sklearn.preprocessing import StandardScaler
-            from sklearn.model_selection import train_test_split
-        except ImportError:
-            raise ImportError("scikit-learn is required for price prediction. Install dependencies with: pip install -r requirements.txt")
+        sklearn = _ensure_sklearn()
         
         # Engineer features
         df = self._engineer_features(data)
@@ -125,49 +264,56 @@ class PricePredictor:
         # Create target (next day's close price)
         df['target'] = df['Close'].shift(-1)
         
-        # Drop NaN values
-        df = df.dropna()
+        # Drop rows with undefined features (warm-up) or no next close
+        df = df.dropna(subset=[*FEATURE_COLUMNS, 'target'])
         
         if len(df) < 50:
             raise ValueError("Insufficient data for training (need at least 50 samples)")
         
-        # Select features
-        feature_columns = [col for col in df.columns 
-                          if col not in ['Date', 'Open', 'High', 'Low', 'Close', 'Volume', 'target']]
+        # Only the engineered indicators are features; any other input
+        # columns (dates, corporate actions) are ignored
+        feature_columns = list(FEATURE_COLUMNS)
         
-        X = df[feature_columns].values
-        y = df['target'].values
+        # Features are binned from float32 internally, so build X in that dtype once
+        X = np.ascontiguousarray(df[feature_columns].to_numpy(), dtype=np.float32)
+        y = df['target'].to_numpy()
         
         self.feature_names = feature_columns
+        self._feature_idx = None
+        self._feature_idx_columns = None
         
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=self.random_state, shuffle=False
-        )
-        
-        # Scale features
-        self.scaler = StandardScaler()
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_test_scaled = self.scaler.transform(X_test)
+        # Chronological split: the last 20% of rows are held out
+        split = int(len(X) * 0.8)
+        X_train, X_test = X[:split], X[split:]
+        y_train, y_test = y[:split], y[split:]
         
-        # Train model
-        self.model = RandomForestRegressor(
-            n_estimators=self.n_estimators,
+        # Train model; binned trees need no feature scaling
+        self.scaler = None
+        self.model = sklearn['HistGradientBoostingRegressor'](
+            max_iter=self.n_estimators,
             max_depth=self.max_depth,
-            random_state=self.random_state,
-            n_jobs=-1
+            learning_rate=0.05,
+            early_stopping=True,
+            validation_fraction=0.1,
+            random_state=self.random_state
         )
         
-        self.model.fit(X_train_scaled, y_train)
+        self.model.fit(X_train, y_train)
         self.is_trained = True
+        self.version += 1
         
         # Evaluate
-        train_score = self.model.score(X_train_scaled, y_train)
-        test_score = self.model.score(X_test_scaled, y_test)
+        train_score = self.model.score(X_train, y_train)
+        test_score = self.model.score(X_test, y_test)
         
         # Calculate RMSE
-        train_pred = self.model.predict(X_train_scaled)
-        test_pred = self.model.predict(X_test_scaled)
+        train_pred = self.model.predict(X_train)
+        test_pred = self.model.predict(X_test)
+        
+        # Importances cost several extra predictions, so they are only
+        # computed if get_feature_importance is called
+        self.feature_importances = {}
+        self._importance_data = (X_test, y_test)
         
         train_rmse = np.sqrt(np.mean((train_pred - y_train) ** 2))
         test_rmse = np.sqrt(np.mean((test_pred - y_test) ** 2))
@@ -194,19 +340,62 @@ class PricePredictor:
         if not self.is_trained:
             raise ValueError("Model must be trained before making predictions")
         
-        # Engineer features
-        df = self._engineer_features(data)
-        
         # Get latest row
-        latest = df.iloc[-1:][self.feature_names].values
+        latest = self._latest_features(data)[None, :]
         
-        # Scale features
-        latest_scaled = self.scaler.transform(latest)
+        # Scale features (models saved before gradient boosting only)
+        if self.scaler is not None:
+            latest = self.scaler.transform(latest)
         
         # Predict
-        predicted_price = self.model.predict(latest_scaled)[0]
-        current_price = data['Close'].iloc[-1]
+        predicted_price = self.model.predict(latest)[0]
+        return self._prediction_result(predicted_price, data['Close'].iloc[-1])
+
+    def predict_batch(self, datas: List[pd.DataFrame]) -> List:
+        """
+        Predict future prices for several price histories at once.
         
+        The latest feature row of each history is stacked into one matrix,
+        so the model is evaluated once for all of them.
+        
+        Args:
+            datas: DataFrames with OHLCV columns
+            
+        Returns:
+            List with one entry per history, in input order: the prediction
+            dictionary (as from predict), or the exception raised while
+            building that history's features
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before making predictions")
+        
+        results = [None] * len(datas)
+        rows = []
+        positions = []
+        for i, data in enumerate(datas):
+            try:
+                rows.append(self._latest_features(data))
+                positions.append(i)
+            except Exception as e:
+                results[i] = e
+        
+        if rows:
+            latest = np.stack(rows)
+            if self.scaler is not None:
+                latest = self.scaler.transform(latest)
+            for i, predicted_price in zip(positions, self.model.predict(latest)):
+                results[i] = self._prediction_result(predicted_price, datas[i]['Close'].iloc[-1])
+        return results
+
+    def _latest_features(self, data: pd.DataFrame) -> np.ndarray:
+        """Feature vector for the last row of data, in feature_names order."""
+        # Only the latest row is used, so skip rows that cannot affect it
+        df = self._engineer_features(data.iloc[-self.PREDICT_LOOKBACK:])
+        return df.iloc[-1, self._feature_positions(df.columns)].to_numpy(dtype=np.float32)
+
+    @staticmethod
+    def _prediction_result(predicted_price: float, current_price: float) -> Dict:
+        """Prediction dictionary returned by predict."""
         # Calculate prediction metrics
         predicted_change = predicted_price - current_price
         predicted_change_pct = (predicted_change / current_price) * 100
@@ -219,6 +408,17 @@ class PricePredictor:
             'timestamp': datetime.now().isoformat()
         }
 
+    def _feature_positions(self, columns: pd.Index) -> np.ndarray:
+        """Integer positions of feature_names in columns (cached per column layout)."""
+        if self._feature_idx_columns is None or not columns.equals(self._feature_idx_columns):
+            idx = columns.get_indexer(self.feature_names)
+            if (idx < 0).any():
+                missing = [name for name, i in zip(self.feature_names, idx) if i < 0]
+                raise KeyError(f"Missing feature columns: {missing}")
+            self._feature_idx = idx
+            self._feature_idx_columns = columns
+        return self._feature_idx
+
     def get_feature_importance(self) -> Dict[str, float]:
         """
         Get feature importance scores.
@@ -229,8 +429,21 @@ class PricePredictor:
         if not self.is_trained:
             return {}
         
-        importances = self.model.feature_importances_
-        return dict(zip(self.feature_names, importances))
+        if hasattr(self.model, 'feature_importances_'):
+            return dict(zip(self.feature_names, self.model.feature_importances_))
+        
+        if not self.feature_importances and self._importance_data is not None:
+            # Gradient boosting has no impurity-based importances, so measure
+            # the validation score drop when each feature is shuffled
+            X_test, y_test = self._importance_data
+            importance = _ensure_sklearn()['permutation_importance'](
+                self.model, X_test, y_test, n_repeats=5, random_state=self.random_state
+            )
+            self.feature_importances = dict(
+                zip(self.feature_names, importance.importances_mean.tolist())
+            )
+            self._importance_data = None
+        return self.feature_importances
 
     def save(self, filepath: str) -> None:
         """
@@ -244,10 +457,13 @@ class PricePredictor:
         
         model_data = {
             'model': self.model,
-            'scaler': self.scaler,
             'feature_names': self.feature_names,
+            'feature_importances': self.get_feature_importance(),
             'config': self.config
         }
+        # Tree models are scale-invariant; only older models carry a scaler
+        if self.scaler is not None:
+            model_data['scaler'] = self.scaler
         
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         joblib.dump(model_data, filepath)
@@ -262,7 +478,12 @@ class PricePredictor:
         model_data = joblib.load(filepath)
         
         self.model = model_data['model']
-        self.scaler = model_data['scaler']
+        self.scaler = model_data.get('scaler')
         self.feature_names = model_data['feature_names']
+        self._feature_idx = None
+        self._feature_idx_columns = None
+        self.feature_importances = model_data.get('feature_importances', {})
+        self._importance_data = None
         self.config = model_data.get('config', self.config)
         self.is_trained = True
+        self.version += 1
@@ -5,10 +5,15 @@ This module implements a trading strategy that follows daily market trends
 using technical indicators, AI analysis, and price predictions.
 """
 
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
+from .. import indicators
+
 if TYPE_CHECKING:
     from ..data_sources.base import BaseDataSource
     from ..ai_providers.base import BaseAIProvider
@@ -53,7 +58,18 @@ class DailyTrendStrategy:
         self.min_confidence = self.config.get('min_confidence', 0.6)
         self.stop_loss_pct = self.config.get('stop_loss_pct', 0.05)
         self.take_profit_pct = self.config.get('take_profit_pct', 0.10)
+        # Price multipliers for the stop-loss / take-profit levels of buy signals
+        self._stop_loss_mult = 1 - self.stop_loss_pct
+        self._take_profit_mult = 1 + self.take_profit_pct
         self.debug = bool(self.config.get('debug', False))
+        
+        # (symbol, lookback_days) -> (stamp, history, analysis); the stamp
+        # identifies the latest bar and the model the analysis was built from
+        self._trend_cache: Dict[Tuple[str, int], Tuple[tuple, pd.DataFrame, Dict]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget trend analyses cached by analyze_trend and generate_trading_signal."""
+        self._trend_cache = {}
 
     def _dbg(self, msg: str) -> None:
         """Print a debug message when strategy.debug is enabled."""
@@ -70,109 +86,243 @@ class DailyTrendStrategy:
         Returns:
             Dictionary of technical indicators
         """
-        df = data.copy()
+        return self.calculate_technical_indicators_batch([data])[0]
+
+    def calculate_technical_indicators_batch(self, frames: List[pd.DataFrame]) -> List[Dict]:
+        """
+        Calculate technical indicators for several price histories at once.
+        
+        Histories of equal length are stacked into 2-D arrays (one row per
+        history), so each indicator is a single reduction over the last axis
+        for the whole group.
         
+        Args:
+            frames: DataFrames with historical price data
+            
+        Returns:
+            List of indicator dictionaries, in input order
+        """
+        results = [None] * len(frames)
+        groups = {}
+        for i, data in enumerate(frames):
+            groups.setdefault(len(data), []).append(i)
+        
+        for length, positions in groups.items():
+            close = self._stack_column(frames, positions, 'Close', length)
+            volume = self._stack_column(frames, positions, 'Volume', length)
+            for i, result in zip(positions, self._stacked_indicators(close, volume)):
+                results[i] = result
+        
+        return results
+
+    @staticmethod
+    def _stack_column(frames: List[pd.DataFrame], positions: List[int], column: str, length: int) -> np.ndarray:
+        """Copy one column of equal-length frames into a (frames x bars) float64 array."""
+        # Rows are filled in place, so integer columns (e.g. Volume) are cast
+        # during the single copy rather than converted and then stacked
+        stacked = np.empty((len(positions), length))
+        for row, i in enumerate(positions):
+            stacked[row] = frames[i][column].to_numpy()
+        return stacked
+
+    def _stacked_indicators(self, close: np.ndarray, volume: np.ndarray) -> List[Dict]:
+        """Indicators for stacked (histories x bars) close and volume arrays."""
         # Moving averages
-        sma_short = df['Close'].rolling(window=10).mean().iloc[-1]
-        sma_long = df['Close'].rolling(window=self.trend_period).mean().iloc[-1]
-        ema_short = df['Close'].ewm(span=10, adjust=False).mean().iloc[-1]
+        sma_short = self._tail_mean(close, 10)
+        sma_long = self._tail_mean(close, self.trend_period)
+        ema_short = np.array([indicators.ema_last(row, 10) for row in close])
         
         # Momentum
-        current_price = df['Close'].iloc[-1]
-        prev_price = df['Close'].iloc[-self.trend_period] if len(df) >= self.trend_period else df['Close'].iloc[0]
+        current_price = close[:, -1]
+        prev_price = close[:, -self.trend_period] if close.shape[1] >= self.trend_period else close[:, 0]
         momentum = ((current_price - prev_price) / prev_price) * 100
         
         # Volume analysis
-        avg_volume = df['Volume'].rolling(window=20).mean().iloc[-1]
-        current_volume = df['Volume'].iloc[-1]
-        volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
+        avg_volume = self._tail_mean(volume, 20)
+        current_volume = volume[:, -1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volume_ratio = np.where(avg_volume > 0, current_volume / avg_volume, 1.0)
         
         # Volatility
-        returns = df['Close'].pct_change()
-        volatility = returns.std() * 100
+        returns = close[:, 1:] / close[:, :-1] - 1
+        volatility = self._std(returns) * 100
         
         # RSI (Relative Strength Index)
-        rsi = self._calculate_rsi(df['Close'])
+        rsi = np.array([self._calculate_rsi(row) for row in close])
         
         # MACD
-        macd, signal = self._calculate_macd(df['Close'])
+        macd = np.array([self._calculate_macd(row) for row in close]).reshape(-1, 2)
         
         # Bollinger Bands
-        bb_upper, bb_middle, bb_lower = self._calculate_bollinger_bands(df['Close'])
+        bb_upper, bb_middle, bb_lower = self._calculate_bollinger_bands(close)
         
         # Trend strength
-        trend_strength = abs(momentum) / volatility if volatility > 0 else 0
-        
-        return {
-            'sma_short': float(sma_short),
-            'sma_long': float(sma_long),
-            'ema_short': float(ema_short),
-            'current_price': float(current_price),
-            'momentum': float(momentum),
-            'volume_ratio': float(volume_ratio),
-            'volatility': float(volatility),
-            'rsi': float(rsi),
-            'macd': float(macd),
-            'macd_signal': float(signal),
-            'bb_upper': float(bb_upper),
-            'bb_middle': float(bb_middle),
-            'bb_lower': float(bb_lower),
-            'trend_strength': float(trend_strength)
-        }
+        with np.errstate(divide='ignore', invalid='ignore'):
+            trend_strength = np.where(volatility > 0, np.abs(momentum) / volatility, 0.0)
+        
+        return [
+            {
+                'sma_short': float(sma_short[i]),
+                'sma_long': float(sma_long[i]),
+                'ema_short': float(ema_short[i]),
+                'current_price': float(current_price[i]),
+                'momentum': float(momentum[i]),
+                'volume_ratio': float(volume_ratio[i]),
+                'volatility': float(volatility[i]),
+                'rsi': float(rsi[i]),
+                'macd': float(macd[i, 0]),
+                'macd_signal': float(macd[i, 1]),
+                'bb_upper': float(bb_upper[i]),
+                'bb_middle': float(bb_middle[i]),
+                'bb_lower': float(bb_lower[i]),
+                'trend_strength': float(trend_strength[i])
+            }
+            for i in range(close.shape[0])
+        ]
 
-    def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> float:
-        """Calculate Relative Strength Index."""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+    def _calculate_rsi(self, close: np.ndarray, period: int = 14) -> float:
+        """Calculate Relative Strength Index (Wilder smoothing)."""
+        if not len(close):
+            return 50.0
         
-        return rsi.iloc[-1] if not rsi.empty else 50.0
+        return indicators.wilder_rsi_last(close, period)
 
-    def _calculate_macd(self, prices: pd.Series) -> tuple:
+    def _calculate_macd(self, close: np.ndarray) -> tuple:
         """Calculate MACD and signal line."""
-        ema_12 = prices.ewm(span=12, adjust=False).mean()
-        ema_26 = prices.ewm(span=26, adjust=False).mean()
-        macd = ema_12 - ema_26
-        signal = macd.ewm(span=9, adjust=False).mean()
-        
-        return macd.iloc[-1], signal.iloc[-1]
+        return indicators.macd_last(close, 12, 26, 9)
+
+    @staticmethod
+    def _tail_mean(values: np.ndarray, window: int) -> np.ndarray:
+        """Mean of the last ``window`` values along the last axis (NaN if there are fewer)."""
+        if values.shape[-1] < window:
+            return np.full(values.shape[:-1], np.nan)
+        return values[..., -window:].mean(axis=-1)
+
+    @staticmethod
+    def _std(values: np.ndarray) -> np.ndarray:
+        """Sample standard deviation along the last axis, ignoring NaNs (NaN for fewer than two values)."""
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=-1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(valid, values, 0.0).sum(axis=-1) / count
+            deviation = np.where(valid, values - mean[..., None], 0.0)
+            var = (deviation * deviation).sum(axis=-1) / (count - 1)
+        return np.where(count > 1, np.sqrt(var), np.nan)
 
-    def _calculate_bollinger_bands(self, prices: pd.Series, period: int = 20, std_dev: int = 2) -> tuple:
-        """Calculate Bollinger Bands."""
-        sma = prices.rolling(window=period).mean()
-        std = prices.rolling(window=period).std()
+    def _calculate_bollinger_bands(self, close: np.ndarray, period: int = 20, std_dev: int = 2) -> tuple:
+        """Calculate Bollinger Bands along the last axis."""
+        if close.shape[-1] < period:
+            nan = np.full(close.shape[:-1], np.nan)
+            return nan, nan, nan
+        
+        # One mean and one sum of squares over the window (ndarray.std
+        # would recompute the mean)
+        window = close[..., -period:]
+        sma = window.mean(axis=-1)
+        deviation = window - sma[..., None]
+        std = np.sqrt((deviation * deviation).sum(axis=-1) / (period - 1))
         
         upper = sma + (std * std_dev)
         lower = sma - (std * std_dev)
         
-        return upper.iloc[-1], sma.iloc[-1], lower.iloc[-1]
+        return upper, sma, lower
 
-    def analyze_trend(self, symbol: str, lookback_days: int = 60) -> Dict:
-        """
-        Analyze the trend for a symbol.
+    def _fetch_histories(self, symbols: List[str], lookback_days: int) -> Dict[str, pd.DataFrame]:
+        """Fetch daily bars for several symbols in one batch; failures are omitted."""
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=lookback_days)
         
-        Args:
-            symbol: Stock symbol
-            lookback_days: Number of days to look back
-            
-        Returns:
-            Dictionary with trend analysis
-        """
+        try:
+            return self.data_source.get_historical_data_batch(symbols, start_date, end_date)
+        except Exception:
+            return {}
+
+    def _fetch_history(self, symbol: str, lookback_days: int) -> pd.DataFrame:
+        """Fetch daily bars for the last ``lookback_days`` days."""
         end_date = datetime.now()
         start_date = end_date - timedelta(days=lookback_days)
         
-        # Fetch historical data
-        historical_data = self.data_source.get_historical_data(
+        return self.data_source.get_historical_data(
             symbol=symbol,
             start_date=start_date,
             end_date=end_date
         )
+
+    def _fetch_histories_parallel(
+        self,
+        symbols: List[str],
+        lookback_days: int,
+        parallelism: int
+    ) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Exception]]:
+        """
+        Fetch histories in one batch, then fetch symbols it missed on a thread pool.
+        
+        Args:
+            symbols: List of stock symbols
+            lookback_days: Number of days to look back
+            parallelism: Number of threads for the per-symbol fetches
+            
+        Returns:
+            Tuple of (histories by symbol, fetch errors by symbol)
+        """
+        histories = self._fetch_histories(symbols, lookback_days)
+        missing = [symbol for symbol in dict.fromkeys(symbols) if symbol not in histories]
+        errors = {}
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, min(parallelism, len(missing)))) as pool:
+                futures = {symbol: pool.submit(self._fetch_history, symbol, lookback_days) for symbol in missing}
+            for symbol, future in futures.items():
+                try:
+                    histories[symbol] = future.result()
+                except Exception as e:
+                    errors[symbol] = e
+        return histories, errors
+
+    def _batch_indicators(self, symbols: List[str], histories: Dict[str, pd.DataFrame]) -> Dict[str, Optional[Dict]]:
+        """Technical indicators for the fetched symbols, computed together."""
+        try:
+            batch = self.calculate_technical_indicators_batch([histories[symbol] for symbol in symbols])
+        except Exception:
+            # Fall back to per-symbol indicators so one bad history only fails its symbol
+            batch = [None] * len(symbols)
+        return dict(zip(symbols, batch))
+
+    def _batch_predictions(self, symbols: List[str], histories: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
+        """Price predictions for the fetched symbols from one model evaluation (empty without a trained model)."""
+        if not (self.price_predictor and self.price_predictor.is_trained) or not symbols:
+            return {}
+        try:
+            batch = self.price_predictor.predict_batch([histories[symbol] for symbol in symbols])
+        except Exception:
+            # Fall back to per-symbol predictions so one bad row only fails its symbol
+            return {}
+        return {
+            symbol: {"error": str(result)} if isinstance(result, Exception) else result
+            for symbol, result in zip(symbols, batch)
+        }
+
+    def _analyze_history(
+        self,
+        symbol: str,
+        historical_data: pd.DataFrame,
+        indicators: Optional[Dict] = None,
+        prediction: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Build the trend analysis for already-fetched data, without AI analysis.
         
+        Args:
+            symbol: Stock symbol
+            historical_data: DataFrame with historical price data
+            indicators: Precomputed technical indicators, if available
+            prediction: Precomputed price prediction, if available
+            
+        Returns:
+            Dictionary with trend analysis ('ai_analysis' left as None)
+        """
         # Calculate technical indicators
-        indicators = self.calculate_technical_indicators(historical_data)
+        if indicators is None:
+            indicators = self.calculate_technical_indicators(historical_data)
         
         # Determine trend direction
         trend_direction = self._determine_trend_direction(indicators)
@@ -180,20 +330,8 @@ class DailyTrendStrategy:
         # Calculate trend strength
         trend_strength = indicators['trend_strength']
         
-        # Use AI for analysis if available
-        ai_analysis = None
-        if self.ai_provider:
-            try:
-                ai_analysis = self.ai_provider.analyze_market_data(
-                    historical_data=historical_data,
-                    additional_context=f"Symbol: {symbol}, Trend Direction: {trend_direction}"
-                )
-            except Exception as e:
-                ai_analysis = {"error": str(e)}
-        
         # Use price predictor if available
-        prediction = None
-        if self.price_predictor and self.price_predictor.is_trained:
+        if prediction is None and self.price_predictor and self.price_predictor.is_trained:
             try:
                 prediction = self.price_predictor.predict(historical_data)
             except Exception as e:
@@ -204,74 +342,166 @@ class DailyTrendStrategy:
             'trend_direction': trend_direction,
             'trend_strength': trend_strength,
             'indicators': indicators,
-            'ai_analysis': ai_analysis,
+            'ai_analysis': None,
             'price_prediction': prediction,
             'timestamp': datetime.now().isoformat()
         }
 
-    def _determine_trend_direction(self, indicators: Dict) -> str:
+    def analyze_trend(self, symbol: str, lookback_days: int = 60) -> Dict:
         """
-        Determine trend direction from indicators.
+        Analyze the trend for a symbol.
+        
+        Results are cached per symbol and lookback until a new or updated
+        bar arrives or the price model changes (see clear_cache). Each call
+        returns a new dictionary, but its values are shared with the cache.
         
         Args:
-            indicators: Dictionary of technical indicators
+            symbol: Stock symbol
+            lookback_days: Number of days to look back
             
         Returns:
-            String: 'bullish', 'bearish', or 'neutral'
+            Dictionary with trend analysis
+        """
+        return self._analyze_trend(symbol, lookback_days)[1]
+
+    def analyze_trends(
+        self,
+        symbols: List[str],
+        lookback_days: int = 60,
+        parallelism: int = 16
+    ) -> Dict[str, Dict]:
         """
-        bullish_signals = 0
-        bearish_signals = 0
+        Analyze the trends of several symbols.
         
-        # Moving average crossover
-        if indicators['sma_short'] > indicators['sma_long']:
-            bullish_signals += 1
-        else:
-            bearish_signals += 1
+        Histories are fetched concurrently (see generate_trading_signals_batch)
+        and indicators are computed for all symbols together; AI analysis, if
+        any, runs sequentially as in analyze_trend.
         
-        # RSI
-        if indicators['rsi'] < 30:
-            bullish_signals += 1  # Oversold
-        elif indicators['rsi'] > 70:
-            bearish_signals += 1  # Overbought
+        Args:
+            symbols: List of stock symbols
+            lookback_days: Number of days to look back
+            parallelism: Number of threads for fetching missing histories
+            
+        Returns:
+            Dictionary mapping each symbol to its trend analysis, or to the
+            exception raised while analyzing it
+        """
+        histories, results = self._fetch_histories_parallel(symbols, lookback_days, parallelism)
+        fetched = [symbol for symbol in dict.fromkeys(symbols) if symbol in histories]
+        indicators_by_symbol = self._batch_indicators(fetched, histories)
+        predictions = self._batch_predictions(fetched, histories)
         
-        # MACD
-        if indicators['macd'] > indicators['macd_signal']:
-            bullish_signals += 1
-        else:
-            bearish_signals += 1
+        for symbol in fetched:
+            try:
+                historical_data = histories[symbol]
+                analysis = self._analyze_history(
+                    symbol, historical_data, indicators_by_symbol[symbol], predictions.get(symbol)
+                )
+                self._add_ai_analysis(symbol, historical_data, analysis)
+                results[symbol] = analysis
+            except Exception as e:
+                results[symbol] = e
         
-        # Momentum
-        if indicators['momentum'] > 0:
-            bullish_signals += 1
+        return {symbol: results[symbol] for symbol in dict.fromkeys(symbols)}
+
+    def _analyze_trend(self, symbol: str, lookback_days: int) -> Tuple[pd.DataFrame, Dict]:
+        """analyze_trend, also returning the fetched history for reuse."""
+        # The data source caches histories briefly, so fetching is cheap; the
+        # analysis (and its AI requests) is only redone when the latest bar
+        # or the price model differs from the cached one
+        historical_data = self._fetch_history(symbol, lookback_days)
+        stamp = self._analysis_stamp(historical_data)
+        
+        key = (symbol, lookback_days)
+        cached = self._trend_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1], dict(cached[2])
+        
+        analysis = self._analyze_history(symbol, historical_data)
+        self._add_ai_analysis(symbol, historical_data, analysis)
+        
+        # A failed AI request is retried on the next call instead of replayed
+        ai_analysis = analysis.get('ai_analysis')
+        if isinstance(ai_analysis, dict) and 'error' in ai_analysis:
+            self._trend_cache.pop(key, None)
         else:
-            bearish_signals += 1
+            self._trend_cache[key] = (stamp, historical_data, analysis)
+        return historical_data, dict(analysis)
+
+    def _analysis_stamp(self, historical_data: pd.DataFrame) -> tuple:
+        """Identify the inputs of an analysis: the latest bar and the price model version."""
+        last = historical_data.iloc[-1] if len(historical_data) else {}
+        return (
+            len(historical_data),
+            last.get('Date'),
+            last.get('Close'),
+            last.get('Volume'),
+            getattr(self.price_predictor, 'version', None),
+        )
+
+    def _add_ai_analysis(self, symbol: str, historical_data: pd.DataFrame, analysis: Dict) -> None:
+        """Fill in analysis['ai_analysis'] if an AI provider is configured."""
+        if self.ai_provider:
+            try:
+                analysis['ai_analysis'] = self.ai_provider.analyze_market_data(
+                    historical_data=historical_data,
+                    additional_context=f"Symbol: {symbol}, Trend Direction: {analysis['trend_direction']}"
+                )
+            except Exception as e:
+                analysis['ai_analysis'] = {"error": str(e)}
+
+    @staticmethod
+    def _recent_history(historical_data: pd.DataFrame, days: int) -> pd.DataFrame:
+        """Rows within ``days`` calendar days of the last bar (the last ``days`` rows without dates)."""
+        if 'Date' in historical_data.columns and len(historical_data):
+            dates = historical_data['Date']
+            cutoff = dates.iloc[-1] - pd.Timedelta(days=days)
+            if dates.is_monotonic_increasing:
+                # Bars are in date order, so the window is a positional slice
+                return historical_data.iloc[dates.searchsorted(cutoff, side='right'):]
+            return historical_data[dates > cutoff]
+        return historical_data.tail(days)
+
+    def _determine_trend_direction(self, indicators: Dict) -> str:
+        """
+        Determine trend direction from indicators.
         
-        # Bollinger Bands
-        if indicators['current_price'] < indicators['bb_lower']:
-            bullish_signals += 1
-        elif indicators['current_price'] > indicators['bb_upper']:
-            bearish_signals += 1
+        Args:
+            indicators: Dictionary of technical indicators
+            
+        Returns:
+            String: 'bullish', 'bearish', or 'neutral'
+        """
+        sma_short, sma_long, rsi, macd, macd_signal, momentum, price, bb_lower, bb_upper = (
+            indicators['sma_short'], indicators['sma_long'], indicators['rsi'],
+            indicators['macd'], indicators['macd_signal'], indicators['momentum'],
+            indicators['current_price'], indicators['bb_lower'], indicators['bb_upper']
+        )
+        
+        # Net score of bullish minus bearish signals. Crossover, MACD and
+        # momentum count as bearish whenever the comparison fails (also on NaN)
+        score = (
+            2 * (sma_short > sma_long) - 1      # Moving average crossover
+            + (rsi < 30) - (rsi > 70)           # RSI oversold / overbought
+            + 2 * (macd > macd_signal) - 1      # MACD
+            + 2 * (momentum > 0) - 1            # Momentum
+            + (price < bb_lower or -(price > bb_upper))  # Bollinger Bands
+        )
         
-        if bullish_signals > bearish_signals + 1:
+        if score > 1:
             return 'bullish'
-        elif bearish_signals > bullish_signals + 1:
+        elif score < -1:
             return 'bearish'
         else:
             return 'neutral'
 
-    def generate_trading_signal(self, symbol: str) -> Dict:
+    def _rule_based_signal(self, symbol: str, analysis: Dict) -> Tuple[str, float, List[str]]:
         """
-        Generate a trading signal for a symbol.
+        Derive action and confidence from the trend analysis alone.
         
-        Args:
-            symbol: Stock symbol
-            
         Returns:
-            Dictionary with trading signal and reasoning
+            Tuple of (action, confidence, reasoning)
         """
-        # Analyze trend
-        analysis = self.analyze_trend(symbol)
-        
         trend_direction = analysis['trend_direction']
         indicators = analysis['indicators']
         
@@ -324,28 +554,35 @@ class DailyTrendStrategy:
             confidence *= 0.8
             reasoning.append(f"High volatility ({indicators['volatility']:.2f}%) reduces confidence")
         
-        # Use AI signal if available
-        if self.ai_provider and confidence < 0.9:
-            try:
-                ai_signal = self.ai_provider.generate_trading_signal(
-                    symbol=symbol,
-                    historical_data=self.data_source.get_historical_data(
-                        symbol, 
-                        datetime.now() - timedelta(days=30), 
-                        datetime.now()
-                    ),
-                    technical_indicators=indicators
-                )
-                
-                if 'action' in ai_signal:
-                    # Combine signals
-                    if ai_signal['action'] == action:
-                        confidence = min(0.95, confidence + 0.15)
-                        reasoning.append(f"AI confirms signal with {ai_signal.get('confidence', 0.5):.2f} confidence")
-                    else:
-                        reasoning.append(f"AI suggests {ai_signal['action']} instead")
-            except Exception as e:
-                reasoning.append(f"AI analysis unavailable: {str(e)}")
+        return action, confidence, reasoning
+
+    @staticmethod
+    def _combine_ai_signal(
+        ai_signal: Dict,
+        action: str,
+        confidence: float,
+        reasoning: List[str]
+    ) -> float:
+        """Fold an AI signal into the confidence; appends to reasoning in place."""
+        if 'action' in ai_signal:
+            # Combine signals
+            if ai_signal['action'] == action:
+                confidence = min(0.95, confidence + 0.15)
+                reasoning.append(f"AI confirms signal with {ai_signal.get('confidence', 0.5):.2f} confidence")
+            else:
+                reasoning.append(f"AI suggests {ai_signal['action']} instead")
+        return confidence
+
+    def _finalize_signal(
+        self,
+        symbol: str,
+        analysis: Dict,
+        action: str,
+        confidence: float,
+        reasoning: List[str]
+    ) -> Dict:
+        """Apply the price prediction and confidence threshold, then build the signal."""
+        current_price = analysis['indicators']['current_price']
         
         # Use price prediction if available
         if analysis.get('price_prediction') and 'predicted_price' in analysis['price_prediction']:
@@ -368,14 +605,183 @@ class DailyTrendStrategy:
             action = 'hold'
             reasoning.append(f"Confidence {confidence:.2f} below threshold {self.min_confidence}")
         
+        if action == 'buy':
+            stop_loss = current_price * self._stop_loss_mult
+            take_profit = current_price * self._take_profit_mult
+        else:
+            stop_loss = take_profit = None
+        
         return {
             'symbol': symbol,
             'action': action,
             'confidence': confidence,
             'reasoning': reasoning,
-            'current_price': indicators['current_price'],
-            'stop_loss': indicators['current_price'] * (1 - self.stop_loss_pct) if action == 'buy' else None,
-            'take_profit': indicators['current_price'] * (1 + self.take_profit_pct) if action == 'buy' else None,
+            'current_price': current_price,
+            'stop_loss': stop_loss,
+            'take_profit': take_profit,
             'analysis': analysis,
             'timestamp': datetime.now().isoformat()
         }
+
+    def generate_trading_signal(self, symbol: str) -> Dict:
+        """
+        Generate a trading signal for a symbol.
+        
+        Args:
+            symbol: Stock symbol
+            
+        Returns:
+            Dictionary with trading signal and reasoning
+        """
+        # Analyze trend
+        historical_data, analysis = self._analyze_trend(symbol, 60)
+        return self._complete_signal(symbol, historical_data, analysis)
+
+    def generate_trading_signals_batch(self, symbols: List[str], parallelism: int = 8) -> List:
+        """
+        Generate trading signals for several symbols with batched indicators.
+        
+        Histories are fetched in one batch (symbols it misses are fetched on
+        a thread pool), and indicators for all symbols are computed together
+        with calculate_technical_indicators_batch. AI calls, if any, run
+        sequentially as in generate_trading_signal.
+        
+        Args:
+            symbols: List of stock symbols
+            parallelism: Number of threads for fetching missing histories
+            
+        Returns:
+            List with one entry per symbol, in input order: the signal
+            dictionary, or the exception raised while generating it
+        """
+        histories, errors = self._fetch_histories_parallel(symbols, 60, parallelism)
+        fetched = [symbol for symbol in dict.fromkeys(symbols) if symbol in histories]
+        indicators_by_symbol = self._batch_indicators(fetched, histories)
+        predictions = self._batch_predictions(fetched, histories)
+        
+        signals = {}
+        for symbol in fetched:
+            try:
+                historical_data = histories[symbol]
+                analysis = self._analyze_history(
+                    symbol, historical_data, indicators_by_symbol[symbol], predictions.get(symbol)
+                )
+                self._add_ai_analysis(symbol, historical_data, analysis)
+                signals[symbol] = self._complete_signal(symbol, historical_data, analysis)
+            except Exception as e:
+                errors[symbol] = e
+        
+        return [signals[symbol] if symbol in signals else errors[symbol] for symbol in symbols]
+
+    def _complete_signal(self, symbol: str, historical_data: pd.DataFrame, analysis: Dict) -> Dict:
+        """Combine the rule-based and AI signals for an analyzed symbol."""
+        action, confidence, reasoning = self._rule_based_signal(symbol, analysis)
+        
+        # Use AI signal if available; the last 30 days come from the
+        # 60-day history already fetched
+        if self.ai_provider and confidence < 0.9:
+            try:
+                ai_signal = self.ai_provider.generate_trading_signal(
+                    symbol=symbol,
+                    historical_data=self._recent_history(historical_data, 30),
+                    technical_indicators=analysis['indicators']
+                )
+                confidence = self._combine_ai_signal(ai_signal, action, confidence, reasoning)
+            except Exception as e:
+                reasoning.append(f"AI analysis unavailable: {str(e)}")
+        
+        return self._finalize_signal(symbol, analysis, action, confidence, reasoning)
+
+    async def _acomplete_signal(
+        self,
+        symbol: str,
+        historical_data: pd.DataFrame,
+        analysis: Dict
+    ) -> Dict:
+        """Run the AI stage of signal generation for an analyzed symbol."""
+        if self.ai_provider:
+            try:
+                analysis['ai_analysis'] = await self.ai_provider.aanalyze_market_data(
+                    historical_data=historical_data,
+                    additional_context=f"Symbol: {symbol}, Trend Direction: {analysis['trend_direction']}"
+                )
+            except Exception as e:
+                analysis['ai_analysis'] = {"error": str(e)}
+        
+        action, confidence, reasoning = self._rule_based_signal(symbol, analysis)
+        
+        if self.ai_provider and confidence < 0.9:
+            try:
+                ai_signal = await self.ai_provider.agenerate_trading_signal(
+                    symbol=symbol,
+                    historical_data=self._recent_history(historical_data, 30),
+                    technical_indicators=analysis['indicators']
+                )
+                confidence = self._combine_ai_signal(ai_signal, action, confidence, reasoning)
+            except Exception as e:
+                reasoning.append(f"AI analysis unavailable: {str(e)}")
+        
+        return self._finalize_signal(symbol, analysis, action, confidence, reasoning)
+
+    def _prepare_symbol(
+        self,
+        symbol: str,
+        historical_data: Optional[pd.DataFrame] = None,
+        prediction: Optional[Dict] = None
+    ) -> Tuple[pd.DataFrame, Dict]:
+        """Fetch (unless prefetched) and analyze the 60-day history of a symbol (data stage)."""
+        if historical_data is None:
+            historical_data = self._fetch_history(symbol, 60)
+        return historical_data, self._analyze_history(symbol, historical_data, prediction=prediction)
+
+    async def abatch_signals(
+        self,
+        symbols: List[str],
+        max_concurrency: int = 8,
+        parallelism: int = 8
+    ) -> List:
+        """
+        Generate trading signals for several symbols concurrently.
+        
+        Market data for all symbols is requested in one batch, and each
+        symbol is analyzed on a thread pool of ``parallelism`` workers
+        (fetching on its own if the batch had no data for it); as soon as it is ready the symbol's AI
+        requests are issued, with at most ``max_concurrency`` symbols in the
+        AI stage at a time.
+        
+        Args:
+            symbols: List of stock symbols
+            max_concurrency: Maximum number of symbols in the AI stage at once
+            parallelism: Number of threads for fetching and analyzing data
+            
+        Returns:
+            List with one entry per symbol, in input order: the signal
+            dictionary, or the exception raised while generating it
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def complete(symbol: str, pool: ThreadPoolExecutor):
+            historical_data, analysis = await loop.run_in_executor(
+                pool, self._prepare_symbol, symbol, histories.get(symbol), predictions.get(symbol)
+            )
+            async with semaphore:
+                return await self._acomplete_signal(symbol, historical_data, analysis)
+        
+        with ThreadPoolExecutor(max_workers=max(1, parallelism)) as pool:
+            histories = await loop.run_in_executor(pool, self._fetch_histories, symbols, 60)
+            # One model evaluation covers every prefetched symbol
+            predictions = await loop.run_in_executor(
+                pool, self._batch_predictions, list(histories), histories
+            )
+            if self.ai_provider is None:
+                return await asyncio.gather(
+                    *[complete(symbol, pool) for symbol in symbols],
+                    return_exceptions=True
+                )
+            # One async client (created on this loop) serves the whole batch
+            async with self.ai_provider.async_session():
+                return await asyncio.gather(
+                    *[complete(symbol, pool) for symbol in symbols],
+                    return_exceptions=True
+                )
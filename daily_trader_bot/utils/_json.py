@@ -0,0 +1,73 @@
+"""
+JSON encoding helpers shared by the persistence code.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both paths produce UTF-8 bytes, so files are written in binary mode,
+and both encode datetimes and NumPy values. NaN and infinities are written as
+null, as orjson does, since they are not valid JSON.
+"""
+
+import json
+import math
+from datetime import date, datetime, time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _finite(obj):
+    """Replace non-finite floats in obj (recursively) with None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _default(obj):
+    """Encode the values orjson handles natively for the stdlib encoder."""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    # NumPy scalars and arrays
+    tolist = getattr(obj, 'tolist', None)
+    if tolist is not None:
+        return _finite(tolist())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """
+    Serialize obj to JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation instead of compact output
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    obj = _finite(obj)
+    if indent:
+        return json.dumps(obj, indent=2, default=_default, allow_nan=False).encode()
+    return json.dumps(obj, separators=(",", ":"), default=_default, allow_nan=False).encode()
+
+
+def loads(data):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files saved by older versions may contain bare NaN/Infinity
+            # tokens, which only the stdlib parser accepts
+            pass
+    return json.loads(data)
@@ -5,9 +5,10 @@ This module handles loading and validating configuration from files or environme
 """
 
 import os
-import json
 from typing import Dict, Any, Optional
 
+from ._json import dumps, loads
+
 
 class Config:
     """
@@ -16,6 +17,13 @@ class Config:
     Loads configuration from JSON files or environment variables.
     """
 
+    # Keys that must be present (and not null) for validate() to pass
+    _REQUIRED_KEYS = frozenset({
+        'broker.type',
+        'data_source.type',
+        'strategy.trend_period'
+    })
+
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialize configuration.
@@ -24,6 +32,8 @@ class Config:
             config_file: Path to JSON configuration file
         """
         self.config = {}
+        # Every dot-notation key (including intermediate sections) -> value
+        self._flat: Dict[str, Any] = {}
         
         if config_file and os.path.exists(config_file):
             self.load_from_file(config_file)
@@ -37,8 +47,9 @@ class Config:
         Args:
             filepath: Path to configuration file
         """
-        with open(filepath, 'r') as f:
-            self.config = json.load(f)
+        with open(filepath, 'rb') as f:
+            self.config = loads(f.read())
+        self._rebuild_flat()
 
     def load_defaults(self) -> None:
         """Load default configuration."""
@@ -53,7 +64,7 @@ class Config:
             'ai_provider': {
                 'type': 'openai',
                 'api_key': os.environ.get('OPENAI_API_KEY', ''),
-                'model': 'gpt-3.5-turbo'
+                'model': 'gpt-4o-mini'
             },
             'strategy': {
                 'trend_period': 20,
@@ -73,6 +84,20 @@ class Config:
                 'default_quantity': 10
             }
         }
+        self._rebuild_flat()
+
+    def _rebuild_flat(self) -> None:
+        """Rebuild the dot-notation lookup table from the nested configuration."""
+        flat = {}
+        stack = [('', self.config)]
+        while stack:
+            prefix, section = stack.pop()
+            for k, value in section.items():
+                key = prefix + k
+                flat[key] = value
+                if isinstance(value, dict):
+                    stack.append((key + '.', value))
+        self._flat = flat
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -85,16 +110,7 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -108,11 +124,10 @@ class Config:
         config = self.config
         
         for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+            config = config.setdefault(k, {})
         
         config[keys[-1]] = value
+        self._rebuild_flat()
 
     def save_to_file(self, filepath: str) -> None:
         """
@@ -121,8 +136,8 @@ class Config:
         Args:
             filepath: Path to save configuration
         """
-        with open(filepath, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(dumps(self.config, indent=True))
 
     def validate(self) -> bool:
         """
@@ -131,17 +146,10 @@ class Config:
         Returns:
             True if valid, False otherwise
         """
-        required_keys = [
-            'broker.type',
-            'data_source.type',
-            'strategy.trend_period'
-        ]
-        
-        for key in required_keys:
-            if self.get(key) is None:
-                return False
-        
-        return True
+        flat = self._flat
+        return self._REQUIRED_KEYS.issubset(flat) and all(
+            flat[key] is not None for key in self._REQUIRED_KEYS
+        )
 
     def get_broker_config(self) -> Dict:
         """Get broker configuration."""
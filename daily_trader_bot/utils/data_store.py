@@ -4,10 +4,14 @@ Data persistence module for storing portfolio state and trading history.
 This module handles saving and loading portfolio data to/from the repository.
 """
 
-import json
 import os
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from ._json import dumps, loads
+
+# Initial block size when reading the history file backwards
+_TAIL_BLOCK_SIZE = 16384
 
 
 class DataStore:
@@ -15,7 +19,8 @@ class DataStore:
     Handles persistent storage of portfolio and trading data.
     
     Stores data in JSON format in the repository for easy version control
-    and tracking of trading history.
+    and tracking of trading history. The trading history is kept as JSON
+    Lines (one session per line) so each session is a single append.
     """
     
     def __init__(self, data_dir: str = "trading_data"):
@@ -27,12 +32,38 @@ class DataStore:
         """
         self.data_dir = data_dir
         self.portfolio_file = os.path.join(data_dir, "portfolio_state.json")
-        self.history_file = os.path.join(data_dir, "trading_history.json")
+        self.history_file = os.path.join(data_dir, "trading_history.jsonl")
+        self.legacy_history_file = os.path.join(data_dir, "trading_history.json")
+        self.benchmark_cache_file = os.path.join(data_dir, "benchmark_cache.json")
+        self.report_digest_file = os.path.join(data_dir, "report_digests.json")
         self.analysis_dir = os.path.join(data_dir, "analysis")
         
         # Create directories if they don't exist
         os.makedirs(self.data_dir, exist_ok=True)
         os.makedirs(self.analysis_dir, exist_ok=True)
+        
+        self._upgrade_legacy_history()
+    
+    def _upgrade_legacy_history(self) -> None:
+        """Convert a trading_history.json array into the JSON Lines history file."""
+        if not os.path.exists(self.legacy_history_file) or os.path.exists(self.history_file):
+            return
+        
+        with open(self.legacy_history_file, 'rb') as f:
+            history = loads(f.read())
+        
+        self._write_atomic(self.history_file, b''.join(dumps(entry) + b'\n' for entry in history))
+        os.remove(self.legacy_history_file)
+    
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        """Write data to a temporary file and rename it over path, so readers never see a partial file."""
+        tmp_file = path + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
     
     def save_portfolio_state(self, state: Dict) -> None:
         """
@@ -43,8 +74,7 @@ class DataStore:
         """
         state['last_updated'] = datetime.now().isoformat()
         
-        with open(self.portfolio_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        self._write_atomic(self.portfolio_file, dumps(state, indent=True))
     
     def load_portfolio_state(self) -> Optional[Dict]:
         """
@@ -56,8 +86,8 @@ class DataStore:
         if not os.path.exists(self.portfolio_file):
             return None
         
-        with open(self.portfolio_file, 'r') as f:
-            return json.load(f)
+        with open(self.portfolio_file, 'rb') as f:
+            return loads(f.read())
     
     def append_trading_history(self, entry: Dict) -> None:
         """
@@ -68,18 +98,9 @@ class DataStore:
         """
         entry['timestamp'] = datetime.now().isoformat()
         
-        # Load existing history
-        history = []
-        if os.path.exists(self.history_file):
-            with open(self.history_file, 'r') as f:
-                history = json.load(f)
-        
-        # Append new entry
-        history.append(entry)
-        
-        # Save updated history
-        with open(self.history_file, 'w') as f:
-            json.dump(history, f, indent=2)
+        # One JSON document per line, so existing entries are never rewritten
+        with open(self.history_file, 'ab') as f:
+            f.write(dumps(entry) + b'\n')
     
     def get_trading_history(self, limit: Optional[int] = None) -> List[Dict]:
         """
@@ -94,13 +115,58 @@ class DataStore:
         if not os.path.exists(self.history_file):
             return []
         
-        with open(self.history_file, 'r') as f:
-            history = json.load(f)
-        
-        # Return most recent entries
         if limit:
-            return history[-limit:]
-        return history
+            lines = self._tail_lines(self.history_file, limit)
+        else:
+            with open(self.history_file, 'rb') as f:
+                lines = [line for line in f if line.strip()]
+        return [loads(line) for line in lines]
+    
+    @staticmethod
+    def _tail_lines(path: str, count: int) -> List[bytes]:
+        """
+        Read the last non-empty lines of a file by seeking backwards from its end.
+        
+        Only the blocks holding those lines are read, so the cost does not
+        grow with the size of the file.
+        
+        Args:
+            path: File to read
+            count: Number of lines to return
+            
+        Returns:
+            Up to count lines, oldest first
+        """
+        with open(path, 'rb') as f:
+            pos = f.seek(0, os.SEEK_END)
+            buf = b''
+            block = _TAIL_BLOCK_SIZE
+            while True:
+                step = min(block, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + buf
+                
+                parts = buf.split(b'\n')
+                if pos > 0:
+                    parts = parts[1:]  # May start mid-line
+                lines = [part for part in parts if part.strip()]
+                if len(lines) >= count or pos == 0:
+                    return lines[-count:]
+                block *= 2
+    
+    def count_trading_history(self) -> int:
+        """
+        Count trading history entries without parsing them.
+        
+        Returns:
+            Number of entries in the trading history
+        """
+        if not os.path.exists(self.history_file):
+            return 0
+        
+        with open(self.history_file, 'rb') as f:
+            return sum(1 for line in f if line.strip())
     
     def save_daily_analysis(self, date: str, analysis: Dict) -> None:
         """
@@ -112,8 +178,90 @@ class DataStore:
         """
         filename = os.path.join(self.analysis_dir, f"analysis_{date}.json")
         
-        with open(filename, 'w') as f:
-            json.dump(analysis, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(dumps(analysis, indent=True))
+    
+    def save_benchmark_cache(self, date: str, benchmarks: Dict) -> None:
+        """
+        Save the latest benchmark performance figures.
+        
+        Args:
+            date: Market date the figures were fetched on (YYYY-MM-DD)
+            benchmarks: Dictionary mapping benchmark symbols to performance data
+        """
+        self._write_atomic(self.benchmark_cache_file, dumps({'date': date, 'benchmarks': benchmarks}))
+    
+    def load_benchmark_cache(self) -> Optional[Dict]:
+        """
+        Load the benchmark performance figures saved by save_benchmark_cache.
+        
+        Returns:
+            Dictionary with 'date' and 'benchmarks' keys, or None if nothing is cached
+        """
+        if not os.path.exists(self.benchmark_cache_file):
+            return None
+        
+        with open(self.benchmark_cache_file, 'rb') as f:
+            return loads(f.read())
+    
+    def save_report_digests(self, digests: Dict[str, str]) -> None:
+        """
+        Save the section digests of the latest status report.
+        
+        Args:
+            digests: Dictionary mapping report section names to content digests
+        """
+        self._write_atomic(self.report_digest_file, dumps(digests))
+    
+    def load_report_digests(self) -> Dict[str, str]:
+        """
+        Load the section digests saved by save_report_digests.
+        
+        Returns:
+            Dictionary mapping report section names to digests (empty if none saved)
+        """
+        if not os.path.exists(self.report_digest_file):
+            return {}
+        
+        with open(self.report_digest_file, 'rb') as f:
+            return loads(f.read())
+    
+    def commit(
+        self,
+        portfolio: Optional[Dict] = None,
+        history_entry: Optional[Dict] = None,
+        analysis: Optional[Tuple[str, Dict]] = None
+    ) -> None:
+        """
+        Save the results of a trading session in one step.
+        
+        Everything is serialized before any file is written, so a value that
+        cannot be encoded leaves all files untouched. The portfolio state is
+        written last, so it never gets ahead of the history.
+        
+        Args:
+            portfolio: Portfolio state, as for save_portfolio_state
+            history_entry: Trading session entry, as for append_trading_history
+            analysis: (date, analysis) pair, as for save_daily_analysis
+        """
+        timestamp = datetime.now().isoformat()
+        writes = []
+        if analysis is not None:
+            date, analysis_data = analysis
+            filename = os.path.join(self.analysis_dir, f"analysis_{date}.json")
+            writes.append((filename, 'wb', dumps(analysis_data, indent=True)))
+        if history_entry is not None:
+            history_entry['timestamp'] = timestamp
+            writes.append((self.history_file, 'ab', dumps(history_entry) + b'\n'))
+        if portfolio is not None:
+            portfolio['last_updated'] = timestamp
+            portfolio_data = dumps(portfolio, indent=True)
+        
+        for path, mode, data in writes:
+            with open(path, mode) as f:
+                f.write(data)
+        if portfolio is not None:
+            self._write_atomic(self.portfolio_file, portfolio_data)
     
     def get_portfolio_summary(self) -> Dict:
         """
@@ -144,12 +292,15 @@ class DataStore:
             'trading_days': len(history)
         }
     
-    def initialize_portfolio(self, initial_balance: float) -> None:
+    def initialize_portfolio(self, initial_balance: float) -> Dict:
         """
         Initialize a new portfolio with given balance.
         
         Args:
             initial_balance: Starting cash balance
+            
+        Returns:
+            The portfolio state that was saved
         """
         initial_state = {
             'cash_balance': initial_balance,
@@ -162,5 +313,6 @@ class DataStore:
         self.save_portfolio_state(initial_state)
         
         # Create empty history file
-        with open(self.history_file, 'w') as f:
-            json.dump([], f)
+        open(self.history_file, 'w').close()
+        
+        return initial_state
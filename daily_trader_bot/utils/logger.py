@@ -6,7 +6,15 @@ This module provides logging configuration and utilities.
 
 import logging
 import sys
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Logger name -> (level, log_file) it was last configured with
+_CONFIGURED: Dict[str, Tuple[int, Optional[str]]] = {}
 
 
 def setup_logger(
@@ -17,6 +25,9 @@ def setup_logger(
     """
     Set up a logger for the trading bot.
     
+    Calling this again with the same arguments returns the logger as
+    already configured instead of rebuilding its handlers.
+    
     Args:
         name: Logger name
         level: Logging level
@@ -26,6 +37,9 @@ def setup_logger(
         Configured logger
     """
     logger = logging.getLogger(name)
+    if _CONFIGURED.get(name) == (level, log_file) and logger.handlers:
+        return logger
+    
     logger.setLevel(level)
     
     # Remove existing handlers
@@ -35,23 +49,18 @@ def setup_logger(
     # logging.basicConfig() is also active (e.g. in run_daily_bot.py).
     logger.propagate = False
     
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     logger.addHandler(console_handler)
     
     # File handler if specified
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_FORMATTER)
         logger.addHandler(file_handler)
     
+    _CONFIGURED[name] = (level, log_file)
     return logger
@@ -10,76 +10,338 @@ This script:
 5. Generates and saves a formatted status report
 """
 
+import hashlib
+import io
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 import logging
 
 from daily_trader_bot.utils.config import Config
 from daily_trader_bot.utils.data_store import DataStore
-from daily_trader_bot.data_sources.yahoo_finance import YahooFinanceDataSource
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# pandas and yfinance are only imported once market data is needed, so a
+# run without portfolio data does not pay for loading them
+if TYPE_CHECKING:
+    import pandas as pd
+    from daily_trader_bot.data_sources.yahoo_finance import YahooFinanceDataSource
+
+# Logging is configured in main(), so importing this module leaves the
+# global logging setup alone
 logger = logging.getLogger(__name__)
 
+# Weekends are judged in exchange time; Python 3.8 or a missing tz database
+# falls back to local time
+try:
+    from zoneinfo import ZoneInfo
+    _MARKET_TZ = ZoneInfo('America/New_York')
+except (ImportError, KeyError):
+    _MARKET_TZ = None
+
 # Benchmark definitions
 BENCHMARK_SPY = {'symbol': 'SPY', 'name': 'S&P 500'}
 BENCHMARK_QQQ = {'symbol': 'QQQ', 'name': 'NASDAQ-100'}
 
+# Report layout; every template ends with a newline
+_RULES = {'rule': "=" * 70, 'section_rule': "-" * 70}
+
+_TITLE_TEMPLATE = """\
+{rule}
+📊 DAILY TRADING BOT STATUS REPORT
+{rule}
+Report Date: {report_date}
+
+"""
+
+_OVERVIEW_TEMPLATE = """\
+💼 PORTFOLIO OVERVIEW
+{section_rule}
+Initial Balance:        ${initial_balance:>15,.2f}
+Current Value:          ${current_value:>15,.2f}
+Cash Balance:           ${cash_balance:>15,.2f}
+Position Value:         ${position_value:>15,.2f}
+Active Positions:       {active_positions:>15}
+Trading Days:           {trading_days:>15}
+
+📈 PERFORMANCE METRICS
+{section_rule}
+Overall Return:         {overall_sign}{overall_return_pct:>14.2f}%
+Overall Profit/Loss:    {overall_sign}${overall_profit:>13,.2f}
+
+Daily Return:           {daily_sign}{daily_return_pct:>14.2f}%
+Daily Profit/Loss:      {daily_sign}${daily_profit:>13,.2f}
+"""
+
+_WEEKLY_TEMPLATE = """\
+Weekly Return (7d):     {weekly_sign}{weekly_return_pct:>14.2f}%
+Weekly Profit/Loss:     {weekly_sign}${weekly_profit:>13,.2f}
+"""
+
+_MONTHLY_TEMPLATE = """\
+Monthly Return (30d):   {monthly_sign}{monthly_return_pct:>14.2f}%
+Monthly Profit/Loss:    {monthly_sign}${monthly_profit:>13,.2f}
+"""
+
+# Incremental reports replace sections that match the previous report with
+# a one-line note
+_SECTION_TITLES = {
+    'overview': 'Portfolio overview and performance',
+    'benchmarks': 'Benchmark comparison',
+    'positions': 'Current positions',
+}
+
+_UNCHANGED_TEMPLATE = """\
+{title}: unchanged since the last report
+"""
+
+_BENCHMARKS_HEADER = """\
+
+📊 BENCHMARK COMPARISON
+{section_rule}
+"""
+
+_BENCHMARK_TEMPLATE = """\
+{symbol} ({name}):
+  Daily Return:         {sign}{daily_return:>14.2f}%
+  Current Price:        ${current_price:>15,.2f}
+"""
+
+# SPY's line has always been labelled by name alone
+_BENCHMARK_UNAVAILABLE = {
+    BENCHMARK_SPY['symbol']: "{name}:        Data unavailable\n".format_map(BENCHMARK_SPY),
+    BENCHMARK_QQQ['symbol']: "{symbol} ({name}):     Data unavailable\n".format_map(BENCHMARK_QQQ),
+}
+
+_VS_PORTFOLIO_TEMPLATE = """\
+  vs. Portfolio:        {sign}{vs:>14.2f}% {arrow}
+"""
+
+_POSITIONS_HEADER = """\
+💰 CURRENT POSITIONS
+{section_rule}
+"""
+
+_POSITION_TEMPLATE = """\
+{symbol}:
+  Shares:               {quantity:>15}
+  Avg Price:            ${avg_price:>15,.2f}
+  Current Price:        ${current_price:>15,.2f}
+  Market Value:         ${market_value:>15,.2f}
+  Unrealized P/L:       {sign}${unrealized_pl:>13,.2f} ({sign}{unrealized_pl_pct:.2f}%)
+
+"""
+
+_POSITION_UNPRICED_TEMPLATE = """\
+{symbol}:
+  Shares:               {quantity:>15}
+  Avg Price:            ${avg_price:>15,.2f}
+  Current Price:        N/A
+
+"""
+
+
+# Arrows indexed by the sign of a difference (-1, 0, +1) plus one
+_ARROWS = ('📉', '➡️', '📈')
+
+# Periods whose profit gets a sign field ('<period>_sign') in the templates
+_RETURN_PERIODS = ('overall', 'daily', 'weekly', 'monthly')
+
+
+def _sign(value: float) -> str:
+    """Explicit plus sign for non-negative values (negative ones carry their own)."""
+    return "+" if value >= 0 else ""
+
+
+def _arrow(value: float) -> str:
+    """Up, down or flat arrow for the sign of value."""
+    return _ARROWS[(value > 0) - (value < 0) + 1]
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Modification time and size of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=8)
+def _shared_data_source(session=None) -> 'YahooFinanceDataSource':
+    """Construct the Yahoo Finance data source once per session, so its caches are shared between reporters."""
+    from daily_trader_bot.data_sources.yahoo_finance import YahooFinanceDataSource
+    return YahooFinanceDataSource({}, session=session)
+
 
 class DailyStatusReporter:
     """Generate daily status reports for the trading bot portfolio."""
     
-    def __init__(self):
-        """Initialize the status reporter."""
+    def __init__(self, session=None):
+        """
+        Initialize the status reporter.
+        
+        Args:
+            session: Optional HTTP session for all Yahoo Finance requests
+        """
         self.data_store = DataStore()
         self.config = Config()
-        self.data_source = YahooFinanceDataSource({})
+        self._session = session
+        self._data_source = None
+        self._reports_dir_ready = False
+        self._inputs_cache = None  # (file signatures, (portfolio state, returns))
+    
+    @property
+    def data_source(self) -> 'YahooFinanceDataSource':
+        """Yahoo Finance data source, created on first use."""
+        if self._data_source is None:
+            # Prices and histories fetched in the last minute (the data
+            # source's cache_ttl) are reused by every reporter in the process
+            self._data_source = _shared_data_source(self._session)
+        return self._data_source
+    
+    @data_source.setter
+    def data_source(self, data_source) -> None:
+        self._data_source = data_source
+        
+    def _cached_benchmarks(self, market_date) -> Optional[Tuple[Optional[Dict], Optional[Dict]]]:
+        """
+        Return the SPY and QQQ performance cached on the last trading weekday.
+        
+        Args:
+            market_date: Today's date in exchange time (a Saturday or Sunday)
+            
+        Returns:
+            Tuple of (SPY, QQQ) performance, or None if the cache is missing or stale
+        """
+        try:
+            cached = self.data_store.load_benchmark_cache()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read benchmark cache: {e}")
+            return None
+        
+        last_session = market_date - timedelta(days=market_date.weekday() - 4)
+        if not cached or cached.get('date', '') < last_session.isoformat():
+            return None
+        
+        benchmarks = cached.get('benchmarks', {})
+        return benchmarks.get(BENCHMARK_SPY['symbol']), benchmarks.get(BENCHMARK_QQQ['symbol'])
+    
+    def _bulk_fetch(
+        self,
+        symbols: List[str],
+        days: int = 1,
+        as_of: Optional[datetime] = None
+    ) -> Dict[str, 'pd.DataFrame']:
+        """
+        Fetch daily bars for several symbols with a single download.
         
-    def get_benchmark_performance(self, symbol: str, days: int = 1) -> Optional[Dict]:
+        Args:
+            symbols: Symbols to fetch
+            days: Number of days to look back
+            as_of: End of the lookback window (defaults to now)
+            
+        Returns:
+            Dictionary mapping symbol to its DataFrame; symbols without data
+            (or all symbols, if the download fails) are omitted
+        """
+        end_date = as_of or datetime.now()
+        start_date = end_date - timedelta(days=days + 5)  # Extra days for market closures
+        
+        try:
+            return self.data_source.get_historical_data_batch(symbols, start_date, end_date, interval='1d')
+        except Exception as e:
+            logger.warning(f"Batch download failed, fetching symbols individually: {e}")
+            return {}
+    
+    def _position_prices(self, symbols: List[str], histories: Dict[str, 'pd.DataFrame']) -> Dict:
+        """
+        Get the current price of each position symbol.
+        
+        Prices come from the latest close of the prefetched histories; the
+        remaining symbols are requested concurrently on a thread pool.
+        
+        Args:
+            symbols: Position symbols
+            histories: Daily bars already fetched, by symbol
+            
+        Returns:
+            Dictionary mapping each symbol to its price, or to the exception
+            raised while fetching it
+        """
+        prices = {}
+        missing = []
+        for symbol in dict.fromkeys(symbols):
+            if symbol in histories:
+                prices[symbol] = float(histories[symbol]['Close'].to_numpy()[-1])
+            else:
+                missing.append(symbol)
+        
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(16, len(missing))) as pool:
+                futures = {symbol: pool.submit(self.data_source.get_current_price, symbol) for symbol in missing}
+            for symbol, future in futures.items():
+                try:
+                    prices[symbol] = future.result()
+                except Exception as e:
+                    prices[symbol] = e
+        
+        return prices
+    
+    def get_benchmark_performance(
+        self,
+        symbol: str,
+        days: int = 1,
+        data: Optional['pd.DataFrame'] = None,
+        as_of: Optional[datetime] = None
+    ) -> Optional[Dict]:
         """
         Get benchmark performance over specified period.
         
         Args:
             symbol: Benchmark symbol (e.g., 'SPY', 'QQQ')
             days: Number of days to look back
+            data: Daily bars already fetched for the symbol (fetched if None)
+            as_of: End of the lookback window when fetching (defaults to now)
             
         Returns:
             Dictionary with performance metrics or None if unavailable
         """
         try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days + 5)  # Extra days for market closures
+            if data is None:
+                end_date = as_of or datetime.now()
+                start_date = end_date - timedelta(days=days + 5)  # Extra days for market closures
+                
+                data = self.data_source.get_historical_data(
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date,
+                    interval='1d'
+                )
             
-            data = self.data_source.get_historical_data(
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date,
-                interval='1d'
-            )
+            # Only a few closes are read, so index the raw array rather than
+            # going through pandas indexing for each one
+            closes = data['Close'].to_numpy(dtype=float)
             
-            if len(data) < 2:
+            if len(closes) < 2:
                 logger.warning(f"Insufficient data for {symbol}")
                 return None
             
             # Get the most recent and previous close
-            current_price = float(data['Close'].iloc[-1])
+            current_price = float(closes[-1])
             
             # For daily return, use previous day
-            if len(data) >= 2:
-                prev_price_1d = float(data['Close'].iloc[-2])
+            if len(closes) >= 2:
+                prev_price_1d = float(closes[-2])
                 daily_return = ((current_price - prev_price_1d) / prev_price_1d) * 100
             else:
                 daily_return = 0.0
             
             # For longer periods, calculate from N days ago
-            if len(data) > days:
-                prev_price_period = float(data['Close'].iloc[-(days + 1)])
+            if len(closes) > days:
+                prev_price_period = float(closes[-(days + 1)])
                 period_return = ((current_price - prev_price_period) / prev_price_period) * 100
             else:
                 period_return = daily_return
@@ -96,17 +358,29 @@ class DailyStatusReporter:
             logger.error(f"Error fetching benchmark data for {symbol}: {e}")
             return None
     
-    def calculate_portfolio_returns(self, portfolio_state: Dict, history: List[Dict]) -> Dict:
+    def calculate_portfolio_returns(
+        self,
+        portfolio_state: Dict,
+        history: List[Dict],
+        trading_days: Optional[int] = None
+    ) -> Dict:
         """
         Calculate portfolio returns over various periods.
         
+        Only the last 30 history entries are used, so history may be just
+        that tail of the full trading history.
+        
         Args:
             portfolio_state: Current portfolio state
-            history: Trading history entries
+            history: Trading history entries (at least the last 30)
+            trading_days: Total number of history entries (defaults to len(history))
             
         Returns:
             Dictionary with return metrics
         """
+        if trading_days is None:
+            trading_days = len(history)
+        
         current_value = portfolio_state.get('total_value', 0)
         initial_balance = portfolio_state.get('initial_balance', 100000.0)
         
@@ -133,7 +407,7 @@ class DailyStatusReporter:
             'overall_profit': overall_profit,
             'daily_return_pct': daily_return,
             'daily_profit': daily_profit,
-            'trading_days': len(history)
+            'trading_days': trading_days
         }
         
         # Calculate period returns if we have enough history
@@ -151,191 +425,295 @@ class DailyStatusReporter:
         
         return returns
     
-    def generate_report(self) -> str:
+    def _portfolio_inputs(self) -> Optional[Tuple[Dict, Dict]]:
+        """
+        Load the portfolio state and calculate its returns.
+        
+        The result is reused until the portfolio or history file changes
+        (by modification time or size), so repeated reports skip reading and
+        parsing them. Market data is not cached here.
+        
+        Returns:
+            Tuple of (portfolio state, returns), or None if there is no portfolio data
+        """
+        key = (
+            _file_signature(self.data_store.portfolio_file),
+            _file_signature(self.data_store.history_file),
+        )
+        if self._inputs_cache is not None and self._inputs_cache[0] == key:
+            return self._inputs_cache[1]
+        
+        inputs = None
+        portfolio_state = self.data_store.load_portfolio_state()
+        if portfolio_state:
+            # Returns only look back 30 entries, so the rest of the history
+            # is counted rather than parsed
+            history = self.data_store.get_trading_history(limit=30)
+            trading_days = self.data_store.count_trading_history()
+            returns = self.calculate_portfolio_returns(portfolio_state, history, trading_days)
+            inputs = (portfolio_state, returns)
+        
+        self._inputs_cache = (key, inputs)
+        return inputs
+    
+    def generate_report(self, as_of: Optional[datetime] = None, incremental: bool = False) -> str:
         """
         Generate a formatted daily status report.
         
+        Args:
+            as_of: Time the report is generated for (defaults to now); used
+                for the report date and the market data window
+            incremental: Only include sections that changed since the last
+                saved report (see build_report)
+            
         Returns:
             Formatted report as a string
         """
-        logger.info("Generating daily status report...")
+        return self.build_report(as_of, incremental)[0]
+    
+    def build_report(
+        self,
+        as_of: Optional[datetime] = None,
+        incremental: bool = False
+    ) -> Tuple[str, Dict[str, str]]:
+        """
+        Generate a formatted daily status report and the digests of its sections.
         
-        # Load portfolio data
-        portfolio_state = self.data_store.load_portfolio_state()
-        if not portfolio_state:
-            return "❌ No portfolio data available. Initialize the bot first."
+        In incremental mode, sections whose digest matches the one saved with
+        the previous report are replaced by a one-line note. The digests are
+        only recorded when they are passed to save_report.
         
-        history = self.data_store.get_trading_history()
+        Args:
+            as_of: Time the report is generated for (defaults to now); used
+                for the report date and the market data window
+            incremental: Only include sections that changed since the last
+                saved report
+            
+        Returns:
+            Tuple of the formatted report and a dictionary mapping section
+            names to digests (empty if there is no portfolio data)
+        """
+        logger.info("Generating daily status report...")
+        now = as_of or datetime.now()
+        
+        # Load portfolio data and returns
+        inputs = self._portfolio_inputs()
+        if inputs is None:
+            return "❌ No portfolio data available. Initialize the bot first.", {}
+        portfolio_state, returns = inputs
         
-        # Calculate portfolio returns
-        returns = self.calculate_portfolio_returns(portfolio_state, history)
+        # Benchmarks and position prices come from one batched download. The
+        # market is closed at weekends, so Friday's benchmark figures are
+        # reused rather than downloaded again
+        positions = portfolio_state.get('positions', [])
+        market_date = now.astimezone(_MARKET_TZ).date()
+        cached = self._cached_benchmarks(market_date) if market_date.weekday() >= 5 else None
+        symbols = [pos['symbol'] for pos in positions]
+        if cached is None:
+            symbols = [BENCHMARK_SPY['symbol'], BENCHMARK_QQQ['symbol']] + symbols
+        histories = self._bulk_fetch(symbols, days=1, as_of=now) if symbols else {}
         
         # Get benchmark performance
-        spy_perf = self.get_benchmark_performance(BENCHMARK_SPY['symbol'], days=1)
-        qqq_perf = self.get_benchmark_performance(BENCHMARK_QQQ['symbol'], days=1)
-        
-        # Build report
-        report_lines = []
-        report_lines.append("=" * 70)
-        report_lines.append("📊 DAILY TRADING BOT STATUS REPORT")
-        report_lines.append("=" * 70)
-        report_lines.append(f"Report Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append("")
-        
-        # Portfolio Overview
-        report_lines.append("💼 PORTFOLIO OVERVIEW")
-        report_lines.append("-" * 70)
-        report_lines.append(f"Initial Balance:        ${returns['initial_balance']:>15,.2f}")
-        report_lines.append(f"Current Value:          ${returns['current_value']:>15,.2f}")
-        report_lines.append(f"Cash Balance:           ${portfolio_state.get('cash_balance', 0):>15,.2f}")
-        
-        position_value = returns['current_value'] - portfolio_state.get('cash_balance', 0)
-        report_lines.append(f"Position Value:         ${position_value:>15,.2f}")
-        report_lines.append(f"Active Positions:       {len(portfolio_state.get('positions', [])):>15}")
-        report_lines.append(f"Trading Days:           {returns['trading_days']:>15}")
-        report_lines.append("")
-        
-        # Performance Metrics
-        report_lines.append("📈 PERFORMANCE METRICS")
-        report_lines.append("-" * 70)
-        
-        # Overall performance
-        profit_sign = "+" if returns['overall_profit'] >= 0 else ""
-        report_lines.append(f"Overall Return:         {profit_sign}{returns['overall_return_pct']:>14.2f}%")
-        report_lines.append(f"Overall Profit/Loss:    {profit_sign}${returns['overall_profit']:>13,.2f}")
-        report_lines.append("")
-        
-        # Daily performance
-        daily_sign = "+" if returns['daily_profit'] >= 0 else ""
-        report_lines.append(f"Daily Return:           {daily_sign}{returns['daily_return_pct']:>14.2f}%")
-        report_lines.append(f"Daily Profit/Loss:      {daily_sign}${returns['daily_profit']:>13,.2f}")
+        if cached is not None:
+            spy_perf, qqq_perf = cached
+        else:
+            spy_perf = self.get_benchmark_performance(
+                BENCHMARK_SPY['symbol'], days=1, data=histories.get(BENCHMARK_SPY['symbol']), as_of=now
+            )
+            qqq_perf = self.get_benchmark_performance(
+                BENCHMARK_QQQ['symbol'], days=1, data=histories.get(BENCHMARK_QQQ['symbol']), as_of=now
+            )
+            if market_date.weekday() < 5 and spy_perf and qqq_perf:
+                try:
+                    self.data_store.save_benchmark_cache(market_date.isoformat(), {
+                        BENCHMARK_SPY['symbol']: spy_perf,
+                        BENCHMARK_QQQ['symbol']: qqq_perf,
+                    })
+                except OSError as e:
+                    logger.warning(f"Could not save benchmark cache: {e}")
+        
+        # Build report, one section at a time
+        cash_balance = portfolio_state.get('cash_balance', 0)
+        sections = {}
+        report = io.StringIO()
+        # All return fields and their signs are resolved once and shared by
+        # the header and weekly/monthly templates
+        fields = {**_RULES, **returns}
+        for period in _RETURN_PERIODS:
+            profit = returns.get(f'{period}_profit')
+            if profit is not None:
+                fields[f'{period}_sign'] = _sign(profit)
+        fields.update(
+            report_date=now.strftime('%Y-%m-%d %H:%M:%S'),
+            cash_balance=cash_balance,
+            position_value=returns['current_value'] - cash_balance,
+            active_positions=len(positions),
+        )
+        report.write(_OVERVIEW_TEMPLATE.format_map(fields))
         
         # Weekly/Monthly if available
         if 'weekly_return_pct' in returns:
-            weekly_sign = "+" if returns['weekly_profit'] >= 0 else ""
-            report_lines.append(f"Weekly Return (7d):     {weekly_sign}{returns['weekly_return_pct']:>14.2f}%")
-            report_lines.append(f"Weekly Profit/Loss:     {weekly_sign}${returns['weekly_profit']:>13,.2f}")
-        
+            report.write(_WEEKLY_TEMPLATE.format_map(fields))
         if 'monthly_return_pct' in returns:
-            monthly_sign = "+" if returns['monthly_profit'] >= 0 else ""
-            report_lines.append(f"Monthly Return (30d):   {monthly_sign}{returns['monthly_return_pct']:>14.2f}%")
-            report_lines.append(f"Monthly Profit/Loss:    {monthly_sign}${returns['monthly_profit']:>13,.2f}")
+            report.write(_MONTHLY_TEMPLATE.format_map(fields))
         
-        report_lines.append("")
+        sections['overview'] = report.getvalue()
         
         # Benchmark Comparison
-        report_lines.append("📊 BENCHMARK COMPARISON")
-        report_lines.append("-" * 70)
-        
-        if spy_perf:
-            spy_sign = "+" if spy_perf['daily_return'] >= 0 else ""
-            report_lines.append(f"SPY (S&P 500):")
-            report_lines.append(f"  Daily Return:         {spy_sign}{spy_perf['daily_return']:>14.2f}%")
-            report_lines.append(f"  Current Price:        ${spy_perf['current_price']:>15,.2f}")
-            
-            # Compare to portfolio
-            if returns['trading_days'] > 0:
-                vs_spy = returns['daily_return_pct'] - spy_perf['daily_return']
-                vs_spy_sign = "+" if vs_spy >= 0 else ""
-                report_lines.append(f"  vs. Portfolio:        {vs_spy_sign}{vs_spy:>14.2f}% {'📈' if vs_spy > 0 else '📉' if vs_spy < 0 else '➡️'}")
-        else:
-            report_lines.append(f"{BENCHMARK_SPY['name']}:        Data unavailable")
-        
-        report_lines.append("")
-        
-        if qqq_perf:
-            qqq_sign = "+" if qqq_perf['daily_return'] >= 0 else ""
-            report_lines.append(f"{BENCHMARK_QQQ['symbol']} ({BENCHMARK_QQQ['name']}):")
-            report_lines.append(f"  Daily Return:         {qqq_sign}{qqq_perf['daily_return']:>14.2f}%")
-            report_lines.append(f"  Current Price:        ${qqq_perf['current_price']:>15,.2f}")
-            
-            # Compare to portfolio
-            if returns['trading_days'] > 0:
-                vs_qqq = returns['daily_return_pct'] - qqq_perf['daily_return']
-                vs_qqq_sign = "+" if vs_qqq >= 0 else ""
-                report_lines.append(f"  vs. Portfolio:        {vs_qqq_sign}{vs_qqq:>14.2f}% {'📈' if vs_qqq > 0 else '📉' if vs_qqq < 0 else '➡️'}")
-        else:
-            report_lines.append(f"{BENCHMARK_QQQ['symbol']} ({BENCHMARK_QQQ['name']}):     Data unavailable")
-        
-        report_lines.append("")
+        report = io.StringIO()
+        report.write(_BENCHMARKS_HEADER.format_map(_RULES))
+        for benchmark, perf in ((BENCHMARK_SPY, spy_perf), (BENCHMARK_QQQ, qqq_perf)):
+            if not perf:
+                report.write(_BENCHMARK_UNAVAILABLE[benchmark['symbol']])
+            else:
+                report.write(_BENCHMARK_TEMPLATE.format_map({
+                    **perf, **benchmark, 'sign': _sign(perf['daily_return'])
+                }))
+                # Compare to portfolio
+                if returns['trading_days'] > 0:
+                    vs = returns['daily_return_pct'] - perf['daily_return']
+                    report.write(_VS_PORTFOLIO_TEMPLATE.format_map(
+                        {'sign': _sign(vs), 'vs': vs, 'arrow': _arrow(vs)}
+                    ))
+            report.write("\n")
+        
+        sections['benchmarks'] = report.getvalue()
         
         # Position Details
-        positions = portfolio_state.get('positions', [])
+        report = io.StringIO()
+        report.write(_POSITIONS_HEADER.format_map(_RULES))
         if positions:
-            report_lines.append("💰 CURRENT POSITIONS")
-            report_lines.append("-" * 70)
+            prices = self._position_prices([pos['symbol'] for pos in positions], histories)
+            
+            # P/L for all positions at once; positions without a price are NaN
+            import numpy as np
+            quantity = np.array([pos['quantity'] for pos in positions], dtype=float)
+            avg_price = np.array([pos['avg_price'] for pos in positions], dtype=float)
+            current_price = np.array([
+                np.nan if isinstance(prices[pos['symbol']], Exception) else prices[pos['symbol']]
+                for pos in positions
+            ], dtype=float)
+            market_value = current_price * quantity
+            cost_basis = avg_price * quantity
+            unrealized_pl = market_value - cost_basis
+            with np.errstate(divide='ignore', invalid='ignore'):
+                unrealized_pl_pct = (unrealized_pl / cost_basis) * 100
             
-            for pos in positions:
+            for i, pos in enumerate(positions):
                 symbol = pos['symbol']
-                quantity = pos['quantity']
-                avg_price = pos['avg_price']
+                price = prices[symbol]
+                if isinstance(price, Exception) or cost_basis[i] == 0:
+                    error = price if isinstance(price, Exception) else "zero cost basis"
+                    logger.warning(f"Could not fetch current price for {symbol}: {error}")
+                    report.write(_POSITION_UNPRICED_TEMPLATE.format_map(pos))
+                    continue
                 
-                # Try to get current price
-                try:
-                    current_price = self.data_source.get_current_price(symbol)
-                    market_value = current_price * quantity
-                    cost_basis = avg_price * quantity
-                    unrealized_pl = market_value - cost_basis
-                    unrealized_pl_pct = (unrealized_pl / cost_basis) * 100
-                    pl_sign = "+" if unrealized_pl >= 0 else ""
-                    
-                    report_lines.append(f"{symbol}:")
-                    report_lines.append(f"  Shares:               {quantity:>15}")
-                    report_lines.append(f"  Avg Price:            ${avg_price:>15,.2f}")
-                    report_lines.append(f"  Current Price:        ${current_price:>15,.2f}")
-                    report_lines.append(f"  Market Value:         ${market_value:>15,.2f}")
-                    report_lines.append(f"  Unrealized P/L:       {pl_sign}${unrealized_pl:>13,.2f} ({pl_sign}{unrealized_pl_pct:.2f}%)")
-                    
-                except Exception as e:
-                    logger.warning(f"Could not fetch current price for {symbol}: {e}")
-                    report_lines.append(f"{symbol}:")
-                    report_lines.append(f"  Shares:               {quantity:>15}")
-                    report_lines.append(f"  Avg Price:            ${avg_price:>15,.2f}")
-                    report_lines.append(f"  Current Price:        N/A")
-                
-                report_lines.append("")
+                report.write(_POSITION_TEMPLATE.format_map({
+                    **pos,
+                    'current_price': price,
+                    'market_value': float(market_value[i]),
+                    'unrealized_pl': float(unrealized_pl[i]),
+                    'unrealized_pl_pct': float(unrealized_pl_pct[i]),
+                    'sign': _sign(unrealized_pl[i]),
+                }))
         else:
-            report_lines.append("💰 CURRENT POSITIONS")
-            report_lines.append("-" * 70)
-            report_lines.append("No active positions")
-            report_lines.append("")
+            report.write("No active positions\n\n")
+        sections['positions'] = report.getvalue()
         
-        report_lines.append("=" * 70)
-        
-        report = "\n".join(report_lines)
+        report, digests = self._assemble_report(fields, sections, incremental)
         logger.info("Daily status report generated successfully")
         
-        return report
+        return report, digests
     
-    def save_report(self, report: str) -> str:
+    def _assemble_report(
+        self,
+        fields: Dict,
+        sections: Dict[str, str],
+        incremental: bool
+    ) -> Tuple[str, Dict[str, str]]:
+        """
+        Join the report sections and compute their digests.
+        
+        Args:
+            fields: Template fields (rules and report date) for the title
+            sections: Section texts keyed by name, in report order
+            incremental: Replace sections unchanged since the last saved report
+            
+        Returns:
+            Tuple of the formatted report and the section digests
+        """
+        digests = {
+            name: hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+            for name, text in sections.items()
+        }
+        previous = {}
+        if incremental:
+            try:
+                previous = self.data_store.load_report_digests()
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read previous report digests: {e}")
+        
+        parts = [_TITLE_TEMPLATE.format_map(fields)]
+        for name, text in sections.items():
+            if previous.get(name) == digests[name]:
+                parts.append(_UNCHANGED_TEMPLATE.format(title=_SECTION_TITLES[name]))
+            else:
+                parts.append(text)
+        parts.append(_RULES['rule'])
+        
+        return ''.join(parts), digests
+    
+    def save_report(
+        self,
+        report: str,
+        as_of: Optional[datetime] = None,
+        digests: Optional[Dict[str, str]] = None
+    ) -> str:
         """
         Save report to file.
         
         Args:
             report: Formatted report string
+            as_of: Time the report was generated for (defaults to now); sets
+                the file's date
+            digests: Section digests from build_report; once the report is
+                written they are saved for the next incremental report
             
         Returns:
             Path to saved report file
         """
-        # Create reports directory if it doesn't exist
+        # Create reports directory if it doesn't exist (once per reporter)
         reports_dir = os.path.join(self.data_store.data_dir, "reports")
-        os.makedirs(reports_dir, exist_ok=True)
+        if not self._reports_dir_ready:
+            os.makedirs(reports_dir, exist_ok=True)
+            self._reports_dir_ready = True
         
         # Generate filename with date
-        date_str = datetime.now().strftime('%Y-%m-%d')
+        date_str = (as_of or datetime.now()).strftime('%Y-%m-%d')
         report_file = os.path.join(reports_dir, f"status_report_{date_str}.txt")
         
-        # Save report
-        with open(report_file, 'w') as f:
+        # Save report in a single buffered write
+        with open(report_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
             f.write(report)
         
         logger.info(f"Report saved to {report_file}")
         
+        if digests:
+            try:
+                self.data_store.save_report_digests(digests)
+            except OSError as e:
+                logger.warning(f"Could not save report digests: {e}")
+        
         return report_file
 
 
 def main():
     """Main execution function."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     logger.info("=" * 70)
     logger.info("Daily Status Report Generator")
     logger.info("=" * 70)
@@ -344,14 +722,18 @@ def main():
         # Create reporter
         reporter = DailyStatusReporter()
         
-        # Generate report
-        report = reporter.generate_report()
+        # INCREMENTAL_REPORT=true reports only the sections that changed
+        incremental = os.environ.get("INCREMENTAL_REPORT", "").strip().lower() in ("1", "true", "yes", "y", "on")
+        
+        # Generate report; the same timestamp dates the report and its file
+        now = datetime.now()
+        report, digests = reporter.build_report(as_of=now, incremental=incremental)
         
         # Print to console
         print("\n" + report + "\n")
         
         # Save to file
-        report_file = reporter.save_report(report)
+        report_file = reporter.save_report(report, as_of=now, digests=digests)
         
         logger.info("=" * 70)
         logger.info("Status report completed successfully")
@@ -12,7 +12,6 @@ This script:
 import os
 import sys
 from datetime import datetime
-from daily_trader_bot.bot import TradingBot
 from daily_trader_bot.utils.config import Config
 from daily_trader_bot.utils.data_store import DataStore
 import logging
@@ -24,6 +23,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Symbols analyzed when trading.symbols is not configured
+_DEFAULT_SYMBOLS = ('AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA')
+
 
 def _parse_bool(value: str, default: bool) -> bool:
     """Parse a string into a boolean, accepting true/false/1/0/yes/no/on/off."""
@@ -47,9 +49,13 @@ def _parse_float(value: str, default: float) -> float:
 
 def main():
     """Main trading bot execution."""
+    # One timestamp dates the whole run, including the saved history and analysis
+    now = datetime.now()
+    date_str = now.strftime('%Y-%m-%d')
+    
     logger.info("=" * 60)
     logger.info("Daily Trading Bot - Automated Run")
-    logger.info(f"Execution Time: {datetime.now().isoformat()}")
+    logger.info(f"Execution Time: {now.isoformat()}")
     logger.info("=" * 60)
     
     # Initialize data store
@@ -81,18 +87,37 @@ def main():
     if debug_raw is not None and debug_raw.strip() != "":
         config.set("strategy.debug", _parse_bool(debug_raw, False))
     
+    # Settings used more than once below
+    initial_balance = config.get('broker.initial_balance', 100000.0)
+    
     # Check if portfolio exists, otherwise initialize
     portfolio_state = data_store.load_portfolio_state()
     
     if portfolio_state is None:
         logger.info("No existing portfolio found. Initializing new portfolio...")
-        initial_balance = config.get('broker.initial_balance', 100000.0)
-        data_store.initialize_portfolio(initial_balance)
-        portfolio_state = data_store.load_portfolio_state()
+        portfolio_state = data_store.initialize_portfolio(initial_balance)
         logger.info(f"Portfolio initialized with ${initial_balance:,.2f}")
     else:
         logger.info(f"Loaded existing portfolio: ${portfolio_state['cash_balance']:,.2f} cash")
     
+    # Get symbols to analyze from config or use defaults
+    # (a comma-separated string, or a list in a JSON config file)
+    configured_symbols = config.get('trading.symbols', _DEFAULT_SYMBOLS)
+    if isinstance(configured_symbols, str):
+        symbols = [s.strip() for s in configured_symbols.split(',') if s.strip()]
+    else:
+        symbols = list(configured_symbols or ())
+    
+    if not symbols:
+        logger.error("No valid symbols to analyze. Please configure trading.symbols")
+        return 1
+    
+    logger.info(f"Analyzing symbols: {', '.join(symbols)}")
+    
+    # Imported here so a misconfigured run fails before loading pandas,
+    # scikit-learn and the data sources
+    from daily_trader_bot.bot import TradingBot
+    
     # Initialize bot
     logger.info("Initializing trading bot...")
     bot = TradingBot(config)
@@ -100,16 +125,11 @@ def main():
     # Load broker state if exists
     if portfolio_state:
         broker_state = {
-            'balance': portfolio_state.get('cash_balance', config.get('broker.initial_balance')),
-            'initial_balance': portfolio_state.get('initial_balance', config.get('broker.initial_balance')),
-            'positions': {
-                pos['symbol']: {
-                    'quantity': pos['quantity'],
-                    'avg_price': pos['avg_price'],
-                    'total_cost': pos['total_cost']
-                }
-                for pos in portfolio_state.get('positions', [])
-            },
+            'balance': portfolio_state.get('cash_balance', initial_balance),
+            'initial_balance': portfolio_state.get('initial_balance', initial_balance),
+            # The broker reads quantity, avg_price and total_cost from each
+            # saved position and ignores the rest, so no copies are needed
+            'positions': {pos['symbol']: pos for pos in portfolio_state.get('positions', [])},
             'order_history': []
         }
         bot.broker.load_state(broker_state)
@@ -118,16 +138,6 @@ def main():
     # Connect to broker
     bot.connect()
     
-    # Get symbols to analyze from config or use defaults
-    symbols_str = config.get('trading.symbols', 'AAPL,MSFT,GOOGL,AMZN,TSLA')
-    symbols = [s.strip() for s in (symbols_str or '').split(',') if s.strip()]
-    
-    if not symbols:
-        logger.error("No valid symbols to analyze. Please configure trading.symbols")
-        return 1
-    
-    logger.info(f"Analyzing symbols: {', '.join(symbols)}")
-    
     # Run trading session
     try:
         # Determine if we should execute trades
@@ -143,88 +153,98 @@ def main():
         logger.info(f"Symbols analyzed: {session_results['symbols_analyzed']}")
         logger.info(f"Orders placed: {len(session_results['orders'])}")
         
-        # Log signals
+        # Log signals and orders (one record per group), collecting the
+        # fields kept in the trading history in the same pass
+        signal_lines = []
+        history_signals = []
         for signal in session_results['signals']:
-            logger.info(
-                f"  {signal['symbol']}: {signal['action'].upper()} "
-                f"(confidence: {signal['confidence']:.2%}) @ ${signal['current_price']:.2f}"
+            symbol, action, confidence, current_price = (
+                signal['symbol'], signal['action'], signal['confidence'], signal['current_price']
             )
+            signal_lines.append(f"  {symbol}: {action.upper()} (confidence: {confidence:.2%}) @ ${current_price:.2f}")
+            history_signals.append({
+                'symbol': symbol,
+                'action': action,
+                'confidence': confidence,
+                'current_price': current_price
+            })
         
-        # Log orders
+        if signal_lines:
+            logger.info("Signals:\n%s", "\n".join(signal_lines))
+        
+        order_lines = []
+        history_orders = []
         for order in session_results['orders']:
-            logger.info(
+            order_lines.append(
                 f"  ORDER: {(order.get('side') or 'unknown').upper()} {order.get('quantity', '?')} {order.get('symbol', '?')} "
                 f"@ ${order.get('price', 0):.2f} - {order.get('status', 'unknown')}"
             )
+            history_orders.append({
+                'symbol': order['symbol'],
+                'side': order['side'],
+                'quantity': order['quantity'],
+                'price': order['price'],
+                'status': order['status']
+            })
+        
+        if order_lines:
+            logger.info("Orders:\n%s", "\n".join(order_lines))
         
         # Get updated portfolio status
         portfolio_status = bot.get_portfolio_status()
         
-        logger.info("=" * 60)
-        logger.info("Portfolio Status:")
-        logger.info(f"  Cash Balance: ${portfolio_status['cash_balance']:,.2f}")
-        logger.info(f"  Position Value: ${portfolio_status['position_value']:,.2f}")
-        logger.info(f"  Total Value: ${portfolio_status['total_value']:,.2f}")
-        logger.info(f"  Active Positions: {len(portfolio_status['positions'])}")
-        
-        for pos in portfolio_status['positions']:
-            if 'profit_loss' in pos:
-                pl_sign = '+' if pos['profit_loss'] >= 0 else ''
-                logger.info(
-                    f"    {pos['symbol']}: {pos['quantity']} shares @ ${pos['avg_price']:.2f} "
-                    f"(P/L: {pl_sign}${pos['profit_loss']:.2f} / {pl_sign}{pos['profit_loss_pct']:.2f}%)"
-                )
-            else:
-                logger.info(f"    {pos['symbol']}: {pos['quantity']} shares @ ${pos['avg_price']:.2f}")
+        if logger.isEnabledFor(logging.INFO):
+            status_lines = [
+                "=" * 60,
+                "Portfolio Status:",
+                f"  Cash Balance: ${portfolio_status['cash_balance']:,.2f}",
+                f"  Position Value: ${portfolio_status['position_value']:,.2f}",
+                f"  Total Value: ${portfolio_status['total_value']:,.2f}",
+                f"  Active Positions: {len(portfolio_status['positions'])}",
+            ]
+            for pos in portfolio_status['positions']:
+                if 'profit_loss' in pos:
+                    pl_sign = '+' if pos['profit_loss'] >= 0 else ''
+                    status_lines.append(
+                        f"    {pos['symbol']}: {pos['quantity']} shares @ ${pos['avg_price']:.2f} "
+                        f"(P/L: {pl_sign}${pos['profit_loss']:.2f} / {pl_sign}{pos['profit_loss_pct']:.2f}%)"
+                    )
+                else:
+                    status_lines.append(f"    {pos['symbol']}: {pos['quantity']} shares @ ${pos['avg_price']:.2f}")
+            logger.info("\n".join(status_lines))
         
-        # Save portfolio state
+        # Portfolio state
         new_state = {
             'cash_balance': portfolio_status['cash_balance'],
             'positions': portfolio_status['positions'],
             'total_value': portfolio_status['total_value'],
             'initial_balance': bot.broker.initial_balance
         }
-        data_store.save_portfolio_state(new_state)
-        logger.info("Portfolio state saved")
         
-        # Save trading history
+        # Trading history entry
         history_entry = {
-            'date': datetime.now().strftime('%Y-%m-%d'),
+            'date': date_str,
             'symbols_analyzed': session_results['symbols_analyzed'],
-            'signals': [
-                {
-                    'symbol': s['symbol'],
-                    'action': s['action'],
-                    'confidence': s['confidence'],
-                    'current_price': s['current_price']
-                }
-                for s in session_results['signals']
-            ],
-            'orders': [
-                {
-                    'symbol': o['symbol'],
-                    'side': o['side'],
-                    'quantity': o['quantity'],
-                    'price': o['price'],
-                    'status': o['status']
-                }
-                for o in session_results['orders']
-            ],
+            'signals': history_signals,
+            'orders': history_orders,
             'portfolio_value': portfolio_status['total_value'],
             'cash_balance': portfolio_status['cash_balance']
         }
-        data_store.append_trading_history(history_entry)
-        logger.info("Trading history saved")
         
-        # Save daily analysis
-        date_str = datetime.now().strftime('%Y-%m-%d')
+        # Daily analysis
         analysis_data = {
             'date': date_str,
             'session': session_results,
             'portfolio': portfolio_status
         }
-        data_store.save_daily_analysis(date_str, analysis_data)
-        logger.info(f"Daily analysis saved to analysis_{date_str}.json")
+        
+        # Save all three together
+        data_store.commit(
+            portfolio=new_state,
+            history_entry=history_entry,
+            analysis=(date_str, analysis_data)
+        )
+        logger.info(f"Portfolio state, trading history and analysis_{date_str}.json saved")
         
         # Print summary
         summary = data_store.get_portfolio_summary()
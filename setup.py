@@ -34,7 +34,8 @@ setup(
         "python-dateutil>=2.8.0",
     ],
     extras_require={
-        "ai": ["openai>=1.0.0"],
+        "ai": ["openai>=1.26.0", "httpx[http2]>=0.23.0"],
+        "fast": ["numba>=0.57.0", "orjson>=3.9.0"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
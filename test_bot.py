@@ -8,11 +8,29 @@ from daily_trader_bot.bot import TradingBot
 from daily_trader_bot.utils.config import Config
 from daily_trader_bot.brokers.paper_trading import PaperTradingBroker
 import logging
+import warnings
 
 # Set up minimal logging
 logging.basicConfig(level=logging.WARNING)
 
 
+def _mock_ohlcv(n: int, seed: int = 0, start: str = '2024-01-01'):
+    """Random-walk daily OHLCV data with n rows, reproducible for a given seed."""
+    import pandas as pd
+    import numpy as np
+    
+    rng = np.random.default_rng(seed)
+    prices = 100 + np.cumsum(rng.standard_normal(n) * 2)
+    # All five numeric columns live in one float64 block; Open, High, Low
+    # and Close are fixed multiples of the price
+    values = np.empty((n, 5))
+    np.multiply(prices[:, None], [0.99, 1.01, 0.98, 1.0], out=values[:, :4])
+    values[:, 4] = rng.integers(1000000, 5000000, size=n)
+    data = pd.DataFrame(values, columns=['Open', 'High', 'Low', 'Close', 'Volume'], copy=False)
+    data.insert(0, 'Date', pd.date_range(start, periods=n, freq='D'))
+    return data
+
+
 def test_configuration():
     """Test configuration management."""
     print("Testing Configuration...")
@@ -87,8 +105,26 @@ def test_paper_broker():
     # Check updated position
     positions = broker.get_positions()
     assert positions[0]['quantity'] == 5
+    assert broker.positions == {'AAPL': {'quantity': 5, 'avg_price': 150.0, 'total_cost': 750.0}}
     print(f"  ✓ Position updated: {positions[0]['quantity']} shares remaining")
     
+    # Positions can only be replaced as a whole, not edited in place
+    def add_position():
+        broker.positions['MSFT'] = {'quantity': 1, 'avg_price': 1.0, 'total_cost': 1.0}
+    
+    def close_position():
+        broker.positions['AAPL']['quantity'] = 0
+    
+    for write in (add_position, close_position):
+        try:
+            write()
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("Writing to broker.positions should raise")
+    assert broker.positions['AAPL']['quantity'] == 5
+    print("  ✓ Position views are read-only")
+    
     # Calculate portfolio value
     current_prices = {'AAPL': 155.0}
     portfolio_value = broker.get_portfolio_value(current_prices)
@@ -98,6 +134,18 @@ def test_paper_broker():
     profit = portfolio_value - 10000.0
     print(f"  Profit/Loss: ${profit:,.2f} ({(profit/10000.0)*100:.2f}%)")
     
+    # Placing the same orders as a batch gives the same result
+    batch_broker = PaperTradingBroker(config)
+    batch_broker.connect()
+    batch_orders = batch_broker.place_orders_batch([
+        {'symbol': 'AAPL', 'quantity': 10, 'order_type': 'market', 'side': 'buy', 'price': 150.0},
+        {'symbol': 'AAPL', 'quantity': 5, 'order_type': 'market', 'side': 'sell', 'price': 155.0},
+    ])
+    assert [o['status'] for o in batch_orders] == ['filled', 'filled']
+    assert batch_broker.get_account_balance() == broker.get_account_balance()
+    assert batch_broker.get_positions() == broker.get_positions()
+    print("  ✓ Batched orders match sequential orders")
+    
     broker.disconnect()
     assert not broker.connected
     
@@ -130,6 +178,23 @@ def test_bot_initialization():
     assert 'total_value' in portfolio
     print(f"  ✓ Portfolio status retrieved: ${portfolio['total_value']:,.2f}")
     
+    # A position with no cost basis has a finite P/L percentage
+    class _PriceSource:
+        def get_current_prices(self, symbols):
+            return {symbol: 10.0 for symbol in symbols}
+    
+    bot.broker.load_state({
+        'balance': 1000.0,
+        'positions': {'FREE': {'quantity': 2, 'avg_price': 0.0, 'total_cost': 0.0}}
+    })
+    bot.data_source = _PriceSource()
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        portfolio = bot.get_portfolio_status()
+    assert portfolio['positions'][0]['profit_loss_pct'] == 0.0
+    assert portfolio['total_value'] == 1020.0
+    print("  ✓ Zero-cost positions are valued without a division warning")
+    
     bot.disconnect()
     
     print("✓ Bot initialization tests passed")
@@ -139,22 +204,10 @@ def test_technical_indicators():
     """Test technical indicator calculations."""
     print("\nTesting Technical Indicators...")
     
-    import pandas as pd
-    import numpy as np
     from daily_trader_bot.strategies.daily_trend_strategy import DailyTrendStrategy
     
     # Create mock data
-    dates = pd.date_range('2024-01-01', periods=100, freq='D')
-    prices = 100 + np.cumsum(np.random.randn(100) * 2)
-    
-    data = pd.DataFrame({
-        'Date': dates,
-        'Open': prices * 0.99,
-        'High': prices * 1.01,
-        'Low': prices * 0.98,
-        'Close': prices,
-        'Volume': np.random.randint(1000000, 5000000, size=100)
-    })
+    data = _mock_ohlcv(100)
     
     # Create strategy (without requiring real data source)
     strategy = DailyTrendStrategy(
@@ -179,6 +232,26 @@ def test_technical_indicators():
     print(f"    - Momentum: {indicators['momentum']:.2f}%")
     print(f"    - Volatility: {indicators['volatility']:.2f}%")
     
+    # Wilder RSI is seeded with the mean of the first 14 price changes
+    import numpy as np
+    from daily_trader_bot import indicators as ind
+    close = data['Close'].to_numpy()
+    delta = np.diff(close)
+    gains, losses = np.maximum(delta, 0.0), np.maximum(-delta, 0.0)
+    avg_gain, avg_loss = gains[:14].mean(), losses[:14].mean()
+    expected = [100 - 100 / (1 + avg_gain / avg_loss)]
+    for gain, loss in zip(gains[14:], losses[14:]):
+        avg_gain = (avg_gain * 13 + gain) / 14
+        avg_loss = (avg_loss * 13 + loss) / 14
+        expected.append(100 - 100 / (1 + avg_gain / avg_loss))
+    rsi = ind.wilder_rsi(close, 14)
+    assert np.isnan(rsi[:14]).all()
+    np.testing.assert_allclose(rsi[14:], expected)
+    np.testing.assert_allclose(ind.wilder_rsi_last(close, 14), expected[-1])
+    assert np.isnan(ind.wilder_rsi_last(close[:14], 14))
+    assert indicators['rsi'] == ind.wilder_rsi_last(close, 14)
+    print("  ✓ RSI matches Wilder's definition")
+    
     print("✓ Technical indicator tests passed")
 
 
@@ -195,20 +268,7 @@ def test_price_predictor_structure():
     print("  ✓ Price predictor initialized")
     
     # Create mock data for training
-    import pandas as pd
-    import numpy as np
-    
-    dates = pd.date_range('2023-01-01', periods=200, freq='D')
-    prices = 100 + np.cumsum(np.random.randn(200) * 2)
-    
-    data = pd.DataFrame({
-        'Date': dates,
-        'Open': prices * 0.99,
-        'High': prices * 1.01,
-        'Low': prices * 0.98,
-        'Close': prices,
-        'Volume': np.random.randint(1000000, 5000000, size=200)
-    })
+    data = _mock_ohlcv(200, start='2023-01-01')
     
     # Train model
     results = predictor.train(data)
@@ -228,6 +288,25 @@ def test_price_predictor_structure():
     print(f"    - Predicted: ${prediction['predicted_price']:.2f}")
     print(f"    - Expected change: {prediction['predicted_change_pct']:.2f}%")
     
+    # Batched predictions match single predictions
+    batch = predictor.predict_batch([data, data.iloc[:150], data.iloc[:0]])
+    assert batch[0]['predicted_price'] == prediction['predicted_price']
+    assert batch[1]['predicted_price'] == predictor.predict(data.iloc[:150])['predicted_price']
+    assert isinstance(batch[2], Exception)
+    print("  ✓ Batched predictions match single predictions")
+    
+    # Both Yahoo fetch paths give the same columns, so a model trained on
+    # one can predict from the other; extra input columns are not features
+    from daily_trader_bot.data_sources.yahoo_finance import YahooFinanceDataSource
+    raw = data.set_index('Date')
+    per_symbol = YahooFinanceDataSource._standardize(raw.assign(Dividends=0.0, **{'Stock Splits': 0.0}))
+    batched = YahooFinanceDataSource._standardize(raw.assign(**{'Adj Close': raw['Close']}))
+    assert list(per_symbol.columns) == list(batched.columns) == list(data.columns)
+    path_predictor = PricePredictor(config)
+    path_predictor.train(data.assign(Dividends=0.0))
+    assert path_predictor.predict_batch([batched])[0]['predicted_price'] == path_predictor.predict(per_symbol)['predicted_price']
+    print("  ✓ Models trained on one fetch path predict from the other")
+    
     # Test feature importance
     importance = predictor.get_feature_importance()
     assert len(importance) > 0
@@ -236,6 +315,242 @@ def test_price_predictor_structure():
     print("✓ Price predictor tests passed")
 
 
+class _MockDataSource:
+    """Minimal data source returning a fixed random-walk price history."""
+
+    def __init__(self, n: int = 60, seed: int = 0):
+        self.data = _mock_ohlcv(n, seed)
+
+    def get_historical_data(self, symbol, start_date, end_date, interval='1d'):
+        if symbol == 'BAD':
+            raise ValueError(f"No data available for {symbol}")
+        return self.data
+
+
+def test_batch_signal_generation():
+    """Test that batched signal generation matches the sequential path."""
+    print("\nTesting Batch Signal Generation...")
+    
+    import asyncio
+    import contextlib
+    from daily_trader_bot.ai_providers.base import BaseAIProvider
+    from daily_trader_bot.models.price_predictor import PricePredictor
+    from daily_trader_bot.strategies.daily_trend_strategy import DailyTrendStrategy
+    
+    class EchoAIProvider(BaseAIProvider):
+        """AI provider stub that always agrees with a buy."""
+        
+        def analyze_sentiment(self, text):
+            return {'score': 0.0, 'label': 'neutral', 'confidence': 0.5}
+        
+        def analyze_market_data(self, historical_data, additional_context=None):
+            self.market_calls += 1
+            if self.fail_market_data:
+                raise TimeoutError("request timed out")
+            return {'analysis': additional_context}
+        
+        def generate_trading_signal(self, symbol, historical_data, technical_indicators, news_sentiment=None):
+            return {'action': 'buy', 'confidence': 0.8, 'reasoning': 'stub'}
+        
+        def explain_prediction(self, symbol, prediction, current_price, features):
+            return ''
+        
+        def summarize_market_trends(self, symbols, timeframe='1d'):
+            return ''
+        
+        @contextlib.asynccontextmanager
+        async def async_session(self):
+            # Record the loop each session runs on, like a loop-bound client
+            self.session_loops.append(asyncio.get_running_loop())
+            yield
+    
+    provider = EchoAIProvider({})
+    provider.session_loops = []
+    provider.market_calls = 0
+    provider.fail_market_data = False
+    strategy = DailyTrendStrategy(
+        data_source=_MockDataSource(),
+        ai_provider=provider,
+        price_predictor=None
+    )
+    
+    symbols = ['AAA', 'BAD', 'CCC']
+    results = asyncio.run(strategy.abatch_signals(symbols, max_concurrency=2))
+    
+    assert len(results) == 3
+    assert isinstance(results[1], ValueError)
+    print("  ✓ Failures are reported per symbol")
+    
+    expected = strategy.generate_trading_signal('AAA')
+    for result in (results[0], results[2]):
+        assert result['action'] == expected['action']
+        assert result['confidence'] == expected['confidence']
+        assert result['reasoning'] == expected['reasoning']
+        assert result['analysis']['ai_analysis'] == {'analysis': f"Symbol: {result['symbol']}, Trend Direction: {expected['analysis']['trend_direction']}"}
+    print(f"  ✓ Batched signals match sequential signals ({expected['action'].upper()})")
+    
+    results = strategy.generate_trading_signals_batch(symbols)
+    assert isinstance(results[1], ValueError)
+    for result in (results[0], results[2]):
+        assert result['action'] == expected['action']
+        assert result['confidence'] == expected['confidence']
+        assert result['analysis']['indicators'] == expected['analysis']['indicators']
+    print("  ✓ Vectorized batch signals match sequential signals")
+    
+    analyses = strategy.analyze_trends(symbols)
+    assert list(analyses) == ['AAA', 'BAD', 'CCC']
+    assert isinstance(analyses['BAD'], ValueError)
+    assert analyses['CCC']['indicators'] == strategy.analyze_trend('CCC')['indicators']
+    print("  ✓ Batched trend analysis matches analyze_trend")
+    
+    # Cached analyses share their values; each call gets its own dictionary
+    cached = strategy.analyze_trend('CCC')
+    assert strategy.analyze_trend('CCC')['indicators'] is cached['indicators']
+    cached['trend_direction'] = 'modified'
+    assert strategy.analyze_trend('CCC')['trend_direction'] != 'modified'
+    strategy.clear_cache()
+    assert strategy.analyze_trend('CCC')['indicators'] is not analyses['CCC']['indicators']
+    cached = strategy.analyze_trend('CCC')
+    strategy.data_source.data = strategy.data_source.data.iloc[:-1]
+    assert strategy.analyze_trend('CCC')['indicators'] is not cached['indicators']
+    cached = strategy.analyze_trend('CCC')
+    strategy.price_predictor = PricePredictor({})
+    strategy.price_predictor.version = 1
+    assert strategy.analyze_trend('CCC')['indicators'] is not cached['indicators']
+    strategy.price_predictor = None
+    print("  ✓ Trend analyses are cached until the latest bar or the model changes")
+    
+    strategy.clear_cache()
+    provider.fail_market_data = True
+    assert 'error' in strategy.analyze_trend('CCC')['ai_analysis']
+    provider.fail_market_data = False
+    calls = provider.market_calls
+    assert 'error' not in strategy.analyze_trend('CCC')['ai_analysis']
+    strategy.analyze_trend('CCC')
+    assert provider.market_calls == calls + 1
+    print("  ✓ Failed AI analyses are not cached")
+    
+    # Each bot analysis opens a session on its own event loop, including
+    # when the bot is called from code that is already running a loop
+    bot = TradingBot(Config())
+    bot.strategy = strategy
+    provider.session_loops.clear()
+    assert [s['symbol'] for s in bot.run_analysis(['AAA', 'BAD'])] == ['AAA']
+    bot._signal_cache.clear()
+    
+    async def analyze_in_loop():
+        return bot.run_analysis(['CCC'])
+    
+    assert [s['symbol'] for s in asyncio.run(analyze_in_loop())] == ['CCC']
+    assert len(provider.session_loops) == 2
+    assert provider.session_loops[0] is not provider.session_loops[1]
+    print("  ✓ Bot analyses run on a fresh event loop each time")
+    
+    # Training replaces the model, so cached signals are dropped
+    bot.data_source = strategy.data_source
+    bot.price_predictor = PricePredictor({'n_estimators': 5})
+    strategy.price_predictor = bot.price_predictor
+    strategy.data_source.data = _mock_ohlcv(200)
+    bot._cache_signal('CCC', bot.run_analysis(['CCC'])[0])
+    bot.train_model('CCC')
+    assert bot._cached_signal('CCC') is None
+    strategy.price_predictor = None
+    print("  ✓ Training clears cached signals")
+    
+    # Session results hold their own copy of the broker's positions
+    session = bot.run_trading_session(['CCC'], execute_trades=False)
+    session['portfolio']['positions'].append({'symbol': 'CCC', 'quantity': 1})
+    assert bot.broker.get_positions() == []
+    print("  ✓ Session positions are copies")
+    
+    print("✓ Batch signal generation tests passed")
+
+
+def test_accelerated_paths():
+    """Test that the optional numba and orjson paths match their fallbacks."""
+    print("\nTesting Accelerated Paths...")
+    
+    import json
+    import numpy as np
+    from daily_trader_bot.ai_providers import openai_provider
+    from daily_trader_bot.indicators import _jit
+    from daily_trader_bot.models._features_numba import FEATURE_COLUMNS
+    from daily_trader_bot.models.price_predictor import PricePredictor
+    
+    data = _mock_ohlcv(300)
+    close = data['Close'].to_numpy()
+    
+    # Without numba the kernels run as the plain Python functions (py_func)
+    if _jit.NUMBA_AVAILABLE:
+        np.testing.assert_allclose(_jit.ema_last(close, 10), _jit._ema_last.py_func(close, 10))
+        np.testing.assert_allclose(_jit.wilder_rsi_last(close, 14), _jit._wilder_rsi_last.py_func(close, 14))
+        np.testing.assert_allclose(_jit.macd_last(close), _jit._macd_last.py_func(close, 12, 26, 9))
+        np.testing.assert_allclose(_jit.wilder_rsi(close, 14), _jit._wilder_rsi.py_func(close, 14))
+        print("  ✓ Compiled indicators match the Python kernels")
+    
+    predictor = PricePredictor({})
+    columns = list(FEATURE_COLUMNS)
+    np.testing.assert_allclose(
+        predictor._engineer_features(data)[columns].to_numpy(),
+        predictor._engineer_features_pandas(data)[columns].to_numpy(),
+        rtol=1e-9, atol=1e-9
+    )
+    print("  ✓ Price model features match the pandas implementation")
+    
+    # Prompt payloads encode the same with and without orjson
+    payload = {'rsi': np.float64(55.5), 'trend': 'bullish', 'days': 3}
+    saved, openai_provider.orjson = openai_provider.orjson, None
+    try:
+        fallback = openai_provider._dumps(payload)
+    finally:
+        openai_provider.orjson = saved
+    assert json.loads(fallback) == payload
+    if openai_provider.orjson is not None:
+        assert json.loads(openai_provider._dumps(payload)) == payload
+        print("  ✓ Prompt JSON matches with and without orjson")
+    else:
+        print("  ✓ Prompt JSON encodes without orjson (orjson not installed)")
+    
+    # Saved files round-trip the same with and without orjson
+    import tempfile
+    from datetime import datetime
+    from daily_trader_bot.utils import _json
+    from daily_trader_bot.utils.data_store import DataStore
+    state = {
+        'cash_balance': np.float64(1234.5),
+        'positions': [{'symbol': 'AAPL', 'quantity': 5, 'profit_loss_pct': float('nan')}],
+        'returns': np.array([1.5, np.inf]),
+    }
+    entry = {'date': datetime(2024, 1, 2, 16, 0), 'portfolio_value': 1234.5}
+    modes = (True, False) if _json.orjson is not None else (False,)
+    loaded = []
+    for use_orjson in modes:
+        saved, _json.orjson = _json.orjson, (_json.orjson if use_orjson else None)
+        try:
+            with tempfile.TemporaryDirectory() as data_dir:
+                store = DataStore(data_dir)
+                store.save_portfolio_state(dict(state))
+                store.append_trading_history(dict(entry))
+                loaded.append((store.load_portfolio_state(), store.get_trading_history()))
+        finally:
+            _json.orjson = saved
+    for portfolio, history in loaded:
+        assert portfolio['cash_balance'] == 1234.5
+        # Non-finite values are saved as null, which both parsers accept
+        assert portfolio['positions'] == [{'symbol': 'AAPL', 'quantity': 5, 'profit_loss_pct': None}]
+        assert portfolio['returns'] == [1.5, None]
+        assert history[0]['date'] == '2024-01-02T16:00:00'
+    def reject_constant(name):
+        raise ValueError(f"non-standard JSON constant {name}")
+    assert json.loads(_json.dumps(state), parse_constant=reject_constant)['returns'] == [1.5, None]
+    if len(modes) == 2:
+        print("  ✓ Data files round-trip with and without orjson")
+    else:
+        print("  ✓ Data files round-trip without orjson (orjson not installed)")
+    
+    print("✓ Accelerated path tests passed")
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -249,6 +564,8 @@ def main():
         test_bot_initialization()
         test_technical_indicators()
         test_price_predictor_structure()
+        test_batch_signal_generation()
+        test_accelerated_paths()
         
         print()
         print("=" * 60)
@@ -6,12 +6,14 @@ Test script for the daily status report feature.
 import os
 import sys
 import json
+import tempfile
 from datetime import datetime
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from generate_daily_status import DailyStatusReporter
+from daily_trader_bot.utils.data_store import DataStore
 
 
 def test_report_generation():
@@ -20,6 +22,8 @@ def test_report_generation():
     
     # Create reporter
     reporter = DailyStatusReporter()
+    digest_file = reporter.data_store.report_digest_file
+    digest_state = os.stat(digest_file).st_mtime_ns if os.path.exists(digest_file) else None
     
     # Generate report
     report = reporter.generate_report()
@@ -49,6 +53,24 @@ def test_report_generation():
     assert saved_content == report, "Saved content should match generated report"
     print("  ✓ Report content verified")
     
+    # Section digests are only recorded when passed to save_report
+    current_state = os.stat(digest_file).st_mtime_ns if os.path.exists(digest_file) else None
+    assert current_state == digest_state, "Report digests should not be saved without digests"
+    report, digests = reporter.build_report()
+    assert set(digests) == {'overview', 'benchmarks', 'positions'}, "Each section should have a digest"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        scratch = DailyStatusReporter()
+        scratch.data_store = DataStore(tmp_dir)
+        scratch.save_report(report, digests=digests)
+        assert scratch.data_store.load_report_digests() == digests, \
+            "Saved digests should match the report's"
+    print("  ✓ Report digests saved with the report file only")
+    
+    # Unchanged portfolio files are not parsed again
+    assert reporter._portfolio_inputs() is reporter._portfolio_inputs(), \
+        "Portfolio inputs should be reused while the files are unchanged"
+    print("  ✓ Portfolio inputs cached")
+    
     return True
 
 